@@ -33,6 +33,55 @@
         mp_raise_ValueError(#value " is out of range"); \
     }
 
+STATIC bool poll_iface(mp_uint_t i, mp_obj_t *entry) {
+    const mp_uint_t iface = i & 0x00FF;
+    const mp_uint_t mode = i & 0xFF00;
+
+    if (iface == TOUCH_IFACE) {
+        const uint32_t evt = touch_read();
+        if (evt) {
+            mp_obj_tuple_t *tuple = MP_OBJ_TO_PTR(mp_obj_new_tuple(3, NULL));
+            tuple->items[0] = MP_OBJ_NEW_SMALL_INT((evt >> 24) & 0xFFU); // event type
+            tuple->items[1] = MP_OBJ_NEW_SMALL_INT((evt >> 12) & 0xFFFU); // x position
+            tuple->items[2] = MP_OBJ_NEW_SMALL_INT(evt & 0xFFFU); // y position
+            entry[0] = MP_OBJ_NEW_SMALL_INT(i);
+            entry[1] = MP_OBJ_FROM_PTR(tuple);
+            return true;
+        }
+    } else
+    if (mode == POLL_READ) {
+        if (sectrue == usb_hid_can_read(iface)) {
+            uint8_t buf[64];
+            int len = usb_hid_read(iface, buf, sizeof(buf));
+            if (len > 0) {
+                entry[0] = MP_OBJ_NEW_SMALL_INT(i);
+                entry[1] = mp_obj_new_bytes(buf, len);
+                return true;
+            }
+        } else if (sectrue == usb_webusb_can_read(iface)) {
+            uint8_t buf[64];
+            int len = usb_webusb_read(iface, buf, sizeof(buf));
+            if (len > 0) {
+                entry[0] = MP_OBJ_NEW_SMALL_INT(i);
+                entry[1] = mp_obj_new_bytes(buf, len);
+                return true;
+            }
+        }
+    } else
+    if (mode == POLL_WRITE) {
+        if (sectrue == usb_hid_can_write(iface)) {
+            entry[0] = MP_OBJ_NEW_SMALL_INT(i);
+            entry[1] = mp_const_none;
+            return true;
+        } else if (sectrue == usb_webusb_can_write(iface)) {
+            entry[0] = MP_OBJ_NEW_SMALL_INT(i);
+            entry[1] = mp_const_none;
+            return true;
+        }
+    }
+    return false;
+}
+
 /// def poll(ifaces: Iterable[int], list_ref: List, timeout_us: int) -> bool:
 ///     '''
 ///     Wait until one of `ifaces` is ready to read or write (using masks
@@ -59,51 +108,8 @@ STATIC mp_obj_t mod_trezorio_poll(mp_obj_t ifaces, mp_obj_t list_ref, mp_obj_t t
         mp_obj_t iter = mp_getiter(ifaces, &iterbuf);
         mp_obj_t item;
         while ((item = mp_iternext(iter)) != MP_OBJ_STOP_ITERATION) {
-            const mp_uint_t i = trezor_obj_get_uint(item);
-            const mp_uint_t iface = i & 0x00FF;
-            const mp_uint_t mode = i & 0xFF00;
-
-            if (iface == TOUCH_IFACE) {
-                const uint32_t evt = touch_read();
-                if (evt) {
-                    mp_obj_tuple_t *tuple = MP_OBJ_TO_PTR(mp_obj_new_tuple(3, NULL));
-                    tuple->items[0] = MP_OBJ_NEW_SMALL_INT((evt >> 24) & 0xFFU); // event type
-                    tuple->items[1] = MP_OBJ_NEW_SMALL_INT((evt >> 12) & 0xFFFU); // x position
-                    tuple->items[2] = MP_OBJ_NEW_SMALL_INT(evt & 0xFFFU); // y position
-                    ret->items[0] = MP_OBJ_NEW_SMALL_INT(i);
-                    ret->items[1] = MP_OBJ_FROM_PTR(tuple);
-                    return mp_const_true;
-                }
-            } else
-            if (mode == POLL_READ) {
-                if (sectrue == usb_hid_can_read(iface)) {
-                    uint8_t buf[64];
-                    int len = usb_hid_read(iface, buf, sizeof(buf));
-                    if (len > 0) {
-                        ret->items[0] = MP_OBJ_NEW_SMALL_INT(i);
-                        ret->items[1] = mp_obj_new_bytes(buf, len);
-                        return mp_const_true;
-                    }
-                } else if (sectrue == usb_webusb_can_read(iface)) {
-                    uint8_t buf[64];
-                    int len = usb_webusb_read(iface, buf, sizeof(buf));
-                    if (len > 0) {
-                        ret->items[0] = MP_OBJ_NEW_SMALL_INT(i);
-                        ret->items[1] = mp_obj_new_bytes(buf, len);
-                        return mp_const_true;
-                    }
-                }
-            } else
-            if (mode == POLL_WRITE) {
-                if (sectrue == usb_hid_can_write(iface)) {
-                    ret->items[0] = MP_OBJ_NEW_SMALL_INT(i);
-                    ret->items[1] = mp_const_none;
-                    return mp_const_true;
-                } else if (sectrue == usb_webusb_can_write(iface)) {
-                    ret->items[0] = MP_OBJ_NEW_SMALL_INT(i);
-                    ret->items[1] = mp_const_none;
-                    return mp_const_true;
-                }
+            if (poll_iface(trezor_obj_get_uint(item), ret->items)) {
+                return mp_const_true;
             }
         }
 
@@ -117,3 +123,57 @@ STATIC mp_obj_t mod_trezorio_poll(mp_obj_t ifaces, mp_obj_t list_ref, mp_obj_t t
     return mp_const_false;
 }
 STATIC MP_DEFINE_CONST_FUN_OBJ_3(mod_trezorio_poll_obj, mod_trezorio_poll);
+
+/// def poll_batch(ifaces: Iterable[int], list_ref: List, timeout_us: int) -> int:
+///     '''
+///     Wait until one of `ifaces` is ready to read or write, same as `poll`,
+///     but assign every pending event into `list_ref`, at most
+///     `len(list_ref) // 2` events in total.  All reports received on a USB
+///     interface are returned, in order, one event per report, other
+///     interfaces report at most one event:
+///
+///     `list_ref[2 * n]`     - the interface of the n-th event, including the mask
+///     `list_ref[2 * n + 1]` - the value of the n-th event, see `poll`
+///
+///     Returns the number of events, 0 if timeout occurs.
+///     '''
+STATIC mp_obj_t mod_trezorio_poll_batch(mp_obj_t ifaces, mp_obj_t list_ref, mp_obj_t timeout_us) {
+    mp_obj_list_t *ret = MP_OBJ_TO_PTR(list_ref);
+    if (!MP_OBJ_IS_TYPE(list_ref, &mp_type_list) || ret->len < 2) {
+        mp_raise_TypeError("invalid list_ref");
+    }
+
+    const mp_uint_t max_events = ret->len / 2;
+    const mp_uint_t timeout = trezor_obj_get_uint(timeout_us);
+    const mp_uint_t deadline = mp_hal_ticks_us() + timeout;
+    mp_obj_iter_buf_t iterbuf;
+
+    for (;;) {
+        mp_uint_t count = 0;
+        mp_obj_t iter = mp_getiter(ifaces, &iterbuf);
+        mp_obj_t item;
+        while (count < max_events && (item = mp_iternext(iter)) != MP_OBJ_STOP_ITERATION) {
+            const mp_uint_t i = trezor_obj_get_uint(item);
+            // drain the USB interfaces, a touch or write event happens once
+            const bool drain = (i & 0x00FF) != TOUCH_IFACE && (i & 0xFF00) == POLL_READ;
+            while (count < max_events && poll_iface(i, &ret->items[2 * count])) {
+                count++;
+                if (!drain) {
+                    break;
+                }
+            }
+        }
+        if (count > 0) {
+            return MP_OBJ_NEW_SMALL_INT(count);
+        }
+
+        if (mp_hal_ticks_us() >= deadline) {
+            break;
+        } else {
+            MICROPY_EVENT_POLL_HOOK
+        }
+    }
+
+    return MP_OBJ_NEW_SMALL_INT(0);
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_3(mod_trezorio_poll_batch_obj, mod_trezorio_poll_batch);
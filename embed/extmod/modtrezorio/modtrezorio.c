@@ -49,6 +49,7 @@ STATIC const mp_rom_map_elem_t mp_module_trezorio_globals_table[] = {
     { MP_ROM_QSTR(MP_QSTR_WebUSB), MP_ROM_PTR(&mod_trezorio_WebUSB_type) },
 
     { MP_ROM_QSTR(MP_QSTR_poll), MP_ROM_PTR(&mod_trezorio_poll_obj) },
+    { MP_ROM_QSTR(MP_QSTR_poll_batch), MP_ROM_PTR(&mod_trezorio_poll_batch_obj) },
     { MP_ROM_QSTR(MP_QSTR_POLL_READ), MP_OBJ_NEW_SMALL_INT(POLL_READ) },
     { MP_ROM_QSTR(MP_QSTR_POLL_WRITE), MP_OBJ_NEW_SMALL_INT(POLL_WRITE) },
 
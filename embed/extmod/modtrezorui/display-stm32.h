@@ -92,6 +92,7 @@ static struct {
 
 static void display_set_window(uint16_t x0, uint16_t y0, uint16_t x1, uint16_t y1)
 {
+    DISPLAY_DIRTY = 1;
     x0 += BUFFER_OFFSET.x; x1 += BUFFER_OFFSET.x;
     y0 += BUFFER_OFFSET.y; y1 += BUFFER_OFFSET.y;
     uint32_t id = display_identify();
@@ -338,6 +339,7 @@ void display_init(void)
 
 void display_refresh(void)
 {
+    DISPLAY_DIRTY = 0;
     uint32_t id = display_identify();
     if (id && (id != DISPLAY_ID_GC9307)) {
         // synchronize with the panel synchronization signal in order to avoid visual tearing effects
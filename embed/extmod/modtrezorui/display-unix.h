@@ -126,6 +126,7 @@ void display_init(void)
 
 static void display_set_window(uint16_t x0, uint16_t y0, uint16_t x1, uint16_t y1)
 {
+    DISPLAY_DIRTY = 1;
 #ifndef TREZOR_EMULATOR_NOUI
     if (!RENDERER) {
         display_init();
@@ -138,6 +139,7 @@ static void display_set_window(uint16_t x0, uint16_t y0, uint16_t x1, uint16_t y
 
 void display_refresh(void)
 {
+    DISPLAY_DIRTY = 0;
 #ifndef TREZOR_EMULATOR_NOUI
     if (!RENDERER) {
         display_init();
@@ -42,6 +42,7 @@
 
 static int DISPLAY_BACKLIGHT = -1;
 static int DISPLAY_ORIENTATION = -1;
+static int DISPLAY_DIRTY = 0; // frame changed since the last refresh
 
 static struct {
     int x, y;
@@ -676,6 +677,11 @@ int display_orientation(int degrees)
     return DISPLAY_ORIENTATION;
 }
 
+int display_dirty(void)
+{
+    return DISPLAY_DIRTY;
+}
+
 int display_backlight(int val)
 {
 #if TREZOR_MODEL == 1
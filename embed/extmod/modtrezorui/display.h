@@ -67,6 +67,7 @@
 
 void display_init(void);
 void display_refresh(void);
+int display_dirty(void);
 void display_save(const char *prefix);
 
 // provided by common
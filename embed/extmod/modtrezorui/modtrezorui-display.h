@@ -60,6 +60,15 @@ STATIC mp_obj_t mod_trezorui_Display_refresh(mp_obj_t self) {
 }
 STATIC MP_DEFINE_CONST_FUN_OBJ_1(mod_trezorui_Display_refresh_obj, mod_trezorui_Display_refresh);
 
+/// def dirty(self) -> bool:
+///     '''
+///     Returns True if anything was drawn since the last refresh.
+///     '''
+STATIC mp_obj_t mod_trezorui_Display_dirty(mp_obj_t self) {
+    return mp_obj_new_bool(display_dirty());
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_1(mod_trezorui_Display_dirty_obj, mod_trezorui_Display_dirty);
+
 /// def bar(self, x: int, y: int, w: int, h: int, color: int) -> None:
 ///     '''
 ///     Renders a bar at position (x,y = upper left corner) with width w and height h of color color.
@@ -433,6 +442,7 @@ STATIC MP_DEFINE_CONST_FUN_OBJ_2(mod_trezorui_Display_save_obj, mod_trezorui_Dis
 STATIC const mp_rom_map_elem_t mod_trezorui_Display_locals_dict_table[] = {
     { MP_ROM_QSTR(MP_QSTR_clear), MP_ROM_PTR(&mod_trezorui_Display_clear_obj) },
     { MP_ROM_QSTR(MP_QSTR_refresh), MP_ROM_PTR(&mod_trezorui_Display_refresh_obj) },
+    { MP_ROM_QSTR(MP_QSTR_dirty), MP_ROM_PTR(&mod_trezorui_Display_dirty_obj) },
     { MP_ROM_QSTR(MP_QSTR_bar), MP_ROM_PTR(&mod_trezorui_Display_bar_obj) },
     { MP_ROM_QSTR(MP_QSTR_bar_radius), MP_ROM_PTR(&mod_trezorui_Display_bar_radius_obj) },
     { MP_ROM_QSTR(MP_QSTR_image), MP_ROM_PTR(&mod_trezorui_Display_image_obj) },
@@ -17,6 +17,7 @@
  * along with this program.  If not, see <http://www.gnu.org/licenses/>.
  */
 
+#include "py/gc.h"
 #include "py/runtime.h"
 
 #include "version.h"
@@ -115,6 +116,22 @@ STATIC mp_obj_t mod_trezorutils_set_mode_unprivileged(void) {
 }
 STATIC MP_DEFINE_CONST_FUN_OBJ_0(mod_trezorutils_set_mode_unprivileged_obj, mod_trezorutils_set_mode_unprivileged);
 
+/// def gc_info() -> Tuple[int, int]:
+///     '''
+///     Returns the number of free bytes of the heap, and the size of its
+///     largest free block in bytes.
+///     '''
+STATIC mp_obj_t mod_trezorutils_gc_info(void) {
+    gc_info_t info;
+    gc_info(&info);
+    mp_obj_t tuple[2] = {
+        mp_obj_new_int_from_uint(info.free),
+        mp_obj_new_int_from_uint(info.max_free * MICROPY_BYTES_PER_GC_BLOCK),
+    };
+    return mp_obj_new_tuple(2, tuple);
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_0(mod_trezorutils_gc_info_obj, mod_trezorutils_gc_info);
+
 #define PASTER(s) MP_QSTR_ ## s
 #define MP_QSTR(s) PASTER(s)
 
@@ -124,6 +141,7 @@ STATIC const mp_rom_map_elem_t mp_module_trezorutils_globals_table[] = {
     { MP_ROM_QSTR(MP_QSTR_memcpy), MP_ROM_PTR(&mod_trezorutils_memcpy_obj) },
     { MP_ROM_QSTR(MP_QSTR_halt), MP_ROM_PTR(&mod_trezorutils_halt_obj) },
     { MP_ROM_QSTR(MP_QSTR_set_mode_unprivileged), MP_ROM_PTR(&mod_trezorutils_set_mode_unprivileged_obj) },
+    { MP_ROM_QSTR(MP_QSTR_gc_info), MP_ROM_PTR(&mod_trezorutils_gc_info_obj) },
     // various built-in constants
     { MP_ROM_QSTR(MP_QSTR_GITREV), MP_ROM_QSTR(MP_QSTR(GITREV)) },
     { MP_ROM_QSTR(MP_QSTR_VERSION_MAJOR), MP_OBJ_NEW_SMALL_INT(VERSION_MAJOR) },
@@ -70,7 +70,11 @@
 #ifndef MICROPY_OPT_CACHE_MAP_LOOKUP_IN_BYTECODE
 #define MICROPY_OPT_CACHE_MAP_LOOKUP_IN_BYTECODE (1)
 #endif
+#ifdef TREZOR_IMPORTPROF
+#define MICROPY_CAN_OVERRIDE_BUILTINS (1)  // used by src/trezor/importprof.py
+#else
 #define MICROPY_CAN_OVERRIDE_BUILTINS (0)
+#endif
 #define MICROPY_PY_FUNCTION_ATTRS   (1)
 #define MICROPY_PY_DESCRIPTORS      (1)
 #define MICROPY_PY_BUILTINS_STR_UNICODE (1)
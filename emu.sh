@@ -28,6 +28,17 @@ case "$1" in
             kill $UPY_PID
         done
         ;;
+    "-t")
+        shift
+        # run in virtual time, timeouts and animations take no real time
+        ../$EXE $ARGS $* -c "from trezor import loop; loop.set_virtual_time(True); import main"
+        ;;
+    "-i")
+        shift
+        # profile the imports of the boot and of every workflow, with PYOPT=0
+        # and a unix port built with make build_unix_importprof
+        ../$EXE $ARGS $* -c "from trezor import importprof; importprof.enable(); import main"
+        ;;
     "-p")
         shift
         ../$EXE $ARGS $* $MAIN &
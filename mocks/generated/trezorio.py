@@ -68,6 +68,19 @@ def poll(ifaces: Iterable[int], list_ref: List, timeout_us: int) -> bool:
     If timeout occurs, False is returned, True otherwise.
     '''
 
+# extmod/modtrezorio/modtrezorio-poll.h
+def poll_batch(ifaces: Iterable[int], list_ref: List, timeout_us: int) -> int:
+    '''
+    Wait until one of `ifaces` is ready to read or write, same as `poll`,
+    but assign every pending event into `list_ref`, at most
+    `len(list_ref) // 2` events in total.  All reports received on a USB
+    interface are returned, in order, one event per report, other
+    interfaces report at most one event:
+    `list_ref[2 * n]`     - the interface of the n-th event, including the mask
+    `list_ref[2 * n + 1]` - the value of the n-th event, see `poll`
+    Returns the number of events, 0 if timeout occurs.
+    '''
+
 # extmod/modtrezorio/modtrezorio-sbu.h
 class SBU:
     '''
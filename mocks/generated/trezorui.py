@@ -21,6 +21,11 @@ class Display:
         Refresh display (update screen).
         '''
 
+    def dirty(self) -> bool:
+        '''
+        Returns True if anything was drawn since the last refresh.
+        '''
+
     def bar(self, x: int, y: int, w: int, h: int, color: int) -> None:
         '''
         Renders a bar at position (x,y = upper left corner) with width w and height h of color color.
@@ -31,6 +31,13 @@ def set_mode_unprivileged() -> None:
     Set unprivileged mode.
     '''
 
+# extmod/modtrezorutils/modtrezorutils.c
+def gc_info() -> Tuple[int, int]:
+    '''
+    Returns the number of free bytes of the heap, and the size of its
+    largest free block in bytes.
+    '''
+
 # extmod/modtrezorutils/modtrezorutils.c
 def symbol(name: str) -> str/int/None:
     '''
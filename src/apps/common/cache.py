@@ -4,6 +4,8 @@ from apps.common import storage
 
 _cached_seed = None
 _cached_passphrase = None
+_cached_seed_without_passphrase = None
+_cached_u2f_root = None  # nist256p1 node at m/U2F', see apps.fido_u2f
 
 
 def get_state(prev_state: bytes = None, passphrase: str = None) -> bytes:
@@ -32,6 +34,14 @@ def get_seed():
     return _cached_seed
 
 
+def get_seed_without_passphrase():
+    return _cached_seed_without_passphrase
+
+
+def get_u2f_root():
+    return _cached_u2f_root
+
+
 def get_passphrase():
     return _cached_passphrase
 
@@ -45,6 +55,16 @@ def set_seed(seed):
     _cached_seed = seed
 
 
+def set_seed_without_passphrase(seed):
+    global _cached_seed_without_passphrase
+    _cached_seed_without_passphrase = seed
+
+
+def set_u2f_root(node):
+    global _cached_u2f_root
+    _cached_u2f_root = node
+
+
 def set_passphrase(passphrase):
     global _cached_passphrase
     _cached_passphrase = passphrase
@@ -52,6 +72,8 @@ def set_passphrase(passphrase):
 
 def clear(skip_passphrase: bool = False):
     set_seed(None)
+    set_seed_without_passphrase(None)
+    set_u2f_root(None)
     if skip_passphrase:
         set_passphrase("")
     else:
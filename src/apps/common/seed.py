@@ -39,7 +39,10 @@ def derive_node_without_passphrase(
     if not storage.is_initialized():
         raise Exception("Device is not initialized")
 
-    seed = bip39.seed(storage.get_mnemonic(), "")
+    seed = cache.get_seed_without_passphrase()
+    if seed is None:
+        seed = bip39.seed(storage.get_mnemonic(), "")
+        cache.set_seed_without_passphrase(seed)
     node = bip32.from_seed(seed, curve_name)
     node.derive_path(path)
     return node
@@ -4,12 +4,19 @@ if not __debug__:
     halt("debug mode inactive")
 
 if __debug__:
-    from trezor import loop
+    import gc
+    from trezor import gcpolicy, loop, messages
     from trezor.messages import MessageType
     from trezor.messages.DebugLinkState import DebugLinkState
     from trezor.ui import confirm, swipe
     from trezor.wire import register, protobuf_workflow
     from apps.common import storage
+    from apps.debug.messages import (
+        DebugLinkGetProfile,
+        DebugLinkProfile,
+        DebugLinkTaskProfile,
+        DebugLinkWorkflowProfile,
+    )
 
     reset_internal_entropy = None
     reset_current_words = None
@@ -37,6 +44,49 @@ if __debug__:
             m.reset_word = " ".join(reset_current_words)
         return m
 
+    async def dispatch_DebugLinkGetProfile(ctx, msg):
+        m = DebugLinkProfile()
+        m.enabled = loop.profiling
+        for stats in loop.profile_stats.values():
+            t = DebugLinkTaskProfile()
+            t.name = stats[loop.PROF_NAME]
+            t.steps = stats[loop.PROF_STEPS]
+            t.total_us = stats[loop.PROF_TOTAL_US]
+            t.max_us = stats[loop.PROF_MAX_US]
+            t.sleeps = stats[loop.PROF_SLEEP]
+            t.waits = stats[loop.PROF_WAIT]
+            t.signals = stats[loop.PROF_SIGNAL]
+            t.spawns = stats[loop.PROF_SPAWN]
+            t.alloc = stats[loop.PROF_ALLOC]
+            t.max_alloc = stats[loop.PROF_MAX_ALLOC]
+            t.gc_runs = stats[loop.PROF_GC_RUNS]
+            m.tasks.append(t)
+        for stats in loop.profile_workflows.values():
+            w = DebugLinkWorkflowProfile()
+            w.name = stats[loop.PROF_NAME]
+            w.runs = stats[loop.PROF_RUNS]
+            w.alloc = stats[loop.PROF_ALLOC]
+            w.max_alloc = stats[loop.PROF_MAX_ALLOC]
+            w.gc_runs = stats[loop.PROF_GC_RUNS]
+            m.workflows.append(w)
+        m.heap_alloc = gc.mem_alloc()
+        m.heap_free = gc.mem_free()
+        if loop.profile_min_free >= 0:
+            m.heap_min_free = loop.profile_min_free
+        m.queue_size = loop.queue_size
+        m.queue_high_water = loop.queue_high_water
+        m.queue_blocked = loop.queue_blocked
+        m.gc_collections = gcpolicy.collections
+        m.gc_pause_us = gcpolicy.pause_us
+        m.gc_max_pause_us = gcpolicy.max_pause_us
+        m.heap_fragmentation = gcpolicy.fragmentation
+        if msg.reset:
+            loop.profile_reset()
+            gcpolicy.reset()
+        if msg.enable is not None:
+            loop.profile_enable(msg.enable)
+        return m
+
     def boot():
         # wipe storage when debug build is used
         storage.wipe()
@@ -47,3 +97,6 @@ if __debug__:
         register(
             MessageType.DebugLinkGetState, protobuf_workflow, dispatch_DebugLinkGetState
         )
+        messages.register(DebugLinkGetProfile)
+        messages.register(DebugLinkProfile)
+        register(DebugLinkGetProfile, protobuf_workflow, dispatch_DebugLinkGetProfile)
@@ -0,0 +1,144 @@
+"""
+Debug link message types that are specific to the firmware internals and are
+therefore not part of the common protobuf definitions.  They are registered
+at runtime with `trezor.messages.register`, see `apps.debug.boot`.
+"""
+
+import protobuf as p
+
+if __debug__:
+    try:
+        from typing import List
+    except ImportError:
+        List = None  # type: ignore
+
+
+class DebugLinkGetProfile(p.MessageType):
+    MESSAGE_WIRE_TYPE = 9100
+    FIELDS = (
+        None,
+        ("enable", p.TYPE_BOOL, 0),  # 1
+        ("reset", p.TYPE_BOOL, 0),  # 2
+    )
+
+    def __init__(self, enable: bool = None, reset: bool = None) -> None:
+        self.enable = enable
+        self.reset = reset
+
+
+class DebugLinkTaskProfile(p.MessageType):
+    FIELDS = (
+        None,
+        ("name", p.TYPE_UNICODE, 0),  # 1
+        ("steps", p.TYPE_UVARINT, 0),  # 2
+        ("total_us", p.TYPE_UVARINT, 0),  # 3
+        ("max_us", p.TYPE_UVARINT, 0),  # 4
+        ("sleeps", p.TYPE_UVARINT, 0),  # 5
+        ("waits", p.TYPE_UVARINT, 0),  # 6
+        ("signals", p.TYPE_UVARINT, 0),  # 7
+        ("spawns", p.TYPE_UVARINT, 0),  # 8
+        ("alloc", p.TYPE_UVARINT, 0),  # 9
+        ("max_alloc", p.TYPE_UVARINT, 0),  # 10
+        ("gc_runs", p.TYPE_UVARINT, 0),  # 11
+    )
+
+    def __init__(
+        self,
+        name: str = None,
+        steps: int = None,
+        total_us: int = None,
+        max_us: int = None,
+        sleeps: int = None,
+        waits: int = None,
+        signals: int = None,
+        spawns: int = None,
+        alloc: int = None,
+        max_alloc: int = None,
+        gc_runs: int = None,
+    ) -> None:
+        self.name = name
+        self.steps = steps
+        self.total_us = total_us
+        self.max_us = max_us
+        self.sleeps = sleeps
+        self.waits = waits
+        self.signals = signals
+        self.spawns = spawns
+        self.alloc = alloc
+        self.max_alloc = max_alloc
+        self.gc_runs = gc_runs
+
+
+class DebugLinkWorkflowProfile(p.MessageType):
+    FIELDS = (
+        None,
+        ("name", p.TYPE_UNICODE, 0),  # 1
+        ("runs", p.TYPE_UVARINT, 0),  # 2
+        ("alloc", p.TYPE_UVARINT, 0),  # 3
+        ("max_alloc", p.TYPE_UVARINT, 0),  # 4
+        ("gc_runs", p.TYPE_UVARINT, 0),  # 5
+    )
+
+    def __init__(
+        self,
+        name: str = None,
+        runs: int = None,
+        alloc: int = None,
+        max_alloc: int = None,
+        gc_runs: int = None,
+    ) -> None:
+        self.name = name
+        self.runs = runs
+        self.alloc = alloc
+        self.max_alloc = max_alloc
+        self.gc_runs = gc_runs
+
+
+class DebugLinkProfile(p.MessageType):
+    MESSAGE_WIRE_TYPE = 9101
+    FIELDS = (
+        None,
+        ("enabled", p.TYPE_BOOL, 0),  # 1
+        ("tasks", DebugLinkTaskProfile, p.FLAG_REPEATED),  # 2
+        ("queue_size", p.TYPE_UVARINT, 0),  # 3
+        ("queue_high_water", p.TYPE_UVARINT, 0),  # 4
+        ("queue_blocked", p.TYPE_UVARINT, 0),  # 5
+        ("workflows", DebugLinkWorkflowProfile, p.FLAG_REPEATED),  # 6
+        ("heap_alloc", p.TYPE_UVARINT, 0),  # 7
+        ("heap_free", p.TYPE_UVARINT, 0),  # 8
+        ("heap_min_free", p.TYPE_UVARINT, 0),  # 9
+        ("gc_collections", p.TYPE_UVARINT, 0),  # 10
+        ("gc_pause_us", p.TYPE_UVARINT, 0),  # 11
+        ("gc_max_pause_us", p.TYPE_UVARINT, 0),  # 12
+        ("heap_fragmentation", p.TYPE_UVARINT, 0),  # 13
+    )
+
+    def __init__(
+        self,
+        enabled: bool = None,
+        tasks: List[DebugLinkTaskProfile] = None,
+        queue_size: int = None,
+        queue_high_water: int = None,
+        queue_blocked: int = None,
+        workflows: List[DebugLinkWorkflowProfile] = None,
+        heap_alloc: int = None,
+        heap_free: int = None,
+        heap_min_free: int = None,
+        gc_collections: int = None,
+        gc_pause_us: int = None,
+        gc_max_pause_us: int = None,
+        heap_fragmentation: int = None,
+    ) -> None:
+        self.enabled = enabled
+        self.tasks = tasks if tasks is not None else []
+        self.queue_size = queue_size
+        self.queue_high_water = queue_high_water
+        self.queue_blocked = queue_blocked
+        self.workflows = workflows if workflows is not None else []
+        self.heap_alloc = heap_alloc
+        self.heap_free = heap_free
+        self.heap_min_free = heap_min_free
+        self.gc_collections = gc_collections
+        self.gc_pause_us = gc_pause_us
+        self.gc_max_pause_us = gc_max_pause_us
+        self.heap_fragmentation = heap_fragmentation
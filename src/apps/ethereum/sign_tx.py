@@ -77,9 +77,8 @@ async def sign_tx(ctx, msg):
         sha.extend(rlp.encode(data, False))
 
     while data_left > 0:
-        resp = await send_request_chunk(ctx, data_left)
-        data_left -= len(resp.data_chunk)
-        sha.extend(resp.data_chunk)
+        resp = await send_request_chunk(ctx, data_left, sha.extend)
+        data_left -= resp.data_chunk  # number of bytes hashed
 
     # eip 155 replay protection
     if msg.chain_id:
@@ -116,7 +115,7 @@ def get_total_length(msg: EthereumSignTx, data_total: int) -> int:
     return length
 
 
-async def send_request_chunk(ctx, data_left: int):
+async def send_request_chunk(ctx, data_left: int, sink):
     # TODO: layoutProgress ?
     req = EthereumTxRequest()
     if data_left <= 1024:
@@ -124,7 +123,9 @@ async def send_request_chunk(ctx, data_left: int):
     else:
         req.data_length = 1024
 
-    return await ctx.call(req, EthereumTxAck)
+    # the chunk is fed into `sink` while it is being received
+    await ctx.write(req)
+    return await ctx.read((EthereumTxAck,), {"data_chunk": sink})
 
 
 async def send_signature(ctx, msg: EthereumSignTx, digest):
@@ -309,7 +309,7 @@ async def send_cmd(cmd: Cmd, iface: io.HID) -> None:
 
 
 def boot(iface: io.HID):
-    loop.schedule(handle_reports(iface))
+    loop.schedule(handle_reports(iface), priority=loop.PRIORITY_IO)
 
 
 async def handle_reports(iface: io.HID):
@@ -549,14 +549,11 @@ def msg_register(req: Msg, state: ConfirmState) -> Cmd:
 
 def msg_register_sign(challenge: bytes, app_id: bytes) -> bytes:
 
-    from apps.common import seed
-
     # derivation path is m/U2F'/r'/r'/r'/r'/r'/r'/r'/r'
     keypath = [HARDENED | random.uniform(0xf0000000) for _ in range(0, 8)]
-    nodepath = [_U2F_KEY_PATH] + keypath
 
     # prepare signing key from random path, compute decompressed public key
-    node = seed.derive_node_without_passphrase(nodepath, "nist256p1")
+    node = derive_node(keypath)
     pubkey = nist256p1.publickey(node.private_key(), False)
 
     # first half of keyhandle is keypath
@@ -666,8 +663,6 @@ def msg_authenticate(req: Msg, state: ConfirmState) -> Cmd:
 
 
 def msg_authenticate_genkey(app_id: bytes, keyhandle: bytes, pathformat: str):
-    from apps.common import seed
-
     # unpack the keypath from the first half of keyhandle
     keybuf = keyhandle[:32]
     keypath = ustruct.unpack(pathformat, keybuf)
@@ -680,8 +675,7 @@ def msg_authenticate_genkey(app_id: bytes, keyhandle: bytes, pathformat: str):
             return None
 
     # derive the signing key
-    nodepath = [_U2F_KEY_PATH] + list(keypath)
-    node = seed.derive_node_without_passphrase(nodepath, "nist256p1")
+    node = derive_node(list(keypath))
 
     # second half of keyhandle is a hmac of app_id and keypath
     keybase = hmac.Hmac(node.private_key(), app_id, hashlib.sha256)
@@ -697,6 +691,20 @@ def msg_authenticate_genkey(app_id: bytes, keyhandle: bytes, pathformat: str):
     return node
 
 
+def derive_node(keypath):
+    from apps.common import cache, seed
+
+    # the root node m/U2F' is cached for the session, so the seed does not
+    # have to be computed and derived again for every request
+    root = cache.get_u2f_root()
+    if root is None:
+        root = seed.derive_node_without_passphrase([_U2F_KEY_PATH], "nist256p1")
+        cache.set_u2f_root(root)
+    node = root.clone()
+    node.derive_path(keypath)
+    return node
+
+
 def msg_authenticate_sign(challenge: bytes, app_id: bytes, privkey: bytes) -> bytes:
     flags = bytes([_AUTH_FLAG_TUP])
 
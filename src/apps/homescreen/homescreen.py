@@ -1,4 +1,4 @@
-from trezor import config, res, ui
+from trezor import config, res, ui, utils
 from trezor.ui.swipe import Swipe, degrees
 
 from apps.common import storage
@@ -8,6 +8,9 @@ async def homescreen():
     while True:
         await ui.backlight_slide(ui.BACKLIGHT_DIM)
         display_homescreen()
+        if __debug__ and utils.boot_times and utils.boot_times[-1][0] == "usb ready":
+            # drawn for the first time since boot, see main.py
+            utils.boot_stage("homescreen")
         await ui.backlight_slide(ui.BACKLIGHT_NORMAL)
         await swipe_to_rotate()
 
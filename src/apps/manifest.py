@@ -0,0 +1,45 @@
+# Automatically generated by gen_app_manifest.py
+# fmt: off
+workflows = {  # wire type -> (package, module), see wire.add()
+    307: ("apps.cardano", "get_address"),  # CardanoGetAddress
+    305: ("apps.cardano", "get_public_key"),  # CardanoGetPublicKey
+    303: ("apps.cardano", "sign_tx"),  # CardanoSignTx
+    56: ("apps.ethereum", "get_address"),  # EthereumGetAddress
+    58: ("apps.ethereum", "sign_tx"),  # EthereumSignTx
+    64: ("apps.ethereum", "sign_message"),  # EthereumSignMessage
+    65: ("apps.ethereum", "verify_message"),  # EthereumVerifyMessage
+    121: ("apps.lisk", "get_public_key"),  # LiskGetPublicKey
+    114: ("apps.lisk", "get_address"),  # LiskGetAddress
+    118: ("apps.lisk", "sign_message"),  # LiskSignMessage
+    120: ("apps.lisk", "verify_message"),  # LiskVerifyMessage
+    116: ("apps.lisk", "sign_tx"),  # LiskSignTx
+    14: ("apps.management", "reset_device"),  # ResetDevice
+    34: ("apps.management", "backup_device"),  # BackupDevice
+    5: ("apps.management", "wipe_device"),  # WipeDevice
+    45: ("apps.management", "recovery_device"),  # RecoveryDevice
+    25: ("apps.management", "apply_settings"),  # ApplySettings
+    28: ("apps.management", "apply_flags"),  # ApplyFlags
+    4: ("apps.management", "change_pin"),  # ChangePin
+    63: ("apps.management", "set_u2f_counter"),  # SetU2FCounter
+    67: ("apps.nem", "get_address"),  # NEMGetAddress
+    69: ("apps.nem", "sign_tx"),  # NEMSignTx
+    400: ("apps.ripple", "get_address"),  # RippleGetAddress
+    402: ("apps.ripple", "sign_tx"),  # RippleSignTx
+    207: ("apps.stellar", "get_address"),  # StellarGetAddress
+    202: ("apps.stellar", "sign_tx"),  # StellarSignTx
+    150: ("apps.tezos", "get_address"),  # TezosGetAddress
+    152: ("apps.tezos", "sign_tx"),  # TezosSignTx
+    154: ("apps.tezos", "get_public_key"),  # TezosGetPublicKey
+    11: ("apps.wallet", "get_public_key"),  # GetPublicKey
+    29: ("apps.wallet", "get_address"),  # GetAddress
+    9: ("apps.wallet", "get_entropy"),  # GetEntropy
+    15: ("apps.wallet", "sign_tx"),  # SignTx
+    38: ("apps.wallet", "sign_message"),  # SignMessage
+    39: ("apps.wallet", "verify_message"),  # VerifyMessage
+    53: ("apps.wallet", "sign_identity"),  # SignIdentity
+    61: ("apps.wallet", "get_ecdh_session_key"),  # GetECDHSessionKey
+    23: ("apps.wallet", "cipher_key_value"),  # CipherKeyValue
+}
+
+if __debug__:
+    workflows[13] = ("apps.management", "load_device")  # LoadDevice
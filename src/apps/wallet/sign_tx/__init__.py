@@ -23,6 +23,7 @@ async def sign_tx(ctx, msg):
 
     signer = signing.sign_tx(msg, root)
     res = None
+    ahead = 0  # acks the host sends without waiting for their requests
     while True:
         try:
             req = signer.send(res)
@@ -39,7 +40,14 @@ async def sign_tx(ctx, msg):
         if isinstance(req, TxRequest):
             if req.request_type == TXFINISHED:
                 break
-            res = await ctx.call(req, TxAck)
+            if ahead:
+                # announced by one of the previous requests, the host sent the
+                # ack right after it, and it is already on the way
+                ahead -= 1
+                res = await ctx.read((TxAck,))
+            else:
+                ahead = req.details.prefetch_count or 0
+                res = await ctx.call(req, TxAck)
         elif isinstance(req, UiConfirmOutput):
             res = await layout.confirm_output(ctx, req.output, req.coin)
             progress.report_init()
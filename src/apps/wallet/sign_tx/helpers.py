@@ -1,3 +1,5 @@
+from micropython import const
+
 from trezor.messages import InputScriptType
 from trezor.messages.RequestType import (
     TXEXTRADATA,
@@ -15,6 +17,12 @@ from trezor.messages.TxRequest import TxRequest
 
 from apps.common.coininfo import CoinInfo
 
+# maximum number of acks the host can send ahead of their requests; the host
+# asks for it with SignTx.max_prefetch and the device announces the acks with
+# TxRequestDetailsType.prefetch_count, both extensions of the trezor-common
+# messages, see tools/codegen/gen_compact_messages.py
+_MAX_PREFETCH = const(8)
+
 # Machine instructions
 # ===
 
@@ -64,6 +72,7 @@ def request_tx_meta(tx_req: TxRequest, tx_hash: bytes = None):
     tx_req.request_type = TXMETA
     tx_req.details.tx_hash = tx_hash
     tx_req.details.request_index = None
+    tx_req.details.prefetch_count = None
     ack = yield tx_req
     tx_req.serialized = None
     return sanitize_tx_meta(ack.tx)
@@ -77,24 +86,31 @@ def request_tx_extra_data(
     tx_req.details.extra_data_len = size
     tx_req.details.tx_hash = tx_hash
     tx_req.details.request_index = None
+    tx_req.details.prefetch_count = None
     ack = yield tx_req
     tx_req.serialized = None
     return ack.tx.extra_data
 
 
-def request_tx_input(tx_req: TxRequest, i: int, tx_hash: bytes = None):
+def request_tx_input(
+    tx_req: TxRequest, i: int, tx_hash: bytes = None, prefetch: int = 0
+):
     tx_req.request_type = TXINPUT
     tx_req.details.request_index = i
     tx_req.details.tx_hash = tx_hash
+    tx_req.details.prefetch_count = prefetch or None
     ack = yield tx_req
     tx_req.serialized = None
     return sanitize_tx_input(ack.tx)
 
 
-def request_tx_output(tx_req: TxRequest, i: int, tx_hash: bytes = None):
+def request_tx_output(
+    tx_req: TxRequest, i: int, tx_hash: bytes = None, prefetch: int = 0
+):
     tx_req.request_type = TXOUTPUT
     tx_req.details.request_index = i
     tx_req.details.tx_hash = tx_hash
+    tx_req.details.prefetch_count = prefetch or None
     ack = yield tx_req
     tx_req.serialized = None
     if tx_hash is None:
@@ -122,6 +138,7 @@ def sanitize_sign_tx(tx: SignTx) -> SignTx:
     tx.coin_name = tx.coin_name if tx.coin_name is not None else "Bitcoin"
     tx.expiry = tx.expiry if tx.expiry is not None else 0
     tx.overwintered = tx.overwintered if tx.overwintered is not None else False
+    tx.max_prefetch = min(tx.max_prefetch or 0, _MAX_PREFETCH)
     return tx
 
 
@@ -124,7 +124,7 @@ async def check_tx_fee(tx: SignTx, root: bip32.HDNode):
             else:
                 segwit[i] = False
                 total_in += await get_prevtx_output_value(
-                    coin, tx_req, txi.prev_hash, txi.prev_index
+                    coin, tx_req, txi.prev_hash, txi.prev_index, tx.max_prefetch
                 )
 
         else:
@@ -277,7 +277,9 @@ async def sign_tx(tx: SignTx, root: bip32.HDNode):
 
             for i in range(tx.inputs_count):
                 # STAGE_REQUEST_4_INPUT
-                txi = await request_tx_input(tx_req, i)
+                txi = await request_tx_input(
+                    tx_req, i, None, min(tx.max_prefetch, tx.inputs_count - i - 1)
+                )
                 input_check_wallet_path(txi, wallet_path)
                 write_tx_input_check(h_second, txi)
                 if i == i_sign:
@@ -311,7 +313,9 @@ async def sign_tx(tx: SignTx, root: bip32.HDNode):
 
             for o in range(tx.outputs_count):
                 # STAGE_REQUEST_4_OUTPUT
-                txo = await request_tx_output(tx_req, o)
+                txo = await request_tx_output(
+                    tx_req, o, None, min(tx.max_prefetch, tx.outputs_count - o - 1)
+                )
                 txo_bin.amount = txo.amount
                 txo_bin.script_pubkey = output_derive_script(txo, coin, root)
                 write_tx_output(h_second, txo_bin)
@@ -428,7 +432,11 @@ async def sign_tx(tx: SignTx, root: bip32.HDNode):
 
 
 async def get_prevtx_output_value(
-    coin: CoinInfo, tx_req: TxRequest, prev_hash: bytes, prev_index: int
+    coin: CoinInfo,
+    tx_req: TxRequest,
+    prev_hash: bytes,
+    prev_index: int,
+    prefetch: int = 0,
 ) -> int:
     total_out = 0  # sum of output amounts
 
@@ -447,14 +455,18 @@ async def get_prevtx_output_value(
 
     for i in range(tx.inputs_cnt):
         # STAGE_REQUEST_2_PREV_INPUT
-        txi = await request_tx_input(tx_req, i, prev_hash)
+        txi = await request_tx_input(
+            tx_req, i, prev_hash, min(prefetch, tx.inputs_cnt - i - 1)
+        )
         write_tx_input(txh, txi)
 
     write_varint(txh, tx.outputs_cnt)
 
     for o in range(tx.outputs_cnt):
         # STAGE_REQUEST_2_PREV_OUTPUT
-        txo_bin = await request_tx_output(tx_req, o, prev_hash)
+        txo_bin = await request_tx_output(
+            tx_req, o, prev_hash, min(prefetch, tx.outputs_cnt - o - 1)
+        )
         write_tx_output(txh, txo_bin)
         if o == prev_index:
             total_out += txo_bin.amount
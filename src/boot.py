@@ -23,7 +23,10 @@ async def bootscreen():
 
 
 async def lockscreen():
-    from apps.common import storage
+    from apps.common import cache, storage
+
+    # forget the seeds cached in the session before the device is locked
+    cache.clear()
 
     label = storage.get_label()
     image = storage.get_homescreen()
@@ -1,24 +1,25 @@
 # isort:skip_file
 
+from trezor import utils
+
+if __debug__:
+    utils.boot_stage("main")
+
 # unlock the device
 import boot  # noqa: F401
 
+if __debug__:
+    utils.boot_stage("unlocked")
+
 # prepare the USB interfaces, but do not connect to the host yet
 import usb
 
-from trezor import loop, wire, workflow, utils
+from trezor import loop, wire, workflow
 
-# load applications
+# load applications, the ones in the manifest are imported only once the
+# first of their messages arrives, see tools/codegen/gen_app_manifest.py
 import apps.homescreen
-import apps.management
-import apps.wallet
-import apps.ethereum
-import apps.lisk
-import apps.nem
-import apps.stellar
-import apps.ripple
-import apps.cardano
-import apps.tezos
+from apps.manifest import workflows
 
 if __debug__:
     import apps.debug
@@ -27,15 +28,7 @@ else:
 
 # boot applications
 apps.homescreen.boot()
-apps.management.boot()
-apps.wallet.boot()
-apps.ethereum.boot()
-apps.lisk.boot()
-apps.nem.boot()
-apps.stellar.boot()
-apps.ripple.boot()
-apps.cardano.boot()
-apps.tezos.boot()
+wire.add_manifest(workflows)
 if __debug__:
     apps.debug.boot()
 else:
@@ -47,6 +40,14 @@ if __debug__:
     wire.setup(usb.iface_debug)
 usb.bus.open()
 
+if __debug__:
+    utils.boot_stage("usb ready")
+
+    from trezor import importprof
+
+    if importprof.enabled:
+        importprof.end()
+
 # switch into unprivileged mode, as we don't need the extra permissions anymore
 utils.set_mode_unprivileged()
 
@@ -2,6 +2,14 @@
 Extremely minimal streaming codec for a subset of protobuf.  Supports uint32,
 bytes, string, embedded message and repeated fields.
 
+Message types list their fields in `FIELDS`, a tuple indexed by field tag,
+where every field is a `(name, type, flags)` tuple or None.  Scalar field types
+are given by one of the `TYPE_*` codes, embedded messages by the name of their
+class in `trezor.messages`, which is only imported when such a field is loaded.
+Message types defined outside of `trezor.messages` can give the class itself.
+Message types set all their fields in `__init__`, so every message object has
+the same fixed set of attributes.
+
 For de-serializing (loading) protobuf types, object with `AsyncReader`
 interface is required:
 
@@ -19,11 +27,29 @@ required:
 >>>         """
 >>>         Writes all bytes from `buffer`, or raises `EOFError`.
 >>>         """
+
+Readers can also implement `read_uvarint`, which lets `load_message` decode
+varints straight from the data they have already received:
+
+>>> class AsyncReader:
+>>>     def read_uvarint(self, limit=10):
+>>>         """
+>>>         Decodes a varint of at most `limit` bytes without waiting, or returns
+>>>         None and consumes nothing if that is not possible.  Raises
+>>>         `EOFError` if there is no data left.
+>>>         """
+
+Large bytes fields flagged with `FLAG_STREAMED` can be loaded into a sink
+function in small chunks, see `load_message`.
+
+Alternatively, messages can be encoded synchronously into a buffer of the size
+given by `count_message`, see `encode_message`.
 '''
 
 from micropython import const
 
 _UVARINT_BUFFER = bytearray(1)
+_UVARINT_MAX_LEN = const(10)  # bytes of the longest 64-bit varint
 
 
 async def load_uvarint(reader):
@@ -51,6 +77,26 @@ async def dump_uvarint(writer, n):
         n = shifted
 
 
+def encode_uvarint(buffer, ofs, n):
+    if n < 0:
+        raise ValueError("Cannot dump signed value, convert it to unsigned first.")
+    shifted = True
+    while shifted:
+        shifted = n >> 7
+        buffer[ofs] = (n & 0x7F) | (0x80 if shifted else 0x00)
+        ofs += 1
+        n = shifted
+    return ofs
+
+
+def count_uvarint(n):
+    nbytes = 1
+    while n > 0x7F:
+        n >>= 7
+        nbytes += 1
+    return nbytes
+
+
 # protobuf interleaved signed encoding:
 # https://developers.google.com/protocol-buffers/docs/encoding#structure
 # the idea is to save the sign in LSbit instead of twos-complement.
@@ -86,32 +132,31 @@ def uint_to_sint(uint):
     return res
 
 
-class UVarintType:
-    WIRE_TYPE = 0
-
+TYPE_UVARINT = const(0)
+TYPE_SVARINT = const(1)
+TYPE_BOOL = const(2)
+TYPE_BYTES = const(3)
+TYPE_UNICODE = const(4)
 
-class SVarintType:
-    WIRE_TYPE = 0
 
+def wire_type(ftype):
+    if isinstance(ftype, int) and ftype < TYPE_BYTES:
+        return 0  # varint
+    else:
+        return 2  # length-delimited, including embedded messages
 
-class BoolType:
-    WIRE_TYPE = 0
 
+def embedded_type(ftype):
+    """Class of the embedded message field type `ftype`."""
+    if isinstance(ftype, str):
+        from trezor.messages import get_type_by_name
 
-class BytesType:
-    WIRE_TYPE = 2
-
-
-class UnicodeType:
-    WIRE_TYPE = 2
+        return get_type_by_name(ftype)
+    return ftype
 
 
 class MessageType:
-    WIRE_TYPE = 2
-
-    @classmethod
-    def get_fields(cls):
-        return {}
+    FIELDS = ()
 
     def __init__(self, **kwargs):
         for kw in kwargs:
@@ -128,6 +173,18 @@ class LimitedReader:
     def __init__(self, reader, limit):
         self.reader = reader
         self.limit = limit
+        self.buffered = hasattr(reader, "read_uvarint")
+
+    def read_uvarint(self, limit=_UVARINT_MAX_LEN):
+        if self.limit < 1:
+            raise EOFError
+        if not self.buffered:
+            return None
+        value = self.reader.read_uvarint(min(limit, self.limit))
+        if value is not None:
+            # readers only decode canonical varints without waiting
+            self.limit -= count_uvarint(value)
+        return value
 
     async def areadinto(self, buf):
         if self.limit < len(buf):
@@ -149,85 +206,190 @@ class CountingWriter:
 
 
 FLAG_REPEATED = const(1)
+FLAG_STREAMED = const(2)  # bytes field that can be loaded into a sink
+
+_STREAM_CHUNK = const(256)  # bytes passed to a sink at once
 
 
-async def load_message(reader, msg_type):
-    fields = msg_type.get_fields()
+async def load_message(reader, msg_type, sinks=None):
+    """
+    Load a message of `msg_type` from `reader`.  `sinks` optionally maps names
+    of fields flagged with `FLAG_STREAMED` to functions that consume the field
+    value in chunks, instead of the value getting allocated whole.  Chunks
+    are only valid during the call, and the field is set to the number of
+    bytes consumed.  Sinks apply only to fields of `msg_type` itself, not to
+    embedded messages.
+    """
+    fields = msg_type.FIELDS
     msg = msg_type()
 
+    # decode varints from the data the reader already has, if it can do that,
+    # and only await when they cross into data that did not arrive yet
+    buffered = hasattr(reader, "read_uvarint")
+
     while True:
         try:
-            fkey = await load_uvarint(reader)
+            fkey = reader.read_uvarint() if buffered else None
+            if fkey is None:
+                fkey = await load_uvarint(reader)
         except EOFError:
             break  # no more fields to load
 
         ftag = fkey >> 3
         wtype = fkey & 7
 
-        field = fields.get(ftag, None)
+        field = fields[ftag] if ftag < len(fields) else None
 
         if field is None:  # unknown field, skip it
-            if wtype == 0:
-                await load_uvarint(reader)
-            elif wtype == 2:
-                ivalue = await load_uvarint(reader)
-                await reader.areadinto(bytearray(ivalue))
-            else:
+            if wtype != 0 and wtype != 2:
                 raise ValueError
-            continue
+        else:
+            fname, ftype, fflags = field
+            if wtype != wire_type(ftype):
+                raise TypeError  # parsed wire type differs from the schema
 
-        fname, ftype, fflags = field
-        if wtype != ftype.WIRE_TYPE:
-            raise TypeError  # parsed wire type differs from the schema
+        ivalue = reader.read_uvarint() if buffered else None
+        if ivalue is None:
+            ivalue = await load_uvarint(reader)
 
-        ivalue = await load_uvarint(reader)
+        if field is None:
+            if wtype == 2:
+                await reader.areadinto(bytearray(ivalue))
+            continue
 
-        if ftype is UVarintType:
+        if ftype == TYPE_UVARINT:
             fvalue = ivalue
-        elif ftype is SVarintType:
+        elif ftype == TYPE_SVARINT:
             fvalue = uint_to_sint(ivalue)
-        elif ftype is BoolType:
+        elif ftype == TYPE_BOOL:
             fvalue = bool(ivalue)
-        elif ftype is BytesType:
-            fvalue = bytearray(ivalue)
-            await reader.areadinto(fvalue)
-        elif ftype is UnicodeType:
+        elif ftype == TYPE_BYTES:
+            if fflags & FLAG_STREAMED and sinks is not None and fname in sinks:
+                await load_streamed(reader, ivalue, sinks[fname])
+                fvalue = ivalue
+            else:
+                fvalue = bytearray(ivalue)
+                await reader.areadinto(fvalue)
+        elif ftype == TYPE_UNICODE:
             fvalue = bytearray(ivalue)
             await reader.areadinto(fvalue)
             fvalue = bytes(fvalue).decode()
-        elif issubclass(ftype, MessageType):
-            fvalue = await load_message(LimitedReader(reader, ivalue), ftype)
+        elif not isinstance(ftype, int):
+            mtype = embedded_type(ftype)
+            fvalue = await load_message(LimitedReader(reader, ivalue), mtype)
         else:
             raise TypeError  # field type is unknown
 
+        # all fields are already set by the constructor, repeated ones to []
         if fflags & FLAG_REPEATED:
-            pvalue = getattr(msg, fname, [])
-            pvalue.append(fvalue)
-            fvalue = pvalue
-        setattr(msg, fname, fvalue)
-
-    # fill missing fields
-    for tag in fields:
-        field = fields[tag]
-        if not hasattr(msg, field[0]):
-            setattr(msg, field[0], None)
+            getattr(msg, fname).append(fvalue)
+        else:
+            setattr(msg, fname, fvalue)
 
     return msg
 
 
-async def dump_message(writer, msg):
+async def load_streamed(reader, size, sink):
+    buffer = bytearray(min(size, _STREAM_CHUNK))
+    while size > len(buffer):
+        await reader.areadinto(buffer)
+        sink(buffer)
+        size -= len(buffer)
+    if size > 0:
+        chunk = memoryview(buffer)[:size]
+        await reader.areadinto(chunk)
+        sink(chunk)
+
+
+def count_message(msg, sizes=None):
+    """
+    Return the serialized size of `msg`.  If `sizes` is a list, the sizes of
+    all embedded messages get appended to it, in the order they are written by
+    `dump_message`, so they do not need to be computed again.
+    """
+    nbytes = 0
+    repvalue = [0]
+    mtype = msg.__class__
+    fields = mtype.FIELDS
+
+    for ftag in range(1, len(fields)):
+        field = fields[ftag]
+        if field is None:
+            continue
+        fname, ftype, fflags = field
+
+        fvalue = getattr(msg, fname)
+        if fvalue is None:
+            continue
+
+        fkey = (ftag << 3) | wire_type(ftype)
+
+        if not fflags & FLAG_REPEATED:
+            repvalue[0] = fvalue
+            fvalue = repvalue
+
+        nbytes += count_uvarint(fkey) * len(fvalue)
+
+        for svalue in fvalue:
+            if ftype == TYPE_UVARINT:
+                nbytes += count_uvarint(svalue)
+
+            elif ftype == TYPE_SVARINT:
+                nbytes += count_uvarint(sint_to_uint(svalue))
+
+            elif ftype == TYPE_BOOL:
+                nbytes += 1
+
+            elif ftype == TYPE_BYTES:
+                nbytes += count_uvarint(len(svalue)) + len(svalue)
+
+            elif ftype == TYPE_UNICODE:
+                bsize = len(svalue.encode())
+                nbytes += count_uvarint(bsize) + bsize
+
+            elif not isinstance(ftype, int):
+                if sizes is not None:
+                    # reserve the slot before the sizes of the nested messages
+                    index = len(sizes)
+                    sizes.append(0)
+                    msize = sizes[index] = count_message(svalue, sizes)
+                else:
+                    msize = count_message(svalue)
+                nbytes += count_uvarint(msize) + msize
+
+            else:
+                raise TypeError
+
+    return nbytes
+
+
+async def dump_message(writer, msg, sizes=None):
+    """
+    Write `msg` into `writer`.  `sizes` of the embedded messages, as collected
+    by `count_message`, are computed if not given.
+    """
+    if sizes is None:
+        sizes = []
+        count_message(msg, sizes)
+    await _dump_message(writer, msg, iter(sizes))
+
+
+async def _dump_message(writer, msg, sizes):
     repvalue = [0]
     mtype = msg.__class__
-    fields = mtype.get_fields()
+    fields = mtype.FIELDS
 
-    for ftag in fields:
-        fname, ftype, fflags = fields[ftag]
+    for ftag in range(1, len(fields)):
+        field = fields[ftag]
+        if field is None:
+            continue
+        fname, ftype, fflags = field
 
-        fvalue = getattr(msg, fname, None)
+        fvalue = getattr(msg, fname)
         if fvalue is None:
             continue
 
-        fkey = (ftag << 3) | ftype.WIRE_TYPE
+        fkey = (ftag << 3) | wire_type(ftype)
 
         if not fflags & FLAG_REPEATED:
             repvalue[0] = fvalue
@@ -236,29 +398,94 @@ async def dump_message(writer, msg):
         for svalue in fvalue:
             await dump_uvarint(writer, fkey)
 
-            if ftype is UVarintType:
+            if ftype == TYPE_UVARINT:
                 await dump_uvarint(writer, svalue)
 
-            elif ftype is SVarintType:
+            elif ftype == TYPE_SVARINT:
                 await dump_uvarint(writer, sint_to_uint(svalue))
 
-            elif ftype is BoolType:
+            elif ftype == TYPE_BOOL:
                 await dump_uvarint(writer, int(svalue))
 
-            elif ftype is BytesType:
+            elif ftype == TYPE_BYTES:
                 await dump_uvarint(writer, len(svalue))
                 await writer.awrite(svalue)
 
-            elif ftype is UnicodeType:
+            elif ftype == TYPE_UNICODE:
                 bvalue = svalue.encode()
                 await dump_uvarint(writer, len(bvalue))
                 await writer.awrite(bvalue)
 
-            elif issubclass(ftype, MessageType):
-                counter = CountingWriter()
-                await dump_message(counter, svalue)
-                await dump_uvarint(writer, counter.size)
-                await dump_message(writer, svalue)
+            elif not isinstance(ftype, int):
+                await dump_uvarint(writer, next(sizes))
+                await _dump_message(writer, svalue, sizes)
+
+            else:
+                raise TypeError
+
+
+def encode_message(buffer, msg, sizes=None):
+    """
+    Encode `msg` into `buffer` without any awaits, return the number of bytes
+    written.  `buffer` needs to be at least `count_message(msg)` bytes long.
+    `sizes` of the embedded messages are computed if not given, same as in
+    `dump_message`.
+    """
+    if sizes is None:
+        sizes = []
+        count_message(msg, sizes)
+    return _encode_message(buffer, 0, msg, iter(sizes))
+
+
+def _encode_message(buffer, ofs, msg, sizes):
+    repvalue = [0]
+    mtype = msg.__class__
+    fields = mtype.FIELDS
+
+    for ftag in range(1, len(fields)):
+        field = fields[ftag]
+        if field is None:
+            continue
+        fname, ftype, fflags = field
+
+        fvalue = getattr(msg, fname)
+        if fvalue is None:
+            continue
+
+        fkey = (ftag << 3) | wire_type(ftype)
+
+        if not fflags & FLAG_REPEATED:
+            repvalue[0] = fvalue
+            fvalue = repvalue
+
+        for svalue in fvalue:
+            ofs = encode_uvarint(buffer, ofs, fkey)
+
+            if ftype == TYPE_UVARINT:
+                ofs = encode_uvarint(buffer, ofs, svalue)
+
+            elif ftype == TYPE_SVARINT:
+                ofs = encode_uvarint(buffer, ofs, sint_to_uint(svalue))
+
+            elif ftype == TYPE_BOOL:
+                ofs = encode_uvarint(buffer, ofs, int(svalue))
+
+            elif ftype == TYPE_BYTES:
+                ofs = encode_uvarint(buffer, ofs, len(svalue))
+                buffer[ofs : ofs + len(svalue)] = svalue
+                ofs += len(svalue)
+
+            elif ftype == TYPE_UNICODE:
+                bvalue = svalue.encode()
+                ofs = encode_uvarint(buffer, ofs, len(bvalue))
+                buffer[ofs : ofs + len(bvalue)] = bvalue
+                ofs += len(bvalue)
+
+            elif not isinstance(ftype, int):
+                ofs = encode_uvarint(buffer, ofs, next(sizes))
+                ofs = _encode_message(buffer, ofs, svalue, sizes)
 
             else:
                 raise TypeError
+
+    return ofs
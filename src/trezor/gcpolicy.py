@@ -0,0 +1,76 @@
+"""
+Garbage collection policy.  Instead of collecting after every workflow, the
+heap is collected after a workflow only if it allocated more than `threshold`
+bytes since the last collection, or if modules were unimported.  Workflows
+that need a lot of memory get a collection before they start.  Collections
+made through this module are counted, see `DebugLinkGetProfile`.
+"""
+
+import gc
+import utime
+from trezorutils import gc_info
+
+from trezor.messages import MessageType
+
+# collect after a workflow once this many bytes were allocated since the last
+# collection, smaller workflows leave their garbage to the next one
+threshold = 16 * 1024
+
+# workflows that get a collection before they start
+hungry = {
+    MessageType.SignTx,
+    MessageType.EthereumSignTx,
+    MessageType.CardanoSignTx,
+    MessageType.LiskSignTx,
+    MessageType.NEMSignTx,
+    MessageType.RippleSignTx,
+    MessageType.StellarSignTx,
+    MessageType.TezosSignTx,
+    MessageType.ResetDevice,
+    MessageType.RecoveryDevice,
+}
+
+collections = 0  # number of collections
+pause_us = 0  # total time spent collecting
+max_pause_us = 0  # longest collection
+fragmentation = 0  # per mille of free heap outside the largest free block
+heap_alloc = 0  # heap allocated right after the last collection
+
+
+def collect():
+    """Collect the heap now, and update the statistics."""
+    global collections, pause_us, max_pause_us, fragmentation, heap_alloc
+
+    started = utime.ticks_us()
+    gc.collect()
+    elapsed = utime.ticks_diff(utime.ticks_us(), started)
+    collections += 1
+    pause_us += elapsed
+    max_pause_us = max(max_pause_us, elapsed)
+    free, largest = gc_info()
+    fragmentation = (free - largest) * 1000 // max(free, 1)
+    heap_alloc = gc.mem_alloc()
+
+
+def maybe_collect():
+    """
+    Collect the heap if more than `threshold` bytes were allocated since the
+    last collection.
+    """
+    if gc.mem_alloc() - heap_alloc > threshold:
+        collect()
+
+
+def prepare(mtype):
+    """Collection point before the workflow of message type `mtype`."""
+    if mtype in hungry:
+        collect()
+
+
+def reset():
+    global collections, pause_us, max_pause_us, fragmentation
+
+    collections = 0
+    pause_us = 0
+    max_pause_us = 0
+    fragmentation = 0
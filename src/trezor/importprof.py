@@ -0,0 +1,183 @@
+"""
+Import profiler for the unix port.  Replaces `__import__` with a hook that
+measures wall time and heap allocations of every import that loads a module,
+including the imports it triggers.  Imports are grouped by the workflow they
+happen in, so the cost of the imports of a workflow can be seen separately
+from the boot.  Needs a unix port built with `make build_unix_importprof`,
+which enables `MICROPY_CAN_OVERRIDE_BUILTINS`, see emu.sh -i.
+
+The hook cannot tell which session an import happens in, so only the
+workflows of one session at a time are profiled, see `begin`.
+
+After each workflow, a report of its imports is printed, and all records are
+saved as folded stacks, ready for `vendor/flamegraph/flamegraph.pl`.
+"""
+
+import gc
+import sys
+import utime
+
+FOLDED_PATH = "imports.folded"
+
+enabled = False
+# "workflow;module;...;module" -> [count, total us, self us, total B, self B]
+records = {}
+
+_import = None
+_stack = ["boot"]  # workflow, and the modules being imported in it
+_session = None  # session of the profiled workflow, None for the boot
+_overlapped = False  # other sessions ran workflows during the profiled one
+
+
+def enable():
+    global _import, enabled
+    import builtins
+
+    if not enabled:
+        _import = builtins.__import__
+        try:
+            builtins.__import__ = _hook
+        except AttributeError:
+            raise RuntimeError("build the unix port with TREZOR_IMPORTPROF=1")
+        enabled = True
+
+
+def disable():
+    global enabled
+    import builtins
+
+    if enabled:
+        builtins.__import__ = _import
+        enabled = False
+
+
+def reset():
+    records.clear()
+
+
+def begin(workflow, session):
+    """
+    Account the following imports to `workflow` of `session`, and return True.
+    While a workflow of another session is profiled, return False and change
+    nothing, the imports of both workflows are accounted to the profiled one.
+    """
+    global _session, _overlapped
+
+    if _stack[0] != "idle" and _session != session:
+        _overlapped = True
+        return False
+    _stack[0] = workflow
+    _session = session
+    return True
+
+
+def end(session=None):
+    """
+    Report the imports of the current workflow of `session`, or of the boot,
+    and save all records.  Does nothing for workflows refused by `begin`.
+    """
+    global _session, _overlapped
+
+    if _stack[0] == "idle" or _session != session:
+        return
+    report(_stack[0])
+    if _overlapped:
+        print("workflows of other sessions ran at the same time, and are included")
+    save(FOLDED_PATH)
+    _stack[0] = "idle"
+    _session = None
+    _overlapped = False
+
+
+def _loaded(name, fromlist):
+    # name of the module the import loads, None if everything is loaded already
+    if name not in sys.modules:
+        return name
+    module = sys.modules[name]
+    for sub in fromlist or ():
+        if not hasattr(module, sub):
+            return name + "." + sub
+    return None
+
+
+def _absolute(name, globals, level):
+    # name of the module a relative import of `level` in `globals` refers to
+    package = globals.get("__package__")
+    if package is None:
+        package = globals["__name__"]
+        if "__path__" not in globals:
+            package = package.rsplit(".", 1)[0]  # package of a plain module
+    if level > 1:
+        package = package.rsplit(".", level - 1)[0]
+    return package + "." + name if name else package
+
+
+def _hook(name, globals=None, locals=None, fromlist=(), level=0):
+    if level:
+        # records are keyed by the absolute name, and the import is done with
+        # it, as it would otherwise be relative to this module
+        name = _absolute(name, globals, level)
+        level = 0
+    label = _loaded(name, fromlist)
+    if label is None:
+        return _import(name, globals, locals, fromlist, level)
+
+    # collections would make the allocation counts wrong
+    outermost = len(_stack) == 1
+    if outermost:
+        gc.disable()
+    _stack.append(label)
+    key = ";".join(_stack)
+    # time and allocations of the nested imports are subtracted from the
+    # self counters of this one, once they finish
+    record = records.get(key)
+    if record is None:
+        record = records[key] = [0, 0, 0, 0, 0]
+    parent = records.get(";".join(_stack[:-1])) if len(_stack) > 2 else None
+    alloc = gc.mem_alloc()
+    started = utime.ticks_us()
+    try:
+        return _import(name, globals, locals, fromlist, level)
+    finally:
+        elapsed = utime.ticks_diff(utime.ticks_us(), started)
+        alloc = gc.mem_alloc() - alloc
+        record[0] += 1
+        record[1] += elapsed
+        record[2] += elapsed
+        record[3] += alloc
+        record[4] += alloc
+        if parent is not None:
+            parent[2] -= elapsed
+            parent[4] -= alloc
+        _stack.pop()
+        if outermost:
+            gc.enable()
+
+
+def report(workflow=None, sort=2, limit=20):
+    """
+    Print the modules imported in `workflow`, or in all of them, sorted by
+    the column `sort` (of count, total us, self us, total alloc, self alloc).
+    """
+    modules = {}
+    for key, record in records.items():
+        path = key.split(";")
+        if workflow is not None and path[0] != workflow:
+            continue
+        total = modules.get(path[-1])
+        if total is None:
+            total = modules[path[-1]] = [0, 0, 0, 0, 0]
+        for i in range(5):
+            total[i] += record[i]
+    rows = sorted(modules.items(), key=lambda item: item[1][sort], reverse=True)
+    print("imports of %s:" % (workflow or "all workflows"))
+    print("count    total us     self us     total B      self B  module")
+    for name, r in rows[:limit]:
+        print("%5d  %10d  %10d  %10d  %10d  %s" % (r[0], r[1], r[2], r[3], r[4], name))
+
+
+def save(path):
+    """Save the self times as folded stacks, one line per import chain."""
+    with open(path, "w") as f:
+        for key, record in records.items():
+            f.write("%s %d\n" % (key, max(record[2], 0)))
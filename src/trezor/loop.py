@@ -7,6 +7,7 @@ stepped through until completion, and can get asynchronously blocked by
 See `schedule`, `run`, and syscalls `sleep`, `wait`, `signal` and `spawn`.
 """
 
+import sys
 import utime
 import utimeq
 from micropython import const
@@ -15,40 +16,178 @@ from trezor import io, log
 
 after_step_hook = None  # function, called after each task step
 
-_QUEUE_SIZE = const(64)  # maximum number of scheduled tasks
+_QUEUE_SIZE = const(64)  # initial capacity of the task queue
+_IO_QUEUE_SIZE = const(8)  # initial capacity of the I/O task queue
+_QUEUE_ENTRY_SIZE = const(16)  # heap usage of one queue entry, in bytes
+queue_budget = 256 * _QUEUE_ENTRY_SIZE  # heap the task queue can grow to, in bytes
+backlog_limit = 64  # entries the backlog can hold once the queue is full
+
 _queue = utimeq.utimeq(_QUEUE_SIZE)
-_paused = {}
+_io_queue = utimeq.utimeq(_IO_QUEUE_SIZE)  # entries of the tasks in _io_tasks
+_io_queue_size = _IO_QUEUE_SIZE
+_backlog = []  # entries waiting for room in _queue, see `schedule`
+_backlog_head = 0  # index of the first entry of _backlog still waiting
+_paused = {}  # interface -> set of tasks paused on it
+_parked = {}  # task -> interface it is paused on, reverse index of _paused
+_pending = {}  # interface -> message of the current poll nobody was left to handle
+_reports = {}  # interface -> reports read ahead by io.poll_batch, in order
+_scheduled = {}  # task -> number of its live entries in the queues and _backlog
+_cancelled = {}  # task -> number of its entries left by close()
+_stale = 0  # entries left by close() since _queue was last compacted, at most
+_io_tasks = set()  # tasks of PRIORITY_IO, see `schedule`
+
+# task priority classes
+PRIORITY_NORMAL = const(0)  # UI and other tasks
+PRIORITY_IO = const(1)  # tasks serving the host, run before normal ones
+
+# sleeps of at least _COALESCE_MIN_US get their deadline rounded up to a
+# multiple of timer_grid_us, so that timers of concurrently running animations
+# expire together; must be a power of two, zero disables the coalescing
+timer_grid_us = 4096
+_COALESCE_MIN_US = const(16384)
+timer_wakeups = 0  # number of times the loop woke up on a timer
+
+_utime = utime  # the real clock, `utime` is replaced in virtual time mode
+_virtual_clock = None  # see `set_virtual_time`
+
+# task queue stats, for sizing the queue budget
+queue_size = _QUEUE_SIZE  # current capacity of the task queue
+queue_high_water = 0  # maximum number of entries the task queue ever held
+queue_blocked = 0  # number of entries that had to wait in the backlog
 
 if __debug__:
     # for performance stats
     import array
+    import gc
 
     log_delay_pos = 0
     log_delay_rb_len = const(10)
     log_delay_rb = array.array("i", [0] * log_delay_rb_len)
 
-
-def schedule(task, value=None, deadline=None):
+    # per-task profiling, enabled at runtime through the debug link
+    profiling = False
+    profile_stats = {}  # task name -> list of counters, see `_profile`
+    profile_names = {}  # live task or workflow -> name to report it under
+    profile_workflows = {}  # workflow name -> list of counters, see `profile_close`
+    _profile_open = {}  # workflow -> heap counters at its start
+    profile_alloc = 0  # bytes allocated by all profiled steps
+    profile_gc_runs = 0  # garbage collections during profiled steps
+    profile_min_free = -1  # lowest free heap after a profiled step
+    PROF_NAME = const(0)
+    PROF_STEPS = const(1)  # number of steps
+    PROF_TOTAL_US = const(2)  # cumulative step time
+    PROF_MAX_US = const(3)  # longest step time
+    PROF_SLEEP = const(4)  # number of syscalls by type
+    PROF_WAIT = const(5)
+    PROF_SIGNAL = const(6)
+    PROF_SPAWN = const(7)
+    PROF_ALLOC = const(8)  # bytes allocated
+    PROF_MAX_ALLOC = const(9)  # most bytes allocated in one step
+    PROF_GC_RUNS = const(10)  # garbage collections during the steps
+    # workflow counters, PROF_NAME, PROF_ALLOC, PROF_MAX_ALLOC and
+    # PROF_GC_RUNS are shared with the task counters
+    PROF_RUNS = const(1)  # number of finished runs
+
+
+def schedule(task, value=None, deadline=None, priority=None):
     """
     Schedule task to be executed with `value` on given `deadline` (in
     microseconds).  Does not start the event loop itself, see `run`.
+
+    If `priority` is given, it sets the priority class of the task for this and
+    all later schedules.  Tasks of `PRIORITY_IO` are kept in a queue of their
+    own, and a task from it that is ready to run always runs before the tasks
+    of `PRIORITY_NORMAL`, however overdue they are.
+
+    The task queue grows as needed, up to `queue_budget`.  Once the budget is
+    exhausted, the task waits in a backlog until there is room in the queue
+    again.  Raises `IndexError` if the backlog is full too, see
+    `backlog_limit`.  The queue of I/O tasks is not limited by the budget,
+    there are only a few of them.
     """
+    global queue_high_water, queue_blocked
+
+    if priority == PRIORITY_IO:
+        _io_tasks.add(task)
+    elif priority is not None:
+        _io_tasks.discard(task)
     if deadline is None:
         deadline = utime.ticks_us()
-    _queue.push(deadline, task, value)
+    if task in _io_tasks:
+        if len(_io_queue) >= _io_queue_size:
+            _grow_io_queue()
+        _io_queue.push(deadline, task, value)
+    else:
+        if len(_queue) >= queue_size:
+            _make_room()
+        if len(_queue) >= queue_size or _backlog:
+            if len(_backlog) - _backlog_head >= backlog_limit:
+                raise IndexError("task queue full")
+            _backlog.append((deadline, task, value))
+            queue_blocked += 1
+        else:
+            _queue.push(deadline, task, value)
+            if len(_queue) > queue_high_water:
+                queue_high_water = len(_queue)
+    _scheduled[task] = _scheduled.get(task, 0) + 1
 
 
 def pause(task, iface):
+    if _pending and iface in _pending:
+        schedule(task, _pending.pop(iface))
+        return
+    if _reports and iface in _reports:
+        reports = _reports[iface]
+        schedule(task, reports.pop(0))
+        if not reports:
+            del _reports[iface]
+        return
     tasks = _paused.get(iface, None)
     if tasks is None:
         tasks = _paused[iface] = set()
     tasks.add(task)
+    _parked[task] = iface
+
+
+def post(iface, value):
+    """
+    Resume all tasks paused on `iface` with `value`, as if `value` was received
+    on the interface.  Meant for interface numbers that `io.poll` never reports
+    ready, i.e. the session mailboxes of `trezor.wire.codec_v2`.  Returns False
+    if no task is paused on `iface`.
+    """
+    tasks = _paused.pop(iface, None)
+    if not tasks:
+        return False
+    for task in tasks:
+        del _parked[task]
+        schedule(task, value)
+    return True
 
 
 def close(task):
-    for iface in _paused:
-        _paused[iface].discard(task)
-    _queue.discard(task)
+    """
+    Cancel all pending schedules and pauses of `task` and close it.  Queue
+    entries of the task are not removed right away, they are skipped once
+    they are popped from the queue (or dropped by `_make_room` if the queue
+    fills up).
+    """
+    global _stale
+
+    iface = _parked.pop(task, None)
+    if iface is not None:
+        tasks = _paused.get(iface, None)
+        if tasks is not None:
+            tasks.discard(task)
+            if not tasks:
+                del _paused[iface]
+    n = _scheduled.pop(task, 0)
+    if n:
+        _cancelled[task] = _cancelled.get(task, 0) + n
+        _stale += n
+    _io_tasks.discard(task)
+    if __debug__ and profiling:
+        profile_names.pop(task, None)
     task.close()
 
 
@@ -60,17 +199,21 @@ def run():
     a `Syscall`.
     """
 
+    global timer_wakeups
+
     if __debug__:
         global log_delay_pos
 
     max_delay = const(1000000)  # usec delay if queue is empty
+    max_msgs = const(8)  # maximum number of messages received in one poll
 
     task_entry = [0, 0, 0]  # deadline, task, value
-    msg_entry = [0, 0]  # iface | flags, value
-    while _queue or _paused:
+    msg_entries = [0, 0] * max_msgs  # iface | flags, value
+    while _scheduled or _paused:
         # compute the maximum amount of time we can wait for a message
-        if _queue:
-            delay = utime.ticks_diff(_queue.peektime(), utime.ticks_us())
+        if _queue or _io_queue:
+            now = utime.ticks_us()
+            delay = max(utime.ticks_diff(_next_queue(now).peektime(), now), 0)
         else:
             delay = max_delay
 
@@ -79,29 +222,254 @@ def run():
             log_delay_rb[log_delay_pos] = delay
             log_delay_pos = (log_delay_pos + 1) % log_delay_rb_len
 
-        if io.poll(_paused, msg_entry, delay):
-            # message received, run tasks paused on the interface
-            msg_tasks = _paused.pop(msg_entry[0], ())
-            for task in msg_tasks:
-                _step(task, msg_entry[1])
+        if _virtual_clock is not None and (_queue or _io_queue):
+            # do not wait for the deadline, only check for ready messages
+            msg_count = io.poll_batch(_paused, msg_entries, 0)
         else:
-            # timeout occurred, run the first scheduled task
-            if _queue:
-                _queue.pop(task_entry)
-                _step(task_entry[1], task_entry[2])
+            msg_count = io.poll_batch(_paused, msg_entries, delay)
+        if msg_count:
+            # messages received, run tasks paused on the interfaces before
+            # checking the timers again
+            last_iface = None
+            for i in range(0, msg_count * 2, 2):
+                msg_iface = msg_entries[i]
+                msg_value = msg_entries[i + 1]
+                msg_entries[i + 1] = None  # do not keep the message alive
+                delivered = False
+                for task in _paused.pop(msg_iface, ()):
+                    # skip tasks closed by a previously stepped task
+                    if _parked.pop(task, None) is not None:
+                        _step(task, msg_value)
+                        delivered = True
+                if msg_iface != last_iface:
+                    # first message of the interface in this batch
+                    last_iface = msg_iface
+                    taken = delivered
+                elif not delivered and taken:
+                    # the reader got an earlier report of the batch but is not
+                    # waiting for the next one yet, keep the reports read ahead
+                    # for it, as the USB driver would have kept them
+                    reports = _reports.get(msg_iface, None)
+                    if reports is None:
+                        reports = _reports[msg_iface] = []
+                    reports.append(msg_value)
+                    continue
+                if not delivered and msg_value is not None:
+                    # all waiting tasks got closed while dispatching the batch,
+                    # keep the message for a task that starts waiting on the
+                    # iface while the rest of the batch is dispatched
+                    _pending[msg_iface] = msg_value
+            if _pending:
+                # later waiters must not get stale messages
+                _pending.clear()
+        elif _queue or _io_queue:
+            # timeout occurred, run the first scheduled task and all the other
+            # tasks that are already due, so they share a single wakeup
+            timer_wakeups += 1
+            if _virtual_clock is not None:
+                _virtual_clock.advance(delay)
+            now = utime.ticks_us()
+            # only the entries queued before this pass, a task that schedules
+            # itself again right away is due again, i.e. always in virtual time
+            # mode, where the clock stands still, and must not keep I/O waiting
+            count = len(_queue) + len(_io_queue)
+            while count:
+                count -= 1
+                queue = _next_queue(now)
+                queue.pop(task_entry)
+                if queue is _queue and _backlog:
+                    _admit()
+                if _dequeue(task_entry[1]):
+                    _step(task_entry[1], task_entry[2])
+                queue = _next_queue(now)
+                if not queue or utime.ticks_diff(queue.peektime(), now) > 0:
+                    break
+
+
+def set_virtual_time(enabled):
+    """
+    Switch the loop into (or out of) virtual time mode, meant for tests on the
+    emulator.  In this mode, `utime` is replaced in all loaded modules (and in
+    modules imported later) with a clock that stands still while tasks run and
+    jumps straight to the next deadline when no task is ready and no message is
+    waiting, so timeouts and animations take no real time.  Messages are still
+    awaited in real time if no task is scheduled.
+    """
+    global utime, _virtual_clock
+
+    clock = _VirtualClock() if enabled else _utime
+    for mod in sys.modules.values():
+        if getattr(mod, "utime", None) is utime:
+            setattr(mod, "utime", clock)
+    if enabled:
+        sys.modules["utime"] = clock
+        _virtual_clock = clock
+    else:
+        sys.modules.pop("utime", None)
+        _virtual_clock = None
+    utime = clock
+
+
+class _VirtualClock:
+    """
+    Stand-in for the `utime` module, with `ticks_us` and `ticks_ms` advanced
+    only by the event loop, see `set_virtual_time`.
+    """
+
+    def __init__(self):
+        self.start_us = _utime.ticks_us()
+        self.start_ms = _utime.ticks_ms()
+        self.elapsed = 0  # virtual time since the start, in microseconds
+        self.ticks_add = _utime.ticks_add
+        self.ticks_diff = _utime.ticks_diff
+
+    def ticks_us(self):
+        return _utime.ticks_add(self.start_us, self.elapsed)
+
+    def ticks_ms(self):
+        return _utime.ticks_add(self.start_ms, self.elapsed // 1000)
+
+    def advance(self, delay_us):
+        self.elapsed += delay_us
+
+    # blocking sleeps just advance the clock
+    def sleep_us(self, delay_us):
+        self.elapsed += delay_us
+
+    def sleep_ms(self, delay_ms):
+        self.elapsed += delay_ms * 1000
+
+    def sleep(self, delay_s):
+        self.elapsed += int(delay_s * 1000000)
+
+
+def _drop_cancelled(task):
+    """
+    Returns True and consumes one of the entries left behind by `close`, if
+    `task` has any.
+    """
+    n = _cancelled.pop(task, 0)
+    if n > 1:
+        _cancelled[task] = n - 1
+    return n > 0
+
+
+def _dequeue(task):
+    """
+    Account for a queue entry of `task` that was just popped.  Returns False if
+    the entry belongs to a task that was closed in the meantime.
+    """
+    if _drop_cancelled(task):
+        return False
+    n = _scheduled.pop(task)
+    if n > 1:
+        _scheduled[task] = n - 1
+    return True
+
+
+def _next_queue(now):
+    """
+    The queue to run the next entry from: the I/O task queue, if its first
+    task is ready at `now` or due before the first normal task, otherwise the
+    normal one.
+    """
+    if not _io_queue:
+        return _queue
+    if not _queue:
+        return _io_queue
+    io_deadline = _io_queue.peektime()
+    if utime.ticks_diff(io_deadline, now) <= 0:
+        return _io_queue
+    if utime.ticks_diff(io_deadline, _queue.peektime()) <= 0:
+        return _io_queue
+    return _queue
+
+
+def _live_entries(queue):
+    """Pop all entries of `queue`, return the ones of tasks not closed."""
+    entry = [0, 0, 0]  # deadline, task, value
+    live = []
+    while queue:
+        queue.pop(entry)
+        if not _drop_cancelled(entry[1]):
+            live.append((entry[0], entry[1], entry[2]))
+    return live
+
+
+def _grow_io_queue():
+    """Drop entries of closed tasks from the I/O task queue, and double it."""
+    global _io_queue, _io_queue_size
+
+    live = _live_entries(_io_queue)
+    _io_queue_size *= 2
+    _io_queue = utimeq.utimeq(_io_queue_size)
+    for deadline, task, value in live:
+        _io_queue.push(deadline, task, value)
+
+
+def _make_room():
+    """
+    Drop queue entries of closed tasks and, if the queue is still more than
+    half full, grow it within `queue_budget`.  Without room to grow, the queue
+    is only rebuilt once closed tasks may have left a quarter of its entries,
+    so a full queue is not rebuilt on every `schedule`.
+    """
+    global _queue, queue_size, _stale
+
+    max_size = queue_budget // _QUEUE_ENTRY_SIZE
+    if queue_size >= max_size and _stale * 4 < queue_size:
+        return  # not enough to drop, no room to grow
+    live = _live_entries(_queue)
+    _stale = 0
+    if len(live) > queue_size // 2 and queue_size < max_size:
+        queue_size = min(queue_size * 2, max_size)
+        _queue = utimeq.utimeq(queue_size)
+    for deadline, task, value in live:
+        _queue.push(deadline, task, value)
+    _admit()
+
+
+def _admit():
+    """Move entries waiting in the backlog to the queue, while there is room."""
+    global _backlog_head
+
+    while _backlog_head < len(_backlog) and len(_queue) < queue_size:
+        deadline, task, value = _backlog[_backlog_head]
+        _backlog[_backlog_head] = None
+        _backlog_head += 1
+        if not _drop_cancelled(task):
+            _queue.push(deadline, task, value)
+    # drop the admitted entries once they make up half of the list, so that
+    # admissions stay constant-time on average, and an empty list means the
+    # backlog is empty
+    if _backlog_head * 2 >= len(_backlog):
+        del _backlog[:_backlog_head]
+        _backlog_head = 0
 
 
 def _step(task, value):
+    if __debug__:
+        # profiling can get toggled by the task itself
+        profiled = profiling
+        if profiled:
+            name = profile_names.get(task, None) or profile_name(task)
+            heap = gc.mem_alloc()
+            started = utime.ticks_us()
+    result = None
     try:
         if isinstance(value, Exception):
             result = task.throw(value)
         else:
             result = task.send(value)
     except StopIteration as e:
+        _io_tasks.discard(task)
         if __debug__:
+            profile_names.pop(task, None)
             log.debug(__name__, "finish: %s", task)
     except Exception as e:
+        _io_tasks.discard(task)
         if __debug__:
+            profile_names.pop(task, None)
             log.exception(__name__, e)
     else:
         if isinstance(result, Syscall):
@@ -113,6 +481,110 @@ def _step(task, value):
                 log.error(__name__, "unknown syscall: %s", result)
         if after_step_hook:
             after_step_hook()
+    if __debug__ and profiled:
+        elapsed = utime.ticks_diff(utime.ticks_us(), started)
+        _profile(name, elapsed, result, gc.mem_alloc() - heap)
+
+
+if __debug__:
+
+    def profile_name(task):
+        """Name of `task` without its address, i.e. the name of its coroutine."""
+        name = repr(task)
+        at = name.find(" at ")
+        if at >= 0:
+            name = name[:at] + ">"
+        return name
+
+    def _profile(name, elapsed, result, heap_delta):
+        """
+        Account a step of a task named `name`.  Tasks are summed up by name,
+        so the profiler keeps no task alive after it finished.  In virtual
+        time mode the clock stands still while tasks run, so step times read
+        0 there.
+        """
+        global profile_alloc, profile_gc_runs, profile_min_free
+
+        stats = profile_stats.get(name, None)
+        if stats is None:
+            stats = profile_stats[name] = [name, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+        # the heap can only shrink during a step if it got collected, the
+        # allocations made before the collection are lost in that case
+        if heap_delta < 0:
+            stats[PROF_GC_RUNS] += 1
+            profile_gc_runs += 1
+            heap_delta = 0
+        stats[PROF_ALLOC] += heap_delta
+        if heap_delta > stats[PROF_MAX_ALLOC]:
+            stats[PROF_MAX_ALLOC] = heap_delta
+        profile_alloc += heap_delta
+        free = gc.mem_free()
+        if free < profile_min_free or profile_min_free < 0:
+            profile_min_free = free
+        stats[PROF_STEPS] += 1
+        stats[PROF_TOTAL_US] += elapsed
+        if elapsed > stats[PROF_MAX_US]:
+            stats[PROF_MAX_US] = elapsed
+        if isinstance(result, sleep):
+            stats[PROF_SLEEP] += 1
+        elif isinstance(result, wait):
+            stats[PROF_WAIT] += 1
+        elif isinstance(result, signal):
+            stats[PROF_SIGNAL] += 1
+        elif isinstance(result, spawn):
+            stats[PROF_SPAWN] += 1
+
+    def profile_open(workflow):
+        """Start accounting heap allocations to `workflow`."""
+        _profile_open[workflow] = (profile_alloc, profile_gc_runs)
+
+    def profile_close(workflow):
+        """
+        Account heap allocations made since `profile_open` to `workflow`.
+        Workflows are summed up by name, and get charged for allocations of
+        all tasks stepped while they were running.
+        """
+        opened = _profile_open.pop(workflow, None)
+        name = profile_names.pop(workflow, None)
+        if opened is None:
+            return  # profiling got enabled while the workflow was running
+        if name is None:
+            name = profile_name(workflow)
+        stats = profile_workflows.get(name, None)
+        if stats is None:
+            stats = profile_workflows[name] = [name, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+        alloc = profile_alloc - opened[0]
+        stats[PROF_RUNS] += 1
+        stats[PROF_ALLOC] += alloc
+        if alloc > stats[PROF_MAX_ALLOC]:
+            stats[PROF_MAX_ALLOC] = alloc
+        stats[PROF_GC_RUNS] += profile_gc_runs - opened[1]
+
+    def profile_enable(enable):
+        """
+        Turn the profiling on or off.  Workflows running when it is turned off
+        are forgotten, `workflow.onclose` closes them only while profiling.
+        """
+        global profiling
+
+        profiling = enable
+        if not enable:
+            profile_names.clear()
+            _profile_open.clear()
+
+    def profile_reset():
+        global queue_high_water, queue_blocked
+        global profile_alloc, profile_gc_runs, profile_min_free
+
+        profile_stats.clear()
+        profile_names.clear()
+        profile_workflows.clear()
+        _profile_open.clear()
+        profile_alloc = 0
+        profile_gc_runs = 0
+        profile_min_free = -1
+        queue_high_water = len(_queue)
+        queue_blocked = 0
 
 
 class Syscall:
@@ -129,8 +601,9 @@ class Syscall:
 class sleep(Syscall):
     """
     Pause current task and resume it after given delay.  Although the delay is
-    given in microseconds, sub-millisecond precision is not guaranteed.  Result
-    value is the calculated deadline.
+    given in microseconds, sub-millisecond precision is not guaranteed, and
+    longer delays can get extended by up to `timer_grid_us` to coalesce with
+    other timers.  Result value is the calculated deadline.
 
     Example:
 
@@ -143,6 +616,8 @@ class sleep(Syscall):
 
     def handle(self, task):
         deadline = utime.ticks_add(utime.ticks_us(), self.delay_us)
+        if timer_grid_us and self.delay_us >= _COALESCE_MIN_US:
+            deadline = utime.ticks_add(deadline | (timer_grid_us - 1), 1)
         schedule(task, deadline, deadline)
 
 
@@ -248,6 +723,9 @@ class spawn(Syscall):
         self.scheduled = []
         for index, child in enumerate(self.children):
             parent = self._wait(child, index)
+            if __debug__ and profiling:
+                # report the child instead of the anonymous wrapper task
+                profile_names[parent] = profile_name(child)
             schedule(parent)
             self.scheduled.append(parent)
 
@@ -307,26 +785,83 @@ class take(Syscall):
 
 
 class chan:
-    def __init__(self, id=None):
+    """
+    Channel for passing values between tasks.  With zero `capacity`, `put`
+    waits until the value is taken.  Otherwise, up to `capacity` values are
+    buffered and `put` waits only if the buffer is full.  All queues of the
+    channel are ring buffers, so both ends work in constant time.
+
+    Example:
+
+    >>> ch = loop.chan(capacity=4)
+    >>> # in task #1:
+    >>> await ch.put('hello')  # returns immediately, value is buffered
+    >>> ch.try_put('world')  # never waits, False if the buffer is full
+    >>> # in task #2:
+    >>> value = await ch.take()
+    >>> value = ch.try_take()  # never waits, None if there is no value
+    """
+
+    def __init__(self, id=None, capacity=0):
         self.id = id
-        self.putters = []
-        self.takers = []
+        self.capacity = capacity
+        self.buffer = _ring()  # buffered values
+        self.putters = _ring()  # tuples of waiting task and its value
+        self.takers = _ring()  # waiting tasks
         self.put = put(self)
         self.take = take(self)
 
+    def publish(self, value):
+        """
+        Send `value` to all tasks currently waiting on `take`, without
+        buffering it.  Returns False if there is no such task.
+        """
+        return self.schedule_publish(schedule, value)
+
+    def try_put(self, value):
+        """
+        Put `value` into the channel without waiting.  Returns False if the
+        value was neither taken nor buffered.
+        """
+        if self.takers.count:
+            schedule(self.takers.popleft(), value)
+        elif self.buffer.count < self.capacity:
+            self.buffer.append(value)
+        else:
+            return False
+        return True
+
+    def try_take(self, default=None):
+        """
+        Take a value from the channel without waiting.  Returns `default` if
+        there is no value available.
+        """
+        if self.buffer.count:
+            value = self.buffer.popleft()
+            self._refill(schedule)
+            return value
+        elif self.putters.count:
+            putter, value = self.putters.popleft()
+            schedule(putter, value)
+            return value
+        else:
+            return default
+
     def schedule_publish(self, schedule, value):
-        if self.takers:
-            for taker in self.takers:
-                schedule(taker, value)
-            self.takers.clear()
+        if self.takers.count:
+            while self.takers.count:
+                schedule(self.takers.popleft(), value)
             return True
         else:
             return False
 
     def schedule_put(self, schedule, putter, value):
-        if self.takers:
-            taker = self.takers.pop(0)
-            schedule(taker, value)
+        if self.takers.count:
+            schedule(self.takers.popleft(), value)
+            schedule(putter, value)
+            return True
+        elif self.buffer.count < self.capacity:
+            self.buffer.append(value)
             schedule(putter, value)
             return True
         else:
@@ -334,11 +869,52 @@ class chan:
             return False
 
     def schedule_take(self, schedule, taker):
-        if self.putters:
-            putter, value = self.putters.pop(0)
+        if self.buffer.count:
+            schedule(taker, self.buffer.popleft())
+            self._refill(schedule)
+            return True
+        elif self.putters.count:
+            putter, value = self.putters.popleft()
             schedule(taker, value)
             schedule(putter, value)
             return True
         else:
             self.takers.append(taker)
             return False
+
+    def _refill(self, schedule):
+        # move the value of the first waiting putter into the freed buffer slot
+        if self.putters.count:
+            putter, value = self.putters.popleft()
+            self.buffer.append(value)
+            schedule(putter, value)
+
+
+class _ring:
+    """
+    FIFO queue in a ring buffer, with constant-time `append` and `popleft`.
+    The buffer doubles in size when it fills up.
+    """
+
+    def __init__(self, size=4):
+        self.items = [None] * size
+        self.head = 0
+        self.count = 0
+
+    def append(self, item):
+        size = len(self.items)
+        if self.count == size:
+            # unroll the ring and double its size
+            self.items = self.items[self.head :] + self.items[: self.head]
+            self.items.extend([None] * size)
+            self.head = 0
+            size *= 2
+        self.items[(self.head + self.count) % size] = item
+        self.count += 1
+
+    def popleft(self):
+        item = self.items[self.head]
+        self.items[self.head] = None
+        self.head = (self.head + 1) % len(self.items)
+        self.count -= 1
+        return item
@@ -5,15 +5,13 @@ import protobuf as p
 
 class ApplyFlags(p.MessageType):
     MESSAGE_WIRE_TYPE = 28
+    FIELDS = (
+        None,
+        ('flags', p.TYPE_UVARINT, 0),  # 1
+    )
 
     def __init__(
         self,
         flags: int = None,
     ) -> None:
         self.flags = flags
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('flags', p.UVarintType, 0),
-        }
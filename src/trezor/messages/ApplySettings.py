@@ -5,6 +5,15 @@ import protobuf as p
 
 class ApplySettings(p.MessageType):
     MESSAGE_WIRE_TYPE = 25
+    FIELDS = (
+        None,
+        ('language', p.TYPE_UNICODE, 0),  # 1
+        ('label', p.TYPE_UNICODE, 0),  # 2
+        ('use_passphrase', p.TYPE_BOOL, 0),  # 3
+        ('homescreen', p.TYPE_BYTES, p.FLAG_STREAMED),  # 4
+        ('passphrase_source', p.TYPE_UVARINT, 0),  # 5
+        ('auto_lock_delay_ms', p.TYPE_UVARINT, 0),  # 6
+    )
 
     def __init__(
         self,
@@ -21,14 +30,3 @@ class ApplySettings(p.MessageType):
         self.homescreen = homescreen
         self.passphrase_source = passphrase_source
         self.auto_lock_delay_ms = auto_lock_delay_ms
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('language', p.UnicodeType, 0),
-            2: ('label', p.UnicodeType, 0),
-            3: ('use_passphrase', p.BoolType, 0),
-            4: ('homescreen', p.BytesType, 0),
-            5: ('passphrase_source', p.UVarintType, 0),
-            6: ('auto_lock_delay_ms', p.UVarintType, 0),
-        }
@@ -5,6 +5,11 @@ import protobuf as p
 
 class ButtonRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 26
+    FIELDS = (
+        None,
+        ('code', p.TYPE_UVARINT, 0),  # 1
+        ('data', p.TYPE_UNICODE, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class ButtonRequest(p.MessageType):
     ) -> None:
         self.code = code
         self.data = data
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('code', p.UVarintType, 0),
-            2: ('data', p.UnicodeType, 0),
-        }
@@ -2,11 +2,21 @@
 # fmt: off
 import protobuf as p
 
-from .HDNodeType import HDNodeType
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .HDNodeType import HDNodeType
+    except ImportError:
+        pass
 
 
 class CardanoPublicKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 306
+    FIELDS = (
+        None,
+        ('xpub', p.TYPE_UNICODE, 0),  # 1
+        ('node', 'HDNodeType', 0),  # 2
+    )
 
     def __init__(
         self,
@@ -15,10 +25,3 @@ class CardanoPublicKey(p.MessageType):
     ) -> None:
         self.xpub = xpub
         self.node = node
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('xpub', p.UnicodeType, 0),
-            2: ('node', HDNodeType, 0),
-        }
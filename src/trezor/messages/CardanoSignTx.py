@@ -2,18 +2,24 @@
 # fmt: off
 import protobuf as p
 
-from .CardanoTxInputType import CardanoTxInputType
-from .CardanoTxOutputType import CardanoTxOutputType
-
 if __debug__:
     try:
         from typing import List
+        from .CardanoTxInputType import CardanoTxInputType
+        from .CardanoTxOutputType import CardanoTxOutputType
     except ImportError:
         List = None  # type: ignore
 
 
 class CardanoSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 303
+    FIELDS = (
+        None,
+        ('inputs', 'CardanoTxInputType', p.FLAG_REPEATED),  # 1
+        ('outputs', 'CardanoTxOutputType', p.FLAG_REPEATED),  # 2
+        ('transactions_count', p.TYPE_UVARINT, 0),  # 3
+        ('network', p.TYPE_UVARINT, 0),  # 4
+    )
 
     def __init__(
         self,
@@ -26,12 +32,3 @@ class CardanoSignTx(p.MessageType):
         self.outputs = outputs if outputs is not None else []
         self.transactions_count = transactions_count
         self.network = network
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('inputs', CardanoTxInputType, p.FLAG_REPEATED),
-            2: ('outputs', CardanoTxOutputType, p.FLAG_REPEATED),
-            3: ('transactions_count', p.UVarintType, 0),
-            4: ('network', p.UVarintType, 0),
-        }
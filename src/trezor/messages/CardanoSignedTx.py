@@ -5,6 +5,11 @@ import protobuf as p
 
 class CardanoSignedTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 310
+    FIELDS = (
+        None,
+        ('tx_hash', p.TYPE_BYTES, 0),  # 1
+        ('tx_body', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class CardanoSignedTx(p.MessageType):
     ) -> None:
         self.tx_hash = tx_hash
         self.tx_body = tx_body
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('tx_hash', p.BytesType, 0),
-            2: ('tx_body', p.BytesType, 0),
-        }
@@ -5,15 +5,13 @@ import protobuf as p
 
 class CardanoTxAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 309
+    FIELDS = (
+        None,
+        ('transaction', p.TYPE_BYTES, p.FLAG_STREAMED),  # 1
+    )
 
     def __init__(
         self,
         transaction: bytes = None,
     ) -> None:
         self.transaction = transaction
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('transaction', p.BytesType, 0),
-        }
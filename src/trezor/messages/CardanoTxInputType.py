@@ -10,6 +10,13 @@ if __debug__:
 
 
 class CardanoTxInputType(p.MessageType):
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('prev_hash', p.TYPE_BYTES, 0),  # 2
+        ('prev_index', p.TYPE_UVARINT, 0),  # 3
+        ('type', p.TYPE_UVARINT, 0),  # 4
+    )
 
     def __init__(
         self,
@@ -22,12 +29,3 @@ class CardanoTxInputType(p.MessageType):
         self.prev_hash = prev_hash
         self.prev_index = prev_index
         self.type = type
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('prev_hash', p.BytesType, 0),
-            3: ('prev_index', p.UVarintType, 0),
-            4: ('type', p.UVarintType, 0),
-        }
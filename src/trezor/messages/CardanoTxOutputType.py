@@ -10,6 +10,12 @@ if __debug__:
 
 
 class CardanoTxOutputType(p.MessageType):
+    FIELDS = (
+        None,
+        ('address', p.TYPE_UNICODE, 0),  # 1
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 2
+        ('amount', p.TYPE_UVARINT, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -20,11 +26,3 @@ class CardanoTxOutputType(p.MessageType):
         self.address = address
         self.address_n = address_n if address_n is not None else []
         self.amount = amount
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            3: ('amount', p.UVarintType, 0),
-        }
@@ -5,6 +5,12 @@ import protobuf as p
 
 class CardanoTxRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 304
+    FIELDS = (
+        None,
+        ('tx_index', p.TYPE_UVARINT, 0),  # 1
+        ('tx_hash', p.TYPE_BYTES, 0),  # 2
+        ('tx_body', p.TYPE_BYTES, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -15,11 +21,3 @@ class CardanoTxRequest(p.MessageType):
         self.tx_index = tx_index
         self.tx_hash = tx_hash
         self.tx_body = tx_body
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('tx_index', p.UVarintType, 0),
-            2: ('tx_hash', p.BytesType, 0),
-            3: ('tx_body', p.BytesType, 0),
-        }
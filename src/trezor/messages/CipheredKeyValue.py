@@ -5,15 +5,13 @@ import protobuf as p
 
 class CipheredKeyValue(p.MessageType):
     MESSAGE_WIRE_TYPE = 48
+    FIELDS = (
+        None,
+        ('value', p.TYPE_BYTES, 0),  # 1
+    )
 
     def __init__(
         self,
         value: bytes = None,
     ) -> None:
         self.value = value
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('value', p.BytesType, 0),
-        }
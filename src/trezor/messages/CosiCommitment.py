@@ -5,6 +5,11 @@ import protobuf as p
 
 class CosiCommitment(p.MessageType):
     MESSAGE_WIRE_TYPE = 72
+    FIELDS = (
+        None,
+        ('commitment', p.TYPE_BYTES, 0),  # 1
+        ('pubkey', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class CosiCommitment(p.MessageType):
     ) -> None:
         self.commitment = commitment
         self.pubkey = pubkey
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('commitment', p.BytesType, 0),
-            2: ('pubkey', p.BytesType, 0),
-        }
@@ -5,6 +5,12 @@ import protobuf as p
 
 class DebugLinkDecision(p.MessageType):
     MESSAGE_WIRE_TYPE = 100
+    FIELDS = (
+        None,
+        ('yes_no', p.TYPE_BOOL, 0),  # 1
+        ('up_down', p.TYPE_BOOL, 0),  # 2
+        ('input', p.TYPE_UNICODE, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -15,11 +21,3 @@ class DebugLinkDecision(p.MessageType):
         self.yes_no = yes_no
         self.up_down = up_down
         self.input = input
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('yes_no', p.BoolType, 0),
-            2: ('up_down', p.BoolType, 0),
-            3: ('input', p.UnicodeType, 0),
-        }
@@ -5,15 +5,13 @@ import protobuf as p
 
 class DebugLinkFlashErase(p.MessageType):
     MESSAGE_WIRE_TYPE = 113
+    FIELDS = (
+        None,
+        ('sector', p.TYPE_UVARINT, 0),  # 1
+    )
 
     def __init__(
         self,
         sector: int = None,
     ) -> None:
         self.sector = sector
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('sector', p.UVarintType, 0),
-        }
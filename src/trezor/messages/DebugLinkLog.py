@@ -5,6 +5,12 @@ import protobuf as p
 
 class DebugLinkLog(p.MessageType):
     MESSAGE_WIRE_TYPE = 104
+    FIELDS = (
+        None,
+        ('level', p.TYPE_UVARINT, 0),  # 1
+        ('bucket', p.TYPE_UNICODE, 0),  # 2
+        ('text', p.TYPE_UNICODE, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -15,11 +21,3 @@ class DebugLinkLog(p.MessageType):
         self.level = level
         self.bucket = bucket
         self.text = text
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('level', p.UVarintType, 0),
-            2: ('bucket', p.UnicodeType, 0),
-            3: ('text', p.UnicodeType, 0),
-        }
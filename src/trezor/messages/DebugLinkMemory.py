@@ -5,15 +5,13 @@ import protobuf as p
 
 class DebugLinkMemory(p.MessageType):
     MESSAGE_WIRE_TYPE = 111
+    FIELDS = (
+        None,
+        ('memory', p.TYPE_BYTES, 0),  # 1
+    )
 
     def __init__(
         self,
         memory: bytes = None,
     ) -> None:
         self.memory = memory
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('memory', p.BytesType, 0),
-        }
@@ -5,6 +5,11 @@ import protobuf as p
 
 class DebugLinkMemoryRead(p.MessageType):
     MESSAGE_WIRE_TYPE = 110
+    FIELDS = (
+        None,
+        ('address', p.TYPE_UVARINT, 0),  # 1
+        ('length', p.TYPE_UVARINT, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class DebugLinkMemoryRead(p.MessageType):
     ) -> None:
         self.address = address
         self.length = length
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address', p.UVarintType, 0),
-            2: ('length', p.UVarintType, 0),
-        }
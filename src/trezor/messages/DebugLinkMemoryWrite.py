@@ -5,6 +5,12 @@ import protobuf as p
 
 class DebugLinkMemoryWrite(p.MessageType):
     MESSAGE_WIRE_TYPE = 112
+    FIELDS = (
+        None,
+        ('address', p.TYPE_UVARINT, 0),  # 1
+        ('memory', p.TYPE_BYTES, 0),  # 2
+        ('flash', p.TYPE_BOOL, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -15,11 +21,3 @@ class DebugLinkMemoryWrite(p.MessageType):
         self.address = address
         self.memory = memory
         self.flash = flash
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address', p.UVarintType, 0),
-            2: ('memory', p.BytesType, 0),
-            3: ('flash', p.BoolType, 0),
-        }
@@ -2,11 +2,30 @@
 # fmt: off
 import protobuf as p
 
-from .HDNodeType import HDNodeType
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .HDNodeType import HDNodeType
+    except ImportError:
+        pass
 
 
 class DebugLinkState(p.MessageType):
     MESSAGE_WIRE_TYPE = 102
+    FIELDS = (
+        None,
+        ('layout', p.TYPE_BYTES, 0),  # 1
+        ('pin', p.TYPE_UNICODE, 0),  # 2
+        ('matrix', p.TYPE_UNICODE, 0),  # 3
+        ('mnemonic', p.TYPE_UNICODE, 0),  # 4
+        ('node', 'HDNodeType', 0),  # 5
+        ('passphrase_protection', p.TYPE_BOOL, 0),  # 6
+        ('reset_word', p.TYPE_UNICODE, 0),  # 7
+        ('reset_entropy', p.TYPE_BYTES, 0),  # 8
+        ('recovery_fake_word', p.TYPE_UNICODE, 0),  # 9
+        ('recovery_word_pos', p.TYPE_UVARINT, 0),  # 10
+        ('reset_word_pos', p.TYPE_UVARINT, 0),  # 11
+    )
 
     def __init__(
         self,
@@ -33,19 +52,3 @@ class DebugLinkState(p.MessageType):
         self.recovery_fake_word = recovery_fake_word
         self.recovery_word_pos = recovery_word_pos
         self.reset_word_pos = reset_word_pos
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('layout', p.BytesType, 0),
-            2: ('pin', p.UnicodeType, 0),
-            3: ('matrix', p.UnicodeType, 0),
-            4: ('mnemonic', p.UnicodeType, 0),
-            5: ('node', HDNodeType, 0),
-            6: ('passphrase_protection', p.BoolType, 0),
-            7: ('reset_word', p.UnicodeType, 0),
-            8: ('reset_entropy', p.BytesType, 0),
-            9: ('recovery_fake_word', p.UnicodeType, 0),
-            10: ('recovery_word_pos', p.UVarintType, 0),
-            11: ('reset_word_pos', p.UVarintType, 0),
-        }
@@ -11,6 +11,15 @@ if __debug__:
 
 class DebugMoneroDiagAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 547
+    FIELDS = (
+        None,
+        ('ins', p.TYPE_UVARINT, 0),  # 1
+        ('p1', p.TYPE_UVARINT, 0),  # 2
+        ('p2', p.TYPE_UVARINT, 0),  # 3
+        ('pd', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 4
+        ('data1', p.TYPE_BYTES, 0),  # 5
+        ('data2', p.TYPE_BYTES, 0),  # 6
+    )
 
     def __init__(
         self,
@@ -27,14 +36,3 @@ class DebugMoneroDiagAck(p.MessageType):
         self.pd = pd if pd is not None else []
         self.data1 = data1
         self.data2 = data2
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('ins', p.UVarintType, 0),
-            2: ('p1', p.UVarintType, 0),
-            3: ('p2', p.UVarintType, 0),
-            4: ('pd', p.UVarintType, p.FLAG_REPEATED),
-            5: ('data1', p.BytesType, 0),
-            6: ('data2', p.BytesType, 0),
-        }
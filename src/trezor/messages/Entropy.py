@@ -5,15 +5,13 @@ import protobuf as p
 
 class Entropy(p.MessageType):
     MESSAGE_WIRE_TYPE = 10
+    FIELDS = (
+        None,
+        ('entropy', p.TYPE_BYTES, 0),  # 1, required
+    )
 
     def __init__(
         self,
         entropy: bytes = None,
     ) -> None:
         self.entropy = entropy
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('entropy', p.BytesType, 0),  # required
-        }
@@ -5,15 +5,13 @@ import protobuf as p
 
 class EthereumAddress(p.MessageType):
     MESSAGE_WIRE_TYPE = 57
+    FIELDS = (
+        None,
+        ('address', p.TYPE_BYTES, 0),  # 1, required
+    )
 
     def __init__(
         self,
         address: bytes = None,
     ) -> None:
         self.address = address
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address', p.BytesType, 0),  # required
-        }
@@ -5,6 +5,11 @@ import protobuf as p
 
 class EthereumMessageSignature(p.MessageType):
     MESSAGE_WIRE_TYPE = 66
+    FIELDS = (
+        None,
+        ('address', p.TYPE_BYTES, 0),  # 1
+        ('signature', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class EthereumMessageSignature(p.MessageType):
     ) -> None:
         self.address = address
         self.signature = signature
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address', p.BytesType, 0),
-            2: ('signature', p.BytesType, 0),
-        }
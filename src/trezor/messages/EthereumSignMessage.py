@@ -11,6 +11,11 @@ if __debug__:
 
 class EthereumSignMessage(p.MessageType):
     MESSAGE_WIRE_TYPE = 64
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('message', p.TYPE_BYTES, 0),  # 2, required
+    )
 
     def __init__(
         self,
@@ -19,10 +24,3 @@ class EthereumSignMessage(p.MessageType):
     ) -> None:
         self.address_n = address_n if address_n is not None else []
         self.message = message
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('message', p.BytesType, 0),  # required
-        }
@@ -11,6 +11,19 @@ if __debug__:
 
 class EthereumSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 58
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('nonce', p.TYPE_BYTES, 0),  # 2
+        ('gas_price', p.TYPE_BYTES, 0),  # 3
+        ('gas_limit', p.TYPE_BYTES, 0),  # 4
+        ('to', p.TYPE_BYTES, 0),  # 5
+        ('value', p.TYPE_BYTES, 0),  # 6
+        ('data_initial_chunk', p.TYPE_BYTES, p.FLAG_STREAMED),  # 7
+        ('data_length', p.TYPE_UVARINT, 0),  # 8
+        ('chain_id', p.TYPE_UVARINT, 0),  # 9
+        ('tx_type', p.TYPE_UVARINT, 0),  # 10
+    )
 
     def __init__(
         self,
@@ -35,18 +48,3 @@ class EthereumSignTx(p.MessageType):
         self.data_length = data_length
         self.chain_id = chain_id
         self.tx_type = tx_type
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('nonce', p.BytesType, 0),
-            3: ('gas_price', p.BytesType, 0),
-            4: ('gas_limit', p.BytesType, 0),
-            5: ('to', p.BytesType, 0),
-            6: ('value', p.BytesType, 0),
-            7: ('data_initial_chunk', p.BytesType, 0),
-            8: ('data_length', p.UVarintType, 0),
-            9: ('chain_id', p.UVarintType, 0),
-            10: ('tx_type', p.UVarintType, 0),
-        }
@@ -5,15 +5,13 @@ import protobuf as p
 
 class EthereumTxAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 60
+    FIELDS = (
+        None,
+        ('data_chunk', p.TYPE_BYTES, p.FLAG_STREAMED),  # 1
+    )
 
     def __init__(
         self,
         data_chunk: bytes = None,
     ) -> None:
         self.data_chunk = data_chunk
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('data_chunk', p.BytesType, 0),
-        }
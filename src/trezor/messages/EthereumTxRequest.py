@@ -5,6 +5,13 @@ import protobuf as p
 
 class EthereumTxRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 59
+    FIELDS = (
+        None,
+        ('data_length', p.TYPE_UVARINT, 0),  # 1
+        ('signature_v', p.TYPE_UVARINT, 0),  # 2
+        ('signature_r', p.TYPE_BYTES, 0),  # 3
+        ('signature_s', p.TYPE_BYTES, 0),  # 4
+    )
 
     def __init__(
         self,
@@ -17,12 +24,3 @@ class EthereumTxRequest(p.MessageType):
         self.signature_v = signature_v
         self.signature_r = signature_r
         self.signature_s = signature_s
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('data_length', p.UVarintType, 0),
-            2: ('signature_v', p.UVarintType, 0),
-            3: ('signature_r', p.BytesType, 0),
-            4: ('signature_s', p.BytesType, 0),
-        }
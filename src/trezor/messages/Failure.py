@@ -5,6 +5,11 @@ import protobuf as p
 
 class Failure(p.MessageType):
     MESSAGE_WIRE_TYPE = 3
+    FIELDS = (
+        None,
+        ('code', p.TYPE_UVARINT, 0),  # 1
+        ('message', p.TYPE_UNICODE, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class Failure(p.MessageType):
     ) -> None:
         self.code = code
         self.message = message
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('code', p.UVarintType, 0),
-            2: ('message', p.UnicodeType, 0),
-        }
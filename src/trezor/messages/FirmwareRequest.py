@@ -5,6 +5,11 @@ import protobuf as p
 
 class FirmwareRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 8
+    FIELDS = (
+        None,
+        ('offset', p.TYPE_UVARINT, 0),  # 1
+        ('length', p.TYPE_UVARINT, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class FirmwareRequest(p.MessageType):
     ) -> None:
         self.offset = offset
         self.length = length
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('offset', p.UVarintType, 0),
-            2: ('length', p.UVarintType, 0),
-        }
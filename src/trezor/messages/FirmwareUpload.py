@@ -5,6 +5,11 @@ import protobuf as p
 
 class FirmwareUpload(p.MessageType):
     MESSAGE_WIRE_TYPE = 7
+    FIELDS = (
+        None,
+        ('payload', p.TYPE_BYTES, 0),  # 1, required
+        ('hash', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class FirmwareUpload(p.MessageType):
     ) -> None:
         self.payload = payload
         self.hash = hash
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('payload', p.BytesType, 0),  # required
-            2: ('hash', p.BytesType, 0),
-        }
@@ -2,17 +2,24 @@
 # fmt: off
 import protobuf as p
 
-from .MultisigRedeemScriptType import MultisigRedeemScriptType
-
 if __debug__:
     try:
         from typing import List
+        from .MultisigRedeemScriptType import MultisigRedeemScriptType
     except ImportError:
         List = None  # type: ignore
 
 
 class GetAddress(p.MessageType):
     MESSAGE_WIRE_TYPE = 29
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('coin_name', p.TYPE_UNICODE, 0),  # 2, default=Bitcoin
+        ('show_display', p.TYPE_BOOL, 0),  # 3
+        ('multisig', 'MultisigRedeemScriptType', 0),  # 4
+        ('script_type', p.TYPE_UVARINT, 0),  # 5, default=SPENDADDRESS
+    )
 
     def __init__(
         self,
@@ -27,13 +34,3 @@ class GetAddress(p.MessageType):
         self.show_display = show_display
         self.multisig = multisig
         self.script_type = script_type
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
-            3: ('show_display', p.BoolType, 0),
-            4: ('multisig', MultisigRedeemScriptType, 0),
-            5: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
-        }
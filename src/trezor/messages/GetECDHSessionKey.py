@@ -2,11 +2,22 @@
 # fmt: off
 import protobuf as p
 
-from .IdentityType import IdentityType
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .IdentityType import IdentityType
+    except ImportError:
+        pass
 
 
 class GetECDHSessionKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 61
+    FIELDS = (
+        None,
+        ('identity', 'IdentityType', 0),  # 1
+        ('peer_public_key', p.TYPE_BYTES, 0),  # 2
+        ('ecdsa_curve_name', p.TYPE_UNICODE, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -17,11 +28,3 @@ class GetECDHSessionKey(p.MessageType):
         self.identity = identity
         self.peer_public_key = peer_public_key
         self.ecdsa_curve_name = ecdsa_curve_name
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('identity', IdentityType, 0),
-            2: ('peer_public_key', p.BytesType, 0),
-            3: ('ecdsa_curve_name', p.UnicodeType, 0),
-        }
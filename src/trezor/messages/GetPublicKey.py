@@ -11,6 +11,14 @@ if __debug__:
 
 class GetPublicKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 11
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('ecdsa_curve_name', p.TYPE_UNICODE, 0),  # 2
+        ('show_display', p.TYPE_BOOL, 0),  # 3
+        ('coin_name', p.TYPE_UNICODE, 0),  # 4, default=Bitcoin
+        ('script_type', p.TYPE_UVARINT, 0),  # 5, default=SPENDADDRESS
+    )
 
     def __init__(
         self,
@@ -25,13 +33,3 @@ class GetPublicKey(p.MessageType):
         self.show_display = show_display
         self.coin_name = coin_name
         self.script_type = script_type
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('ecdsa_curve_name', p.UnicodeType, 0),
-            3: ('show_display', p.BoolType, 0),
-            4: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
-            5: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
-        }
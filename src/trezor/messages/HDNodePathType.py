@@ -2,16 +2,20 @@
 # fmt: off
 import protobuf as p
 
-from .HDNodeType import HDNodeType
-
 if __debug__:
     try:
         from typing import List
+        from .HDNodeType import HDNodeType
     except ImportError:
         List = None  # type: ignore
 
 
 class HDNodePathType(p.MessageType):
+    FIELDS = (
+        None,
+        ('node', 'HDNodeType', 0),  # 1, required
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 2
+    )
 
     def __init__(
         self,
@@ -20,10 +24,3 @@ class HDNodePathType(p.MessageType):
     ) -> None:
         self.node = node
         self.address_n = address_n if address_n is not None else []
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('node', HDNodeType, 0),  # required
-            2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-        }
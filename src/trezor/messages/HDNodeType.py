@@ -4,6 +4,15 @@ import protobuf as p
 
 
 class HDNodeType(p.MessageType):
+    FIELDS = (
+        None,
+        ('depth', p.TYPE_UVARINT, 0),  # 1, required
+        ('fingerprint', p.TYPE_UVARINT, 0),  # 2, required
+        ('child_num', p.TYPE_UVARINT, 0),  # 3, required
+        ('chain_code', p.TYPE_BYTES, 0),  # 4, required
+        ('private_key', p.TYPE_BYTES, 0),  # 5
+        ('public_key', p.TYPE_BYTES, 0),  # 6
+    )
 
     def __init__(
         self,
@@ -20,14 +29,3 @@ class HDNodeType(p.MessageType):
         self.chain_code = chain_code
         self.private_key = private_key
         self.public_key = public_key
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('depth', p.UVarintType, 0),  # required
-            2: ('fingerprint', p.UVarintType, 0),  # required
-            3: ('child_num', p.UVarintType, 0),  # required
-            4: ('chain_code', p.BytesType, 0),  # required
-            5: ('private_key', p.BytesType, 0),
-            6: ('public_key', p.BytesType, 0),
-        }
@@ -4,6 +4,15 @@ import protobuf as p
 
 
 class IdentityType(p.MessageType):
+    FIELDS = (
+        None,
+        ('proto', p.TYPE_UNICODE, 0),  # 1
+        ('user', p.TYPE_UNICODE, 0),  # 2
+        ('host', p.TYPE_UNICODE, 0),  # 3
+        ('port', p.TYPE_UNICODE, 0),  # 4
+        ('path', p.TYPE_UNICODE, 0),  # 5
+        ('index', p.TYPE_UVARINT, 0),  # 6, default=0
+    )
 
     def __init__(
         self,
@@ -20,14 +29,3 @@ class IdentityType(p.MessageType):
         self.port = port
         self.path = path
         self.index = index
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('proto', p.UnicodeType, 0),
-            2: ('user', p.UnicodeType, 0),
-            3: ('host', p.UnicodeType, 0),
-            4: ('port', p.UnicodeType, 0),
-            5: ('path', p.UnicodeType, 0),
-            6: ('index', p.UVarintType, 0),  # default=0
-        }
@@ -5,6 +5,11 @@ import protobuf as p
 
 class Initialize(p.MessageType):
     MESSAGE_WIRE_TYPE = 0
+    FIELDS = (
+        None,
+        ('state', p.TYPE_BYTES, 0),  # 1
+        ('skip_passphrase', p.TYPE_BOOL, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class Initialize(p.MessageType):
     ) -> None:
         self.state = state
         self.skip_passphrase = skip_passphrase
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('state', p.BytesType, 0),
-            2: ('skip_passphrase', p.BoolType, 0),
-        }
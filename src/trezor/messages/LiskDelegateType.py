@@ -4,15 +4,13 @@ import protobuf as p
 
 
 class LiskDelegateType(p.MessageType):
+    FIELDS = (
+        None,
+        ('username', p.TYPE_UNICODE, 0),  # 1
+    )
 
     def __init__(
         self,
         username: str = None,
     ) -> None:
         self.username = username
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('username', p.UnicodeType, 0),
-        }
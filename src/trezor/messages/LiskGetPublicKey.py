@@ -11,6 +11,11 @@ if __debug__:
 
 class LiskGetPublicKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 121
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('show_display', p.TYPE_BOOL, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -19,10 +24,3 @@ class LiskGetPublicKey(p.MessageType):
     ) -> None:
         self.address_n = address_n if address_n is not None else []
         self.show_display = show_display
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('show_display', p.BoolType, 0),
-        }
@@ -5,6 +5,11 @@ import protobuf as p
 
 class LiskMessageSignature(p.MessageType):
     MESSAGE_WIRE_TYPE = 119
+    FIELDS = (
+        None,
+        ('public_key', p.TYPE_BYTES, 0),  # 1
+        ('signature', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class LiskMessageSignature(p.MessageType):
     ) -> None:
         self.public_key = public_key
         self.signature = signature
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('public_key', p.BytesType, 0),
-            2: ('signature', p.BytesType, 0),
-        }
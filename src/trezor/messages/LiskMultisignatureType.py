@@ -10,6 +10,12 @@ if __debug__:
 
 
 class LiskMultisignatureType(p.MessageType):
+    FIELDS = (
+        None,
+        ('min', p.TYPE_UVARINT, 0),  # 1
+        ('life_time', p.TYPE_UVARINT, 0),  # 2
+        ('keys_group', p.TYPE_UNICODE, p.FLAG_REPEATED),  # 3
+    )
 
     def __init__(
         self,
@@ -20,11 +26,3 @@ class LiskMultisignatureType(p.MessageType):
         self.min = min
         self.life_time = life_time
         self.keys_group = keys_group if keys_group is not None else []
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('min', p.UVarintType, 0),
-            2: ('life_time', p.UVarintType, 0),
-            3: ('keys_group', p.UnicodeType, p.FLAG_REPEATED),
-        }
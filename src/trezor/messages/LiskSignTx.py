@@ -2,17 +2,21 @@
 # fmt: off
 import protobuf as p
 
-from .LiskTransactionCommon import LiskTransactionCommon
-
 if __debug__:
     try:
         from typing import List
+        from .LiskTransactionCommon import LiskTransactionCommon
     except ImportError:
         List = None  # type: ignore
 
 
 class LiskSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 116
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('transaction', 'LiskTransactionCommon', 0),  # 2
+    )
 
     def __init__(
         self,
@@ -21,10 +25,3 @@ class LiskSignTx(p.MessageType):
     ) -> None:
         self.address_n = address_n if address_n is not None else []
         self.transaction = transaction
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('transaction', LiskTransactionCommon, 0),
-        }
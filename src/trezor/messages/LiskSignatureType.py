@@ -4,15 +4,13 @@ import protobuf as p
 
 
 class LiskSignatureType(p.MessageType):
+    FIELDS = (
+        None,
+        ('public_key', p.TYPE_BYTES, 0),  # 1
+    )
 
     def __init__(
         self,
         public_key: bytes = None,
     ) -> None:
         self.public_key = public_key
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('public_key', p.BytesType, 0),
-        }
@@ -5,15 +5,13 @@ import protobuf as p
 
 class LiskSignedTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 117
+    FIELDS = (
+        None,
+        ('signature', p.TYPE_BYTES, 0),  # 1
+    )
 
     def __init__(
         self,
         signature: bytes = None,
     ) -> None:
         self.signature = signature
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('signature', p.BytesType, 0),
-        }
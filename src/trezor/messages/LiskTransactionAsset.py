@@ -2,18 +2,25 @@
 # fmt: off
 import protobuf as p
 
-from .LiskDelegateType import LiskDelegateType
-from .LiskMultisignatureType import LiskMultisignatureType
-from .LiskSignatureType import LiskSignatureType
-
 if __debug__:
     try:
         from typing import List
+        from .LiskDelegateType import LiskDelegateType
+        from .LiskMultisignatureType import LiskMultisignatureType
+        from .LiskSignatureType import LiskSignatureType
     except ImportError:
         List = None  # type: ignore
 
 
 class LiskTransactionAsset(p.MessageType):
+    FIELDS = (
+        None,
+        ('signature', 'LiskSignatureType', 0),  # 1
+        ('delegate', 'LiskDelegateType', 0),  # 2
+        ('votes', p.TYPE_UNICODE, p.FLAG_REPEATED),  # 3
+        ('multisignature', 'LiskMultisignatureType', 0),  # 4
+        ('data', p.TYPE_UNICODE, 0),  # 5
+    )
 
     def __init__(
         self,
@@ -28,13 +35,3 @@ class LiskTransactionAsset(p.MessageType):
         self.votes = votes if votes is not None else []
         self.multisignature = multisignature
         self.data = data
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('signature', LiskSignatureType, 0),
-            2: ('delegate', LiskDelegateType, 0),
-            3: ('votes', p.UnicodeType, p.FLAG_REPEATED),
-            4: ('multisignature', LiskMultisignatureType, 0),
-            5: ('data', p.UnicodeType, 0),
-        }
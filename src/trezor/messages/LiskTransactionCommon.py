@@ -2,10 +2,27 @@
 # fmt: off
 import protobuf as p
 
-from .LiskTransactionAsset import LiskTransactionAsset
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .LiskTransactionAsset import LiskTransactionAsset
+    except ImportError:
+        pass
 
 
 class LiskTransactionCommon(p.MessageType):
+    FIELDS = (
+        None,
+        ('type', p.TYPE_UVARINT, 0),  # 1
+        ('amount', p.TYPE_UVARINT, 0),  # 2, default=0
+        ('fee', p.TYPE_UVARINT, 0),  # 3
+        ('recipient_id', p.TYPE_UNICODE, 0),  # 4
+        ('sender_public_key', p.TYPE_BYTES, 0),  # 5
+        ('requester_public_key', p.TYPE_BYTES, 0),  # 6
+        ('signature', p.TYPE_BYTES, 0),  # 7
+        ('timestamp', p.TYPE_UVARINT, 0),  # 8
+        ('asset', 'LiskTransactionAsset', 0),  # 9
+    )
 
     def __init__(
         self,
@@ -28,17 +45,3 @@ class LiskTransactionCommon(p.MessageType):
         self.signature = signature
         self.timestamp = timestamp
         self.asset = asset
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('type', p.UVarintType, 0),
-            2: ('amount', p.UVarintType, 0),  # default=0
-            3: ('fee', p.UVarintType, 0),
-            4: ('recipient_id', p.UnicodeType, 0),
-            5: ('sender_public_key', p.BytesType, 0),
-            6: ('requester_public_key', p.BytesType, 0),
-            7: ('signature', p.BytesType, 0),
-            8: ('timestamp', p.UVarintType, 0),
-            9: ('asset', LiskTransactionAsset, 0),
-        }
@@ -5,6 +5,12 @@ import protobuf as p
 
 class LiskVerifyMessage(p.MessageType):
     MESSAGE_WIRE_TYPE = 120
+    FIELDS = (
+        None,
+        ('public_key', p.TYPE_BYTES, 0),  # 1
+        ('signature', p.TYPE_BYTES, 0),  # 2
+        ('message', p.TYPE_BYTES, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -15,11 +21,3 @@ class LiskVerifyMessage(p.MessageType):
         self.public_key = public_key
         self.signature = signature
         self.message = message
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('public_key', p.BytesType, 0),
-            2: ('signature', p.BytesType, 0),
-            3: ('message', p.BytesType, 0),
-        }
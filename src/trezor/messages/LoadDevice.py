@@ -2,11 +2,27 @@
 # fmt: off
 import protobuf as p
 
-from .HDNodeType import HDNodeType
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .HDNodeType import HDNodeType
+    except ImportError:
+        pass
 
 
 class LoadDevice(p.MessageType):
     MESSAGE_WIRE_TYPE = 13
+    FIELDS = (
+        None,
+        ('mnemonic', p.TYPE_UNICODE, 0),  # 1
+        ('node', 'HDNodeType', 0),  # 2
+        ('pin', p.TYPE_UNICODE, 0),  # 3
+        ('passphrase_protection', p.TYPE_BOOL, 0),  # 4
+        ('language', p.TYPE_UNICODE, 0),  # 5, default=english
+        ('label', p.TYPE_UNICODE, 0),  # 6
+        ('skip_checksum', p.TYPE_BOOL, 0),  # 7
+        ('u2f_counter', p.TYPE_UVARINT, 0),  # 8
+    )
 
     def __init__(
         self,
@@ -27,16 +43,3 @@ class LoadDevice(p.MessageType):
         self.label = label
         self.skip_checksum = skip_checksum
         self.u2f_counter = u2f_counter
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('mnemonic', p.UnicodeType, 0),
-            2: ('node', HDNodeType, 0),
-            3: ('pin', p.UnicodeType, 0),
-            4: ('passphrase_protection', p.BoolType, 0),
-            5: ('language', p.UnicodeType, 0),  # default=english
-            6: ('label', p.UnicodeType, 0),
-            7: ('skip_checksum', p.BoolType, 0),
-            8: ('u2f_counter', p.UVarintType, 0),
-        }
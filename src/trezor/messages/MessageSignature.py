@@ -5,6 +5,11 @@ import protobuf as p
 
 class MessageSignature(p.MessageType):
     MESSAGE_WIRE_TYPE = 40
+    FIELDS = (
+        None,
+        ('address', p.TYPE_UNICODE, 0),  # 1
+        ('signature', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class MessageSignature(p.MessageType):
     ) -> None:
         self.address = address
         self.signature = signature
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('signature', p.BytesType, 0),
-        }
@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class MoneroAccountPublicAddress(p.MessageType):
+    FIELDS = (
+        None,
+        ('spend_public_key', p.TYPE_BYTES, 0),  # 1
+        ('view_public_key', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -12,10 +17,3 @@ class MoneroAccountPublicAddress(p.MessageType):
     ) -> None:
         self.spend_public_key = spend_public_key
         self.view_public_key = view_public_key
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('spend_public_key', p.BytesType, 0),
-            2: ('view_public_key', p.BytesType, 0),
-        }
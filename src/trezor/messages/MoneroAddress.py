@@ -5,15 +5,13 @@ import protobuf as p
 
 class MoneroAddress(p.MessageType):
     MESSAGE_WIRE_TYPE = 541
+    FIELDS = (
+        None,
+        ('address', p.TYPE_BYTES, 0),  # 1
+    )
 
     def __init__(
         self,
         address: bytes = None,
     ) -> None:
         self.address = address
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address', p.BytesType, 0),
-        }
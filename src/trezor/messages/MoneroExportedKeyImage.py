@@ -4,6 +4,12 @@ import protobuf as p
 
 
 class MoneroExportedKeyImage(p.MessageType):
+    FIELDS = (
+        None,
+        ('iv', p.TYPE_BYTES, 0),  # 1
+        ('tag', p.TYPE_BYTES, 0),  # 2
+        ('blob', p.TYPE_BYTES, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -14,11 +20,3 @@ class MoneroExportedKeyImage(p.MessageType):
         self.iv = iv
         self.tag = tag
         self.blob = blob
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('iv', p.BytesType, 0),
-            2: ('tag', p.BytesType, 0),
-            3: ('blob', p.BytesType, 0),
-        }
@@ -11,6 +11,14 @@ if __debug__:
 
 class MoneroGetAddress(p.MessageType):
     MESSAGE_WIRE_TYPE = 540
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('show_display', p.TYPE_BOOL, 0),  # 2
+        ('network_type', p.TYPE_UVARINT, 0),  # 3
+        ('account', p.TYPE_UVARINT, 0),  # 4
+        ('minor', p.TYPE_UVARINT, 0),  # 5
+    )
 
     def __init__(
         self,
@@ -25,13 +33,3 @@ class MoneroGetAddress(p.MessageType):
         self.network_type = network_type
         self.account = account
         self.minor = minor
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('show_display', p.BoolType, 0),
-            3: ('network_type', p.UVarintType, 0),
-            4: ('account', p.UVarintType, 0),
-            5: ('minor', p.UVarintType, 0),
-        }
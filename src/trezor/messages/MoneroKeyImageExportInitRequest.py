@@ -2,17 +2,24 @@
 # fmt: off
 import protobuf as p
 
-from .MoneroSubAddressIndicesList import MoneroSubAddressIndicesList
-
 if __debug__:
     try:
         from typing import List
+        from .MoneroSubAddressIndicesList import MoneroSubAddressIndicesList
     except ImportError:
         List = None  # type: ignore
 
 
 class MoneroKeyImageExportInitRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 530
+    FIELDS = (
+        None,
+        ('num', p.TYPE_UVARINT, 0),  # 1
+        ('hash', p.TYPE_BYTES, 0),  # 2
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 3
+        ('network_type', p.TYPE_UVARINT, 0),  # 4
+        ('subs', 'MoneroSubAddressIndicesList', p.FLAG_REPEATED),  # 5
+    )
 
     def __init__(
         self,
@@ -27,13 +34,3 @@ class MoneroKeyImageExportInitRequest(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.network_type = network_type
         self.subs = subs if subs is not None else []
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('num', p.UVarintType, 0),
-            2: ('hash', p.BytesType, 0),
-            3: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            4: ('network_type', p.UVarintType, 0),
-            5: ('subs', MoneroSubAddressIndicesList, p.FLAG_REPEATED),
-        }
@@ -5,15 +5,13 @@ import protobuf as p
 
 class MoneroKeyImageSyncFinalAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 535
+    FIELDS = (
+        None,
+        ('enc_key', p.TYPE_BYTES, 0),  # 1
+    )
 
     def __init__(
         self,
         enc_key: bytes = None,
     ) -> None:
         self.enc_key = enc_key
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('enc_key', p.BytesType, 0),
-        }
@@ -4,6 +4,13 @@ import protobuf as p
 
 
 class MoneroMultisigKLRki(p.MessageType):
+    FIELDS = (
+        None,
+        ('K', p.TYPE_BYTES, 0),  # 1
+        ('L', p.TYPE_BYTES, 0),  # 2
+        ('R', p.TYPE_BYTES, 0),  # 3
+        ('ki', p.TYPE_BYTES, 0),  # 4
+    )
 
     def __init__(
         self,
@@ -16,12 +23,3 @@ class MoneroMultisigKLRki(p.MessageType):
         self.L = L
         self.R = R
         self.ki = ki
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('K', p.BytesType, 0),
-            2: ('L', p.BytesType, 0),
-            3: ('R', p.BytesType, 0),
-            4: ('ki', p.BytesType, 0),
-        }
@@ -2,10 +2,20 @@
 # fmt: off
 import protobuf as p
 
-from .MoneroRctKey import MoneroRctKey
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .MoneroRctKey import MoneroRctKey
+    except ImportError:
+        pass
 
 
 class MoneroOutputEntry(p.MessageType):
+    FIELDS = (
+        None,
+        ('idx', p.TYPE_UVARINT, 0),  # 1
+        ('key', 'MoneroRctKey', 0),  # 2
+    )
 
     def __init__(
         self,
@@ -14,10 +24,3 @@ class MoneroOutputEntry(p.MessageType):
     ) -> None:
         self.idx = idx
         self.key = key
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('idx', p.UVarintType, 0),
-            2: ('key', MoneroRctKey, 0),
-        }
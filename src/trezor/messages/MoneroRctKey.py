@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class MoneroRctKey(p.MessageType):
+    FIELDS = (
+        None,
+        ('dest', p.TYPE_BYTES, 0),  # 1
+        ('mask', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -12,10 +17,3 @@ class MoneroRctKey(p.MessageType):
     ) -> None:
         self.dest = dest
         self.mask = mask
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('dest', p.BytesType, 0),
-            2: ('mask', p.BytesType, 0),
-        }
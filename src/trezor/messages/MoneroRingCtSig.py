@@ -4,6 +4,12 @@ import protobuf as p
 
 
 class MoneroRingCtSig(p.MessageType):
+    FIELDS = (
+        None,
+        ('txn_fee', p.TYPE_UVARINT, 0),  # 1
+        ('message', p.TYPE_BYTES, 0),  # 2
+        ('rv_type', p.TYPE_UVARINT, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -14,11 +20,3 @@ class MoneroRingCtSig(p.MessageType):
         self.txn_fee = txn_fee
         self.message = message
         self.rv_type = rv_type
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('txn_fee', p.UVarintType, 0),
-            2: ('message', p.BytesType, 0),
-            3: ('rv_type', p.UVarintType, 0),
-        }
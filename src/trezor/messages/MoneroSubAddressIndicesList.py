@@ -10,6 +10,11 @@ if __debug__:
 
 
 class MoneroSubAddressIndicesList(p.MessageType):
+    FIELDS = (
+        None,
+        ('account', p.TYPE_UVARINT, 0),  # 1
+        ('minor_indices', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 2
+    )
 
     def __init__(
         self,
@@ -18,10 +23,3 @@ class MoneroSubAddressIndicesList(p.MessageType):
     ) -> None:
         self.account = account
         self.minor_indices = minor_indices if minor_indices is not None else []
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('account', p.UVarintType, 0),
-            2: ('minor_indices', p.UVarintType, p.FLAG_REPEATED),
-        }
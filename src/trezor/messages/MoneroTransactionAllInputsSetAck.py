@@ -2,20 +2,23 @@
 # fmt: off
 import protobuf as p
 
-from .MoneroTransactionRsigData import MoneroTransactionRsigData
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .MoneroTransactionRsigData import MoneroTransactionRsigData
+    except ImportError:
+        pass
 
 
 class MoneroTransactionAllInputsSetAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 510
+    FIELDS = (
+        None,
+        ('rsig_data', 'MoneroTransactionRsigData', 0),  # 1
+    )
 
     def __init__(
         self,
         rsig_data: MoneroTransactionRsigData = None,
     ) -> None:
         self.rsig_data = rsig_data
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('rsig_data', MoneroTransactionRsigData, 0),
-        }
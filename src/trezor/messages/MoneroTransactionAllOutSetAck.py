@@ -2,12 +2,24 @@
 # fmt: off
 import protobuf as p
 
-from .MoneroRingCtSig import MoneroRingCtSig
-from .MoneroTransactionRsigData import MoneroTransactionRsigData
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .MoneroRingCtSig import MoneroRingCtSig
+        from .MoneroTransactionRsigData import MoneroTransactionRsigData
+    except ImportError:
+        pass
 
 
 class MoneroTransactionAllOutSetAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 514
+    FIELDS = (
+        None,
+        ('extra', p.TYPE_BYTES, 0),  # 1
+        ('tx_prefix_hash', p.TYPE_BYTES, 0),  # 2
+        ('rsig_data', 'MoneroTransactionRsigData', 0),  # 3
+        ('rv', 'MoneroRingCtSig', 0),  # 4
+    )
 
     def __init__(
         self,
@@ -20,12 +32,3 @@ class MoneroTransactionAllOutSetAck(p.MessageType):
         self.tx_prefix_hash = tx_prefix_hash
         self.rsig_data = rsig_data
         self.rv = rv
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('extra', p.BytesType, 0),
-            2: ('tx_prefix_hash', p.BytesType, 0),
-            3: ('rsig_data', MoneroTransactionRsigData, 0),
-            4: ('rv', MoneroRingCtSig, 0),
-        }
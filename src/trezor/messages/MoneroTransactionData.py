@@ -2,17 +2,34 @@
 # fmt: off
 import protobuf as p
 
-from .MoneroTransactionDestinationEntry import MoneroTransactionDestinationEntry
-from .MoneroTransactionRsigData import MoneroTransactionRsigData
-
 if __debug__:
     try:
         from typing import List
+        from .MoneroTransactionDestinationEntry import MoneroTransactionDestinationEntry
+        from .MoneroTransactionRsigData import MoneroTransactionRsigData
     except ImportError:
         List = None  # type: ignore
 
 
 class MoneroTransactionData(p.MessageType):
+    FIELDS = (
+        None,
+        ('version', p.TYPE_UVARINT, 0),  # 1
+        ('payment_id', p.TYPE_BYTES, 0),  # 2
+        ('unlock_time', p.TYPE_UVARINT, 0),  # 3
+        ('outputs', 'MoneroTransactionDestinationEntry', p.FLAG_REPEATED),  # 4
+        ('change_dts', 'MoneroTransactionDestinationEntry', 0),  # 5
+        ('num_inputs', p.TYPE_UVARINT, 0),  # 6
+        ('mixin', p.TYPE_UVARINT, 0),  # 7
+        ('fee', p.TYPE_UVARINT, 0),  # 8
+        ('account', p.TYPE_UVARINT, 0),  # 9
+        ('minor_indices', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 10
+        ('is_multisig', p.TYPE_BOOL, 0),  # 11
+        ('exp_tx_prefix_hash', p.TYPE_BYTES, 0),  # 12
+        ('use_tx_keys', p.TYPE_BYTES, p.FLAG_REPEATED),  # 13
+        ('rsig_data', 'MoneroTransactionRsigData', 0),  # 14
+        ('integrated_indices', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 15
+    )
 
     def __init__(
         self,
@@ -47,23 +64,3 @@ class MoneroTransactionData(p.MessageType):
         self.use_tx_keys = use_tx_keys if use_tx_keys is not None else []
         self.rsig_data = rsig_data
         self.integrated_indices = integrated_indices if integrated_indices is not None else []
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('version', p.UVarintType, 0),
-            2: ('payment_id', p.BytesType, 0),
-            3: ('unlock_time', p.UVarintType, 0),
-            4: ('outputs', MoneroTransactionDestinationEntry, p.FLAG_REPEATED),
-            5: ('change_dts', MoneroTransactionDestinationEntry, 0),
-            6: ('num_inputs', p.UVarintType, 0),
-            7: ('mixin', p.UVarintType, 0),
-            8: ('fee', p.UVarintType, 0),
-            9: ('account', p.UVarintType, 0),
-            10: ('minor_indices', p.UVarintType, p.FLAG_REPEATED),
-            11: ('is_multisig', p.BoolType, 0),
-            12: ('exp_tx_prefix_hash', p.BytesType, 0),
-            13: ('use_tx_keys', p.BytesType, p.FLAG_REPEATED),
-            14: ('rsig_data', MoneroTransactionRsigData, 0),
-            15: ('integrated_indices', p.UVarintType, p.FLAG_REPEATED),
-        }
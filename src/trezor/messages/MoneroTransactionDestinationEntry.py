@@ -2,10 +2,21 @@
 # fmt: off
 import protobuf as p
 
-from .MoneroAccountPublicAddress import MoneroAccountPublicAddress
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .MoneroAccountPublicAddress import MoneroAccountPublicAddress
+    except ImportError:
+        pass
 
 
 class MoneroTransactionDestinationEntry(p.MessageType):
+    FIELDS = (
+        None,
+        ('amount', p.TYPE_UVARINT, 0),  # 1
+        ('addr', 'MoneroAccountPublicAddress', 0),  # 2
+        ('is_subaddress', p.TYPE_BOOL, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -16,11 +27,3 @@ class MoneroTransactionDestinationEntry(p.MessageType):
         self.amount = amount
         self.addr = addr
         self.is_subaddress = is_subaddress
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('amount', p.UVarintType, 0),
-            2: ('addr', MoneroAccountPublicAddress, 0),
-            3: ('is_subaddress', p.BoolType, 0),
-        }
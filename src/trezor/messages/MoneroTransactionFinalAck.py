@@ -5,6 +5,13 @@ import protobuf as p
 
 class MoneroTransactionFinalAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 520
+    FIELDS = (
+        None,
+        ('cout_key', p.TYPE_BYTES, 0),  # 1
+        ('salt', p.TYPE_BYTES, 0),  # 2
+        ('rand_mult', p.TYPE_BYTES, 0),  # 3
+        ('tx_enc_keys', p.TYPE_BYTES, 0),  # 4
+    )
 
     def __init__(
         self,
@@ -17,12 +24,3 @@ class MoneroTransactionFinalAck(p.MessageType):
         self.salt = salt
         self.rand_mult = rand_mult
         self.tx_enc_keys = tx_enc_keys
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('cout_key', p.BytesType, 0),
-            2: ('salt', p.BytesType, 0),
-            3: ('rand_mult', p.BytesType, 0),
-            4: ('tx_enc_keys', p.BytesType, 0),
-        }
@@ -2,17 +2,26 @@
 # fmt: off
 import protobuf as p
 
-from .MoneroTransactionRsigData import MoneroTransactionRsigData
-
 if __debug__:
     try:
         from typing import List
+        from .MoneroTransactionRsigData import MoneroTransactionRsigData
     except ImportError:
         List = None  # type: ignore
 
 
 class MoneroTransactionInitAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 502
+    FIELDS = (
+        None,
+        ('version', p.TYPE_UVARINT, 0),  # 1
+        ('status', p.TYPE_UVARINT, 0),  # 2
+        ('in_memory', p.TYPE_BOOL, 0),  # 3
+        ('hmacs', p.TYPE_BYTES, p.FLAG_REPEATED),  # 4
+        ('many_inputs', p.TYPE_BOOL, 0),  # 5
+        ('many_outputs', p.TYPE_BOOL, 0),  # 6
+        ('rsig_data', 'MoneroTransactionRsigData', 0),  # 7
+    )
 
     def __init__(
         self,
@@ -31,15 +40,3 @@ class MoneroTransactionInitAck(p.MessageType):
         self.many_inputs = many_inputs
         self.many_outputs = many_outputs
         self.rsig_data = rsig_data
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('version', p.UVarintType, 0),
-            2: ('status', p.UVarintType, 0),
-            3: ('in_memory', p.BoolType, 0),
-            4: ('hmacs', p.BytesType, p.FLAG_REPEATED),
-            5: ('many_inputs', p.BoolType, 0),
-            6: ('many_outputs', p.BoolType, 0),
-            7: ('rsig_data', MoneroTransactionRsigData, 0),
-        }
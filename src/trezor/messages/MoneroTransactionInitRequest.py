@@ -2,17 +2,23 @@
 # fmt: off
 import protobuf as p
 
-from .MoneroTransactionData import MoneroTransactionData
-
 if __debug__:
     try:
         from typing import List
+        from .MoneroTransactionData import MoneroTransactionData
     except ImportError:
         List = None  # type: ignore
 
 
 class MoneroTransactionInitRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 501
+    FIELDS = (
+        None,
+        ('version', p.TYPE_UVARINT, 0),  # 1
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 2
+        ('network_type', p.TYPE_UVARINT, 0),  # 3
+        ('tsx_data', 'MoneroTransactionData', 0),  # 4
+    )
 
     def __init__(
         self,
@@ -25,12 +31,3 @@ class MoneroTransactionInitRequest(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.network_type = network_type
         self.tsx_data = tsx_data
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('version', p.UVarintType, 0),
-            2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            3: ('network_type', p.UVarintType, 0),
-            4: ('tsx_data', MoneroTransactionData, 0),
-        }
@@ -2,11 +2,24 @@
 # fmt: off
 import protobuf as p
 
-from .MoneroTransactionSourceEntry import MoneroTransactionSourceEntry
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .MoneroTransactionSourceEntry import MoneroTransactionSourceEntry
+    except ImportError:
+        pass
 
 
 class MoneroTransactionInputViniRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 507
+    FIELDS = (
+        None,
+        ('src_entr', 'MoneroTransactionSourceEntry', 0),  # 1
+        ('vini', p.TYPE_BYTES, 0),  # 2
+        ('vini_hmac', p.TYPE_BYTES, 0),  # 3
+        ('pseudo_out', p.TYPE_BYTES, 0),  # 4
+        ('pseudo_out_hmac', p.TYPE_BYTES, 0),  # 5
+    )
 
     def __init__(
         self,
@@ -21,13 +34,3 @@ class MoneroTransactionInputViniRequest(p.MessageType):
         self.vini_hmac = vini_hmac
         self.pseudo_out = pseudo_out
         self.pseudo_out_hmac = pseudo_out_hmac
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('src_entr', MoneroTransactionSourceEntry, 0),
-            2: ('vini', p.BytesType, 0),
-            3: ('vini_hmac', p.BytesType, 0),
-            4: ('pseudo_out', p.BytesType, 0),
-            5: ('pseudo_out_hmac', p.BytesType, 0),
-        }
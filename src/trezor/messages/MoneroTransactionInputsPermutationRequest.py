@@ -11,15 +11,13 @@ if __debug__:
 
 class MoneroTransactionInputsPermutationRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 505
+    FIELDS = (
+        None,
+        ('perm', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+    )
 
     def __init__(
         self,
         perm: List[int] = None,
     ) -> None:
         self.perm = perm if perm is not None else []
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('perm', p.UVarintType, p.FLAG_REPEATED),
-        }
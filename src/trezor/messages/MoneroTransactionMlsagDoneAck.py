@@ -5,15 +5,13 @@ import protobuf as p
 
 class MoneroTransactionMlsagDoneAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 516
+    FIELDS = (
+        None,
+        ('full_message_hash', p.TYPE_BYTES, 0),  # 1
+    )
 
     def __init__(
         self,
         full_message_hash: bytes = None,
     ) -> None:
         self.full_message_hash = full_message_hash
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('full_message_hash', p.BytesType, 0),
-        }
@@ -2,16 +2,30 @@
 # fmt: off
 import protobuf as p
 
-from .MoneroTransactionDestinationEntry import MoneroTransactionDestinationEntry
-
 if __debug__:
     try:
         from typing import List
+        from .MoneroTransactionDestinationEntry import MoneroTransactionDestinationEntry
     except ImportError:
         List = None  # type: ignore
 
 
 class MoneroTransactionRsigData(p.MessageType):
+    FIELDS = (
+        None,
+        ('version', p.TYPE_UVARINT, 0),  # 1
+        ('rsig_type', p.TYPE_UVARINT, 0),  # 2
+        ('offload_type', p.TYPE_UVARINT, 0),  # 3
+        ('grouping', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 4
+        ('step', p.TYPE_UVARINT, 0),  # 5
+        ('operation', p.TYPE_UVARINT, 0),  # 6
+        ('seed', p.TYPE_BYTES, 0),  # 7
+        ('mask', p.TYPE_BYTES, 0),  # 8
+        ('amount', p.TYPE_BYTES, 0),  # 9
+        ('rsig', p.TYPE_BYTES, 0),  # 10
+        ('rsig_parts', p.TYPE_BYTES, p.FLAG_REPEATED),  # 11
+        ('outputs', 'MoneroTransactionDestinationEntry', p.FLAG_REPEATED),  # 12
+    )
 
     def __init__(
         self,
@@ -40,20 +54,3 @@ class MoneroTransactionRsigData(p.MessageType):
         self.rsig = rsig
         self.rsig_parts = rsig_parts if rsig_parts is not None else []
         self.outputs = outputs if outputs is not None else []
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('version', p.UVarintType, 0),
-            2: ('rsig_type', p.UVarintType, 0),
-            3: ('offload_type', p.UVarintType, 0),
-            4: ('grouping', p.UVarintType, p.FLAG_REPEATED),
-            5: ('step', p.UVarintType, 0),
-            6: ('operation', p.UVarintType, 0),
-            7: ('seed', p.BytesType, 0),
-            8: ('mask', p.BytesType, 0),
-            9: ('amount', p.BytesType, 0),
-            10: ('rsig', p.BytesType, 0),
-            11: ('rsig_parts', p.BytesType, p.FLAG_REPEATED),
-            12: ('outputs', MoneroTransactionDestinationEntry, p.FLAG_REPEATED),
-        }
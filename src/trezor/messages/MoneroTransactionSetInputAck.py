@@ -5,6 +5,15 @@ import protobuf as p
 
 class MoneroTransactionSetInputAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 504
+    FIELDS = (
+        None,
+        ('vini', p.TYPE_BYTES, 0),  # 1
+        ('vini_hmac', p.TYPE_BYTES, 0),  # 2
+        ('pseudo_out', p.TYPE_BYTES, 0),  # 3
+        ('pseudo_out_hmac', p.TYPE_BYTES, 0),  # 4
+        ('alpha_enc', p.TYPE_BYTES, 0),  # 5
+        ('spend_enc', p.TYPE_BYTES, 0),  # 6
+    )
 
     def __init__(
         self,
@@ -21,14 +30,3 @@ class MoneroTransactionSetInputAck(p.MessageType):
         self.pseudo_out_hmac = pseudo_out_hmac
         self.alpha_enc = alpha_enc
         self.spend_enc = spend_enc
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('vini', p.BytesType, 0),
-            2: ('vini_hmac', p.BytesType, 0),
-            3: ('pseudo_out', p.BytesType, 0),
-            4: ('pseudo_out_hmac', p.BytesType, 0),
-            5: ('alpha_enc', p.BytesType, 0),
-            6: ('spend_enc', p.BytesType, 0),
-        }
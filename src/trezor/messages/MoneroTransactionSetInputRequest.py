@@ -2,11 +2,21 @@
 # fmt: off
 import protobuf as p
 
-from .MoneroTransactionSourceEntry import MoneroTransactionSourceEntry
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .MoneroTransactionSourceEntry import MoneroTransactionSourceEntry
+    except ImportError:
+        pass
 
 
 class MoneroTransactionSetInputRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 503
+    FIELDS = (
+        None,
+        ('version', p.TYPE_UVARINT, 0),  # 1
+        ('src_entr', 'MoneroTransactionSourceEntry', 0),  # 2
+    )
 
     def __init__(
         self,
@@ -15,10 +25,3 @@ class MoneroTransactionSetInputRequest(p.MessageType):
     ) -> None:
         self.version = version
         self.src_entr = src_entr
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('version', p.UVarintType, 0),
-            2: ('src_entr', MoneroTransactionSourceEntry, 0),
-        }
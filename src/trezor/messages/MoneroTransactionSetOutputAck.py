@@ -2,11 +2,24 @@
 # fmt: off
 import protobuf as p
 
-from .MoneroTransactionRsigData import MoneroTransactionRsigData
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .MoneroTransactionRsigData import MoneroTransactionRsigData
+    except ImportError:
+        pass
 
 
 class MoneroTransactionSetOutputAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 512
+    FIELDS = (
+        None,
+        ('tx_out', p.TYPE_BYTES, 0),  # 1
+        ('vouti_hmac', p.TYPE_BYTES, 0),  # 2
+        ('rsig_data', 'MoneroTransactionRsigData', 0),  # 3
+        ('out_pk', p.TYPE_BYTES, 0),  # 4
+        ('ecdh_info', p.TYPE_BYTES, 0),  # 5
+    )
 
     def __init__(
         self,
@@ -21,13 +34,3 @@ class MoneroTransactionSetOutputAck(p.MessageType):
         self.rsig_data = rsig_data
         self.out_pk = out_pk
         self.ecdh_info = ecdh_info
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('tx_out', p.BytesType, 0),
-            2: ('vouti_hmac', p.BytesType, 0),
-            3: ('rsig_data', MoneroTransactionRsigData, 0),
-            4: ('out_pk', p.BytesType, 0),
-            5: ('ecdh_info', p.BytesType, 0),
-        }
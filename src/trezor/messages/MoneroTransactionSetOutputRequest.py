@@ -2,12 +2,23 @@
 # fmt: off
 import protobuf as p
 
-from .MoneroTransactionDestinationEntry import MoneroTransactionDestinationEntry
-from .MoneroTransactionRsigData import MoneroTransactionRsigData
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .MoneroTransactionDestinationEntry import MoneroTransactionDestinationEntry
+        from .MoneroTransactionRsigData import MoneroTransactionRsigData
+    except ImportError:
+        pass
 
 
 class MoneroTransactionSetOutputRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 511
+    FIELDS = (
+        None,
+        ('dst_entr', 'MoneroTransactionDestinationEntry', 0),  # 1
+        ('dst_entr_hmac', p.TYPE_BYTES, 0),  # 2
+        ('rsig_data', 'MoneroTransactionRsigData', 0),  # 3
+    )
 
     def __init__(
         self,
@@ -18,11 +29,3 @@ class MoneroTransactionSetOutputRequest(p.MessageType):
         self.dst_entr = dst_entr
         self.dst_entr_hmac = dst_entr_hmac
         self.rsig_data = rsig_data
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('dst_entr', MoneroTransactionDestinationEntry, 0),
-            2: ('dst_entr_hmac', p.BytesType, 0),
-            3: ('rsig_data', MoneroTransactionRsigData, 0),
-        }
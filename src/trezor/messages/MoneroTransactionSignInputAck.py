@@ -5,6 +5,11 @@ import protobuf as p
 
 class MoneroTransactionSignInputAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 518
+    FIELDS = (
+        None,
+        ('signature', p.TYPE_BYTES, 0),  # 1
+        ('cout', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class MoneroTransactionSignInputAck(p.MessageType):
     ) -> None:
         self.signature = signature
         self.cout = cout
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('signature', p.BytesType, 0),
-            2: ('cout', p.BytesType, 0),
-        }
@@ -2,11 +2,26 @@
 # fmt: off
 import protobuf as p
 
-from .MoneroTransactionSourceEntry import MoneroTransactionSourceEntry
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .MoneroTransactionSourceEntry import MoneroTransactionSourceEntry
+    except ImportError:
+        pass
 
 
 class MoneroTransactionSignInputRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 517
+    FIELDS = (
+        None,
+        ('src_entr', 'MoneroTransactionSourceEntry', 0),  # 1
+        ('vini', p.TYPE_BYTES, 0),  # 2
+        ('vini_hmac', p.TYPE_BYTES, 0),  # 3
+        ('pseudo_out', p.TYPE_BYTES, 0),  # 4
+        ('pseudo_out_hmac', p.TYPE_BYTES, 0),  # 5
+        ('alpha_enc', p.TYPE_BYTES, 0),  # 6
+        ('spend_enc', p.TYPE_BYTES, 0),  # 7
+    )
 
     def __init__(
         self,
@@ -25,15 +40,3 @@ class MoneroTransactionSignInputRequest(p.MessageType):
         self.pseudo_out_hmac = pseudo_out_hmac
         self.alpha_enc = alpha_enc
         self.spend_enc = spend_enc
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('src_entr', MoneroTransactionSourceEntry, 0),
-            2: ('vini', p.BytesType, 0),
-            3: ('vini_hmac', p.BytesType, 0),
-            4: ('pseudo_out', p.BytesType, 0),
-            5: ('pseudo_out_hmac', p.BytesType, 0),
-            6: ('alpha_enc', p.BytesType, 0),
-            7: ('spend_enc', p.BytesType, 0),
-        }
@@ -2,17 +2,28 @@
 # fmt: off
 import protobuf as p
 
-from .MoneroMultisigKLRki import MoneroMultisigKLRki
-from .MoneroOutputEntry import MoneroOutputEntry
-
 if __debug__:
     try:
         from typing import List
+        from .MoneroMultisigKLRki import MoneroMultisigKLRki
+        from .MoneroOutputEntry import MoneroOutputEntry
     except ImportError:
         List = None  # type: ignore
 
 
 class MoneroTransactionSourceEntry(p.MessageType):
+    FIELDS = (
+        None,
+        ('outputs', 'MoneroOutputEntry', p.FLAG_REPEATED),  # 1
+        ('real_output', p.TYPE_UVARINT, 0),  # 2
+        ('real_out_tx_key', p.TYPE_BYTES, 0),  # 3
+        ('real_out_additional_tx_keys', p.TYPE_BYTES, p.FLAG_REPEATED),  # 4
+        ('real_output_in_tx_index', p.TYPE_UVARINT, 0),  # 5
+        ('amount', p.TYPE_UVARINT, 0),  # 6
+        ('rct', p.TYPE_BOOL, 0),  # 7
+        ('mask', p.TYPE_BYTES, 0),  # 8
+        ('multisig_kLRki', 'MoneroMultisigKLRki', 0),  # 9
+    )
 
     def __init__(
         self,
@@ -35,17 +46,3 @@ class MoneroTransactionSourceEntry(p.MessageType):
         self.rct = rct
         self.mask = mask
         self.multisig_kLRki = multisig_kLRki
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('outputs', MoneroOutputEntry, p.FLAG_REPEATED),
-            2: ('real_output', p.UVarintType, 0),
-            3: ('real_out_tx_key', p.BytesType, 0),
-            4: ('real_out_additional_tx_keys', p.BytesType, p.FLAG_REPEATED),
-            5: ('real_output_in_tx_index', p.UVarintType, 0),
-            6: ('amount', p.UVarintType, 0),
-            7: ('rct', p.BoolType, 0),
-            8: ('mask', p.BytesType, 0),
-            9: ('multisig_kLRki', MoneroMultisigKLRki, 0),
-        }
@@ -5,6 +5,11 @@ import protobuf as p
 
 class MoneroWatchKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 543
+    FIELDS = (
+        None,
+        ('watch_key', p.TYPE_BYTES, 0),  # 1
+        ('address', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class MoneroWatchKey(p.MessageType):
     ) -> None:
         self.watch_key = watch_key
         self.address = address
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('watch_key', p.BytesType, 0),
-            2: ('address', p.BytesType, 0),
-        }
@@ -2,16 +2,21 @@
 # fmt: off
 import protobuf as p
 
-from .HDNodePathType import HDNodePathType
-
 if __debug__:
     try:
         from typing import List
+        from .HDNodePathType import HDNodePathType
     except ImportError:
         List = None  # type: ignore
 
 
 class MultisigRedeemScriptType(p.MessageType):
+    FIELDS = (
+        None,
+        ('pubkeys', 'HDNodePathType', p.FLAG_REPEATED),  # 1
+        ('signatures', p.TYPE_BYTES, p.FLAG_REPEATED),  # 2
+        ('m', p.TYPE_UVARINT, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -22,11 +27,3 @@ class MultisigRedeemScriptType(p.MessageType):
         self.pubkeys = pubkeys if pubkeys is not None else []
         self.signatures = signatures if signatures is not None else []
         self.m = m
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('pubkeys', HDNodePathType, p.FLAG_REPEATED),
-            2: ('signatures', p.BytesType, p.FLAG_REPEATED),
-            3: ('m', p.UVarintType, 0),
-        }
@@ -2,16 +2,20 @@
 # fmt: off
 import protobuf as p
 
-from .NEMCosignatoryModification import NEMCosignatoryModification
-
 if __debug__:
     try:
         from typing import List
+        from .NEMCosignatoryModification import NEMCosignatoryModification
     except ImportError:
         List = None  # type: ignore
 
 
 class NEMAggregateModification(p.MessageType):
+    FIELDS = (
+        None,
+        ('modifications', 'NEMCosignatoryModification', p.FLAG_REPEATED),  # 1
+        ('relative_change', p.TYPE_SVARINT, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -20,10 +24,3 @@ class NEMAggregateModification(p.MessageType):
     ) -> None:
         self.modifications = modifications if modifications is not None else []
         self.relative_change = relative_change
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('modifications', NEMCosignatoryModification, p.FLAG_REPEATED),
-            2: ('relative_change', p.SVarintType, 0),
-        }
@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class NEMCosignatoryModification(p.MessageType):
+    FIELDS = (
+        None,
+        ('type', p.TYPE_UVARINT, 0),  # 1
+        ('public_key', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -12,10 +17,3 @@ class NEMCosignatoryModification(p.MessageType):
     ) -> None:
         self.type = type
         self.public_key = public_key
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('type', p.UVarintType, 0),
-            2: ('public_key', p.BytesType, 0),
-        }
@@ -11,6 +11,13 @@ if __debug__:
 
 class NEMDecryptMessage(p.MessageType):
     MESSAGE_WIRE_TYPE = 75
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('network', p.TYPE_UVARINT, 0),  # 2
+        ('public_key', p.TYPE_BYTES, 0),  # 3
+        ('payload', p.TYPE_BYTES, 0),  # 4
+    )
 
     def __init__(
         self,
@@ -23,12 +30,3 @@ class NEMDecryptMessage(p.MessageType):
         self.network = network
         self.public_key = public_key
         self.payload = payload
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('network', p.UVarintType, 0),
-            3: ('public_key', p.BytesType, 0),
-            4: ('payload', p.BytesType, 0),
-        }
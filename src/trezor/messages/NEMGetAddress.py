@@ -11,6 +11,12 @@ if __debug__:
 
 class NEMGetAddress(p.MessageType):
     MESSAGE_WIRE_TYPE = 67
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('network', p.TYPE_UVARINT, 0),  # 2
+        ('show_display', p.TYPE_BOOL, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -21,11 +27,3 @@ class NEMGetAddress(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.network = network
         self.show_display = show_display
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('network', p.UVarintType, 0),
-            3: ('show_display', p.BoolType, 0),
-        }
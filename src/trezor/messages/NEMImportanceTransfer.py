@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class NEMImportanceTransfer(p.MessageType):
+    FIELDS = (
+        None,
+        ('mode', p.TYPE_UVARINT, 0),  # 1
+        ('public_key', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -12,10 +17,3 @@ class NEMImportanceTransfer(p.MessageType):
     ) -> None:
         self.mode = mode
         self.public_key = public_key
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('mode', p.UVarintType, 0),
-            2: ('public_key', p.BytesType, 0),
-        }
@@ -4,6 +4,12 @@ import protobuf as p
 
 
 class NEMMosaic(p.MessageType):
+    FIELDS = (
+        None,
+        ('namespace', p.TYPE_UNICODE, 0),  # 1
+        ('mosaic', p.TYPE_UNICODE, 0),  # 2
+        ('quantity', p.TYPE_UVARINT, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -14,11 +20,3 @@ class NEMMosaic(p.MessageType):
         self.namespace = namespace
         self.mosaic = mosaic
         self.quantity = quantity
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('namespace', p.UnicodeType, 0),
-            2: ('mosaic', p.UnicodeType, 0),
-            3: ('quantity', p.UVarintType, 0),
-        }
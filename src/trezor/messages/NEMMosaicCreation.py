@@ -2,10 +2,21 @@
 # fmt: off
 import protobuf as p
 
-from .NEMMosaicDefinition import NEMMosaicDefinition
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .NEMMosaicDefinition import NEMMosaicDefinition
+    except ImportError:
+        pass
 
 
 class NEMMosaicCreation(p.MessageType):
+    FIELDS = (
+        None,
+        ('definition', 'NEMMosaicDefinition', 0),  # 1
+        ('sink', p.TYPE_UNICODE, 0),  # 2
+        ('fee', p.TYPE_UVARINT, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -16,11 +27,3 @@ class NEMMosaicCreation(p.MessageType):
         self.definition = definition
         self.sink = sink
         self.fee = fee
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('definition', NEMMosaicDefinition, 0),
-            2: ('sink', p.UnicodeType, 0),
-            3: ('fee', p.UVarintType, 0),
-        }
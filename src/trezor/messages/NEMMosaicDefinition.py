@@ -10,6 +10,24 @@ if __debug__:
 
 
 class NEMMosaicDefinition(p.MessageType):
+    FIELDS = (
+        None,
+        ('name', p.TYPE_UNICODE, 0),  # 1
+        ('ticker', p.TYPE_UNICODE, 0),  # 2
+        ('namespace', p.TYPE_UNICODE, 0),  # 3
+        ('mosaic', p.TYPE_UNICODE, 0),  # 4
+        ('divisibility', p.TYPE_UVARINT, 0),  # 5
+        ('levy', p.TYPE_UVARINT, 0),  # 6
+        ('fee', p.TYPE_UVARINT, 0),  # 7
+        ('levy_address', p.TYPE_UNICODE, 0),  # 8
+        ('levy_namespace', p.TYPE_UNICODE, 0),  # 9
+        ('levy_mosaic', p.TYPE_UNICODE, 0),  # 10
+        ('supply', p.TYPE_UVARINT, 0),  # 11
+        ('mutable_supply', p.TYPE_BOOL, 0),  # 12
+        ('transferable', p.TYPE_BOOL, 0),  # 13
+        ('description', p.TYPE_UNICODE, 0),  # 14
+        ('networks', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 15
+    )
 
     def __init__(
         self,
@@ -44,23 +62,3 @@ class NEMMosaicDefinition(p.MessageType):
         self.transferable = transferable
         self.description = description
         self.networks = networks if networks is not None else []
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('name', p.UnicodeType, 0),
-            2: ('ticker', p.UnicodeType, 0),
-            3: ('namespace', p.UnicodeType, 0),
-            4: ('mosaic', p.UnicodeType, 0),
-            5: ('divisibility', p.UVarintType, 0),
-            6: ('levy', p.UVarintType, 0),
-            7: ('fee', p.UVarintType, 0),
-            8: ('levy_address', p.UnicodeType, 0),
-            9: ('levy_namespace', p.UnicodeType, 0),
-            10: ('levy_mosaic', p.UnicodeType, 0),
-            11: ('supply', p.UVarintType, 0),
-            12: ('mutable_supply', p.BoolType, 0),
-            13: ('transferable', p.BoolType, 0),
-            14: ('description', p.UnicodeType, 0),
-            15: ('networks', p.UVarintType, p.FLAG_REPEATED),
-        }
@@ -4,6 +4,13 @@ import protobuf as p
 
 
 class NEMMosaicSupplyChange(p.MessageType):
+    FIELDS = (
+        None,
+        ('namespace', p.TYPE_UNICODE, 0),  # 1
+        ('mosaic', p.TYPE_UNICODE, 0),  # 2
+        ('type', p.TYPE_UVARINT, 0),  # 3
+        ('delta', p.TYPE_UVARINT, 0),  # 4
+    )
 
     def __init__(
         self,
@@ -16,12 +23,3 @@ class NEMMosaicSupplyChange(p.MessageType):
         self.mosaic = mosaic
         self.type = type
         self.delta = delta
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('namespace', p.UnicodeType, 0),
-            2: ('mosaic', p.UnicodeType, 0),
-            3: ('type', p.UVarintType, 0),
-            4: ('delta', p.UVarintType, 0),
-        }
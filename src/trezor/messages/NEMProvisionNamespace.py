@@ -4,6 +4,13 @@ import protobuf as p
 
 
 class NEMProvisionNamespace(p.MessageType):
+    FIELDS = (
+        None,
+        ('namespace', p.TYPE_UNICODE, 0),  # 1
+        ('parent', p.TYPE_UNICODE, 0),  # 2
+        ('sink', p.TYPE_UNICODE, 0),  # 3
+        ('fee', p.TYPE_UVARINT, 0),  # 4
+    )
 
     def __init__(
         self,
@@ -16,12 +23,3 @@ class NEMProvisionNamespace(p.MessageType):
         self.parent = parent
         self.sink = sink
         self.fee = fee
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('namespace', p.UnicodeType, 0),
-            2: ('parent', p.UnicodeType, 0),
-            3: ('sink', p.UnicodeType, 0),
-            4: ('fee', p.UVarintType, 0),
-        }
@@ -2,17 +2,34 @@
 # fmt: off
 import protobuf as p
 
-from .NEMAggregateModification import NEMAggregateModification
-from .NEMImportanceTransfer import NEMImportanceTransfer
-from .NEMMosaicCreation import NEMMosaicCreation
-from .NEMMosaicSupplyChange import NEMMosaicSupplyChange
-from .NEMProvisionNamespace import NEMProvisionNamespace
-from .NEMTransactionCommon import NEMTransactionCommon
-from .NEMTransfer import NEMTransfer
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .NEMAggregateModification import NEMAggregateModification
+        from .NEMImportanceTransfer import NEMImportanceTransfer
+        from .NEMMosaicCreation import NEMMosaicCreation
+        from .NEMMosaicSupplyChange import NEMMosaicSupplyChange
+        from .NEMProvisionNamespace import NEMProvisionNamespace
+        from .NEMTransactionCommon import NEMTransactionCommon
+        from .NEMTransfer import NEMTransfer
+    except ImportError:
+        pass
 
 
 class NEMSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 69
+    FIELDS = (
+        None,
+        ('transaction', 'NEMTransactionCommon', 0),  # 1
+        ('multisig', 'NEMTransactionCommon', 0),  # 2
+        ('transfer', 'NEMTransfer', 0),  # 3
+        ('cosigning', p.TYPE_BOOL, 0),  # 4
+        ('provision_namespace', 'NEMProvisionNamespace', 0),  # 5
+        ('mosaic_creation', 'NEMMosaicCreation', 0),  # 6
+        ('supply_change', 'NEMMosaicSupplyChange', 0),  # 7
+        ('aggregate_modification', 'NEMAggregateModification', 0),  # 8
+        ('importance_transfer', 'NEMImportanceTransfer', 0),  # 9
+    )
 
     def __init__(
         self,
@@ -35,17 +52,3 @@ class NEMSignTx(p.MessageType):
         self.supply_change = supply_change
         self.aggregate_modification = aggregate_modification
         self.importance_transfer = importance_transfer
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('transaction', NEMTransactionCommon, 0),
-            2: ('multisig', NEMTransactionCommon, 0),
-            3: ('transfer', NEMTransfer, 0),
-            4: ('cosigning', p.BoolType, 0),
-            5: ('provision_namespace', NEMProvisionNamespace, 0),
-            6: ('mosaic_creation', NEMMosaicCreation, 0),
-            7: ('supply_change', NEMMosaicSupplyChange, 0),
-            8: ('aggregate_modification', NEMAggregateModification, 0),
-            9: ('importance_transfer', NEMImportanceTransfer, 0),
-        }
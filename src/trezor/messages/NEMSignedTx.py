@@ -5,6 +5,11 @@ import protobuf as p
 
 class NEMSignedTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 70
+    FIELDS = (
+        None,
+        ('data', p.TYPE_BYTES, 0),  # 1
+        ('signature', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class NEMSignedTx(p.MessageType):
     ) -> None:
         self.data = data
         self.signature = signature
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('data', p.BytesType, 0),
-            2: ('signature', p.BytesType, 0),
-        }
@@ -10,6 +10,15 @@ if __debug__:
 
 
 class NEMTransactionCommon(p.MessageType):
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('network', p.TYPE_UVARINT, 0),  # 2
+        ('timestamp', p.TYPE_UVARINT, 0),  # 3
+        ('fee', p.TYPE_UVARINT, 0),  # 4
+        ('deadline', p.TYPE_UVARINT, 0),  # 5
+        ('signer', p.TYPE_BYTES, 0),  # 6
+    )
 
     def __init__(
         self,
@@ -26,14 +35,3 @@ class NEMTransactionCommon(p.MessageType):
         self.fee = fee
         self.deadline = deadline
         self.signer = signer
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('network', p.UVarintType, 0),
-            3: ('timestamp', p.UVarintType, 0),
-            4: ('fee', p.UVarintType, 0),
-            5: ('deadline', p.UVarintType, 0),
-            6: ('signer', p.BytesType, 0),
-        }
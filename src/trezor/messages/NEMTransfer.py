@@ -2,16 +2,23 @@
 # fmt: off
 import protobuf as p
 
-from .NEMMosaic import NEMMosaic
-
 if __debug__:
     try:
         from typing import List
+        from .NEMMosaic import NEMMosaic
     except ImportError:
         List = None  # type: ignore
 
 
 class NEMTransfer(p.MessageType):
+    FIELDS = (
+        None,
+        ('recipient', p.TYPE_UNICODE, 0),  # 1
+        ('amount', p.TYPE_UVARINT, 0),  # 2
+        ('payload', p.TYPE_BYTES, p.FLAG_STREAMED),  # 3
+        ('public_key', p.TYPE_BYTES, 0),  # 4
+        ('mosaics', 'NEMMosaic', p.FLAG_REPEATED),  # 5
+    )
 
     def __init__(
         self,
@@ -26,13 +33,3 @@ class NEMTransfer(p.MessageType):
         self.payload = payload
         self.public_key = public_key
         self.mosaics = mosaics if mosaics is not None else []
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('recipient', p.UnicodeType, 0),
-            2: ('amount', p.UVarintType, 0),
-            3: ('payload', p.BytesType, 0),
-            4: ('public_key', p.BytesType, 0),
-            5: ('mosaics', NEMMosaic, p.FLAG_REPEATED),
-        }
@@ -2,16 +2,21 @@
 # fmt: off
 import protobuf as p
 
-from .OntologyOntIdAttribute import OntologyOntIdAttribute
-
 if __debug__:
     try:
         from typing import List
+        from .OntologyOntIdAttribute import OntologyOntIdAttribute
     except ImportError:
         List = None  # type: ignore
 
 
 class OntologyOntIdAddAttributes(p.MessageType):
+    FIELDS = (
+        None,
+        ('ont_id', p.TYPE_UNICODE, 0),  # 1
+        ('public_key', p.TYPE_BYTES, 0),  # 2
+        ('ont_id_attributes', 'OntologyOntIdAttribute', p.FLAG_REPEATED),  # 3
+    )
 
     def __init__(
         self,
@@ -22,11 +27,3 @@ class OntologyOntIdAddAttributes(p.MessageType):
         self.ont_id = ont_id
         self.public_key = public_key
         self.ont_id_attributes = ont_id_attributes if ont_id_attributes is not None else []
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('ont_id', p.UnicodeType, 0),
-            2: ('public_key', p.BytesType, 0),
-            3: ('ont_id_attributes', OntologyOntIdAttribute, p.FLAG_REPEATED),
-        }
@@ -4,6 +4,12 @@ import protobuf as p
 
 
 class OntologyOntIdAttribute(p.MessageType):
+    FIELDS = (
+        None,
+        ('key', p.TYPE_UNICODE, 0),  # 1
+        ('type', p.TYPE_UNICODE, 0),  # 2
+        ('value', p.TYPE_UNICODE, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -14,11 +20,3 @@ class OntologyOntIdAttribute(p.MessageType):
         self.key = key
         self.type = type
         self.value = value
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('key', p.UnicodeType, 0),
-            2: ('type', p.UnicodeType, 0),
-            3: ('value', p.UnicodeType, 0),
-        }
@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class OntologyOntIdRegister(p.MessageType):
+    FIELDS = (
+        None,
+        ('ont_id', p.TYPE_UNICODE, 0),  # 1
+        ('public_key', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -12,10 +17,3 @@ class OntologyOntIdRegister(p.MessageType):
     ) -> None:
         self.ont_id = ont_id
         self.public_key = public_key
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('ont_id', p.UnicodeType, 0),
-            2: ('public_key', p.BytesType, 0),
-        }
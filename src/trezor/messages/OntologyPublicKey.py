@@ -5,15 +5,13 @@ import protobuf as p
 
 class OntologyPublicKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 353
+    FIELDS = (
+        None,
+        ('public_key', p.TYPE_BYTES, 0),  # 1
+    )
 
     def __init__(
         self,
         public_key: bytes = None,
     ) -> None:
         self.public_key = public_key
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('public_key', p.BytesType, 0),
-        }
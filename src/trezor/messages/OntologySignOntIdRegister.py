@@ -2,18 +2,23 @@
 # fmt: off
 import protobuf as p
 
-from .OntologyOntIdRegister import OntologyOntIdRegister
-from .OntologyTransaction import OntologyTransaction
-
 if __debug__:
     try:
         from typing import List
+        from .OntologyOntIdRegister import OntologyOntIdRegister
+        from .OntologyTransaction import OntologyTransaction
     except ImportError:
         List = None  # type: ignore
 
 
 class OntologySignOntIdRegister(p.MessageType):
     MESSAGE_WIRE_TYPE = 358
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('transaction', 'OntologyTransaction', 0),  # 2
+        ('ont_id_register', 'OntologyOntIdRegister', 0),  # 3
+    )
 
     def __init__(
         self,
@@ -24,11 +29,3 @@ class OntologySignOntIdRegister(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.transaction = transaction
         self.ont_id_register = ont_id_register
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('transaction', OntologyTransaction, 0),
-            3: ('ont_id_register', OntologyOntIdRegister, 0),
-        }
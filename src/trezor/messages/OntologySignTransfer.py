@@ -2,18 +2,23 @@
 # fmt: off
 import protobuf as p
 
-from .OntologyTransaction import OntologyTransaction
-from .OntologyTransfer import OntologyTransfer
-
 if __debug__:
     try:
         from typing import List
+        from .OntologyTransaction import OntologyTransaction
+        from .OntologyTransfer import OntologyTransfer
     except ImportError:
         List = None  # type: ignore
 
 
 class OntologySignTransfer(p.MessageType):
     MESSAGE_WIRE_TYPE = 354
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('transaction', 'OntologyTransaction', 0),  # 2
+        ('transfer', 'OntologyTransfer', 0),  # 3
+    )
 
     def __init__(
         self,
@@ -24,11 +29,3 @@ class OntologySignTransfer(p.MessageType):
         self.address_n = address_n if address_n is not None else []
         self.transaction = transaction
         self.transfer = transfer
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('transaction', OntologyTransaction, 0),
-            3: ('transfer', OntologyTransfer, 0),
-        }
@@ -5,6 +5,11 @@ import protobuf as p
 
 class OntologySignedWithdrawOng(p.MessageType):
     MESSAGE_WIRE_TYPE = 357
+    FIELDS = (
+        None,
+        ('signature', p.TYPE_BYTES, 0),  # 1
+        ('payload', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class OntologySignedWithdrawOng(p.MessageType):
     ) -> None:
         self.signature = signature
         self.payload = payload
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('signature', p.BytesType, 0),
-            2: ('payload', p.BytesType, 0),
-        }
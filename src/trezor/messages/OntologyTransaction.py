@@ -2,16 +2,25 @@
 # fmt: off
 import protobuf as p
 
-from .OntologyTxAttribute import OntologyTxAttribute
-
 if __debug__:
     try:
         from typing import List
+        from .OntologyTxAttribute import OntologyTxAttribute
     except ImportError:
         List = None  # type: ignore
 
 
 class OntologyTransaction(p.MessageType):
+    FIELDS = (
+        None,
+        ('version', p.TYPE_UVARINT, 0),  # 1
+        ('type', p.TYPE_UVARINT, 0),  # 2
+        ('nonce', p.TYPE_UVARINT, 0),  # 3
+        ('gas_price', p.TYPE_UVARINT, 0),  # 4
+        ('gas_limit', p.TYPE_UVARINT, 0),  # 5
+        ('payer', p.TYPE_UNICODE, 0),  # 6
+        ('tx_attributes', 'OntologyTxAttribute', p.FLAG_REPEATED),  # 7
+    )
 
     def __init__(
         self,
@@ -30,15 +39,3 @@ class OntologyTransaction(p.MessageType):
         self.gas_limit = gas_limit
         self.payer = payer
         self.tx_attributes = tx_attributes if tx_attributes is not None else []
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('version', p.UVarintType, 0),
-            2: ('type', p.UVarintType, 0),
-            3: ('nonce', p.UVarintType, 0),
-            4: ('gas_price', p.UVarintType, 0),
-            5: ('gas_limit', p.UVarintType, 0),
-            6: ('payer', p.UnicodeType, 0),
-            7: ('tx_attributes', OntologyTxAttribute, p.FLAG_REPEATED),
-        }
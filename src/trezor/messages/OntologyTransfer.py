@@ -4,6 +4,13 @@ import protobuf as p
 
 
 class OntologyTransfer(p.MessageType):
+    FIELDS = (
+        None,
+        ('asset', p.TYPE_UVARINT, 0),  # 1
+        ('amount', p.TYPE_UVARINT, 0),  # 2
+        ('from_address', p.TYPE_UNICODE, 0),  # 3
+        ('to_address', p.TYPE_UNICODE, 0),  # 4
+    )
 
     def __init__(
         self,
@@ -16,12 +23,3 @@ class OntologyTransfer(p.MessageType):
         self.amount = amount
         self.from_address = from_address
         self.to_address = to_address
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('asset', p.UVarintType, 0),
-            2: ('amount', p.UVarintType, 0),
-            3: ('from_address', p.UnicodeType, 0),
-            4: ('to_address', p.UnicodeType, 0),
-        }
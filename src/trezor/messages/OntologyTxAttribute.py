@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class OntologyTxAttribute(p.MessageType):
+    FIELDS = (
+        None,
+        ('usage', p.TYPE_UVARINT, 0),  # 1
+        ('data', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -12,10 +17,3 @@ class OntologyTxAttribute(p.MessageType):
     ) -> None:
         self.usage = usage
         self.data = data
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('usage', p.UVarintType, 0),
-            2: ('data', p.BytesType, 0),
-        }
@@ -4,6 +4,12 @@ import protobuf as p
 
 
 class OntologyWithdrawOng(p.MessageType):
+    FIELDS = (
+        None,
+        ('amount', p.TYPE_UVARINT, 0),  # 1
+        ('from_address', p.TYPE_UNICODE, 0),  # 2
+        ('to_address', p.TYPE_UNICODE, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -14,11 +20,3 @@ class OntologyWithdrawOng(p.MessageType):
         self.amount = amount
         self.from_address = from_address
         self.to_address = to_address
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('amount', p.UVarintType, 0),
-            2: ('from_address', p.UnicodeType, 0),
-            3: ('to_address', p.UnicodeType, 0),
-        }
@@ -5,6 +5,11 @@ import protobuf as p
 
 class PassphraseAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 42
+    FIELDS = (
+        None,
+        ('passphrase', p.TYPE_UNICODE, 0),  # 1
+        ('state', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class PassphraseAck(p.MessageType):
     ) -> None:
         self.passphrase = passphrase
         self.state = state
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('passphrase', p.UnicodeType, 0),
-            2: ('state', p.BytesType, 0),
-        }
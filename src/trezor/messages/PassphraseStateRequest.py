@@ -5,15 +5,13 @@ import protobuf as p
 
 class PassphraseStateRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 77
+    FIELDS = (
+        None,
+        ('state', p.TYPE_BYTES, 0),  # 1
+    )
 
     def __init__(
         self,
         state: bytes = None,
     ) -> None:
         self.state = state
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('state', p.BytesType, 0),
-        }
@@ -5,6 +5,13 @@ import protobuf as p
 
 class Ping(p.MessageType):
     MESSAGE_WIRE_TYPE = 1
+    FIELDS = (
+        None,
+        ('message', p.TYPE_UNICODE, 0),  # 1
+        ('button_protection', p.TYPE_BOOL, 0),  # 2
+        ('pin_protection', p.TYPE_BOOL, 0),  # 3
+        ('passphrase_protection', p.TYPE_BOOL, 0),  # 4
+    )
 
     def __init__(
         self,
@@ -17,12 +24,3 @@ class Ping(p.MessageType):
         self.button_protection = button_protection
         self.pin_protection = pin_protection
         self.passphrase_protection = passphrase_protection
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('message', p.UnicodeType, 0),
-            2: ('button_protection', p.BoolType, 0),
-            3: ('pin_protection', p.BoolType, 0),
-            4: ('passphrase_protection', p.BoolType, 0),
-        }
@@ -2,11 +2,21 @@
 # fmt: off
 import protobuf as p
 
-from .HDNodeType import HDNodeType
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .HDNodeType import HDNodeType
+    except ImportError:
+        pass
 
 
 class PublicKey(p.MessageType):
     MESSAGE_WIRE_TYPE = 12
+    FIELDS = (
+        None,
+        ('node', 'HDNodeType', 0),  # 1, required
+        ('xpub', p.TYPE_UNICODE, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -15,10 +25,3 @@ class PublicKey(p.MessageType):
     ) -> None:
         self.node = node
         self.xpub = xpub
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('node', HDNodeType, 0),  # required
-            2: ('xpub', p.UnicodeType, 0),
-        }
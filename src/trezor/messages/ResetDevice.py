@@ -5,6 +5,17 @@ import protobuf as p
 
 class ResetDevice(p.MessageType):
     MESSAGE_WIRE_TYPE = 14
+    FIELDS = (
+        None,
+        ('display_random', p.TYPE_BOOL, 0),  # 1
+        ('strength', p.TYPE_UVARINT, 0),  # 2, default=256
+        ('passphrase_protection', p.TYPE_BOOL, 0),  # 3
+        ('pin_protection', p.TYPE_BOOL, 0),  # 4
+        ('language', p.TYPE_UNICODE, 0),  # 5, default=english
+        ('label', p.TYPE_UNICODE, 0),  # 6
+        ('u2f_counter', p.TYPE_UVARINT, 0),  # 7
+        ('skip_backup', p.TYPE_BOOL, 0),  # 8
+    )
 
     def __init__(
         self,
@@ -25,16 +36,3 @@ class ResetDevice(p.MessageType):
         self.label = label
         self.u2f_counter = u2f_counter
         self.skip_backup = skip_backup
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('display_random', p.BoolType, 0),
-            2: ('strength', p.UVarintType, 0),  # default=256
-            3: ('passphrase_protection', p.BoolType, 0),
-            4: ('pin_protection', p.BoolType, 0),
-            5: ('language', p.UnicodeType, 0),  # default=english
-            6: ('label', p.UnicodeType, 0),
-            7: ('u2f_counter', p.UVarintType, 0),
-            8: ('skip_backup', p.BoolType, 0),
-        }
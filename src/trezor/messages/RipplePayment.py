@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class RipplePayment(p.MessageType):
+    FIELDS = (
+        None,
+        ('amount', p.TYPE_UVARINT, 0),  # 1
+        ('destination', p.TYPE_UNICODE, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -12,10 +17,3 @@ class RipplePayment(p.MessageType):
     ) -> None:
         self.amount = amount
         self.destination = destination
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('amount', p.UVarintType, 0),
-            2: ('destination', p.UnicodeType, 0),
-        }
@@ -2,17 +2,25 @@
 # fmt: off
 import protobuf as p
 
-from .RipplePayment import RipplePayment
-
 if __debug__:
     try:
         from typing import List
+        from .RipplePayment import RipplePayment
     except ImportError:
         List = None  # type: ignore
 
 
 class RippleSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 402
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('fee', p.TYPE_UVARINT, 0),  # 2
+        ('flags', p.TYPE_UVARINT, 0),  # 3
+        ('sequence', p.TYPE_UVARINT, 0),  # 4
+        ('last_ledger_sequence', p.TYPE_UVARINT, 0),  # 5
+        ('payment', 'RipplePayment', 0),  # 6
+    )
 
     def __init__(
         self,
@@ -29,14 +37,3 @@ class RippleSignTx(p.MessageType):
         self.sequence = sequence
         self.last_ledger_sequence = last_ledger_sequence
         self.payment = payment
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('fee', p.UVarintType, 0),
-            3: ('flags', p.UVarintType, 0),
-            4: ('sequence', p.UVarintType, 0),
-            5: ('last_ledger_sequence', p.UVarintType, 0),
-            6: ('payment', RipplePayment, 0),
-        }
@@ -5,6 +5,11 @@ import protobuf as p
 
 class RippleSignedTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 403
+    FIELDS = (
+        None,
+        ('signature', p.TYPE_BYTES, 0),  # 1
+        ('serialized_tx', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class RippleSignedTx(p.MessageType):
     ) -> None:
         self.signature = signature
         self.serialized_tx = serialized_tx
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('signature', p.BytesType, 0),
-            2: ('serialized_tx', p.BytesType, 0),
-        }
@@ -5,15 +5,13 @@ import protobuf as p
 
 class SelfTest(p.MessageType):
     MESSAGE_WIRE_TYPE = 32
+    FIELDS = (
+        None,
+        ('payload', p.TYPE_BYTES, 0),  # 1
+    )
 
     def __init__(
         self,
         payload: bytes = None,
     ) -> None:
         self.payload = payload
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('payload', p.BytesType, 0),
-        }
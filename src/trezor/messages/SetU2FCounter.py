@@ -5,15 +5,13 @@ import protobuf as p
 
 class SetU2FCounter(p.MessageType):
     MESSAGE_WIRE_TYPE = 63
+    FIELDS = (
+        None,
+        ('u2f_counter', p.TYPE_UVARINT, 0),  # 1
+    )
 
     def __init__(
         self,
         u2f_counter: int = None,
     ) -> None:
         self.u2f_counter = u2f_counter
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('u2f_counter', p.UVarintType, 0),
-        }
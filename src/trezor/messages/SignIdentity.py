@@ -2,11 +2,23 @@
 # fmt: off
 import protobuf as p
 
-from .IdentityType import IdentityType
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .IdentityType import IdentityType
+    except ImportError:
+        pass
 
 
 class SignIdentity(p.MessageType):
     MESSAGE_WIRE_TYPE = 53
+    FIELDS = (
+        None,
+        ('identity', 'IdentityType', 0),  # 1
+        ('challenge_hidden', p.TYPE_BYTES, 0),  # 2
+        ('challenge_visual', p.TYPE_UNICODE, 0),  # 3
+        ('ecdsa_curve_name', p.TYPE_UNICODE, 0),  # 4
+    )
 
     def __init__(
         self,
@@ -19,12 +31,3 @@ class SignIdentity(p.MessageType):
         self.challenge_hidden = challenge_hidden
         self.challenge_visual = challenge_visual
         self.ecdsa_curve_name = ecdsa_curve_name
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('identity', IdentityType, 0),
-            2: ('challenge_hidden', p.BytesType, 0),
-            3: ('challenge_visual', p.UnicodeType, 0),
-            4: ('ecdsa_curve_name', p.UnicodeType, 0),
-        }
@@ -11,6 +11,13 @@ if __debug__:
 
 class SignMessage(p.MessageType):
     MESSAGE_WIRE_TYPE = 38
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('message', p.TYPE_BYTES, 0),  # 2, required
+        ('coin_name', p.TYPE_UNICODE, 0),  # 3, default=Bitcoin
+        ('script_type', p.TYPE_UVARINT, 0),  # 4, default=SPENDADDRESS
+    )
 
     def __init__(
         self,
@@ -23,12 +30,3 @@ class SignMessage(p.MessageType):
         self.message = message
         self.coin_name = coin_name
         self.script_type = script_type
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('message', p.BytesType, 0),  # required
-            3: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
-            4: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
-        }
@@ -5,6 +5,29 @@ import protobuf as p
 
 class SignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 15
+    FIELDS = (
+        None,
+        ('outputs_count', p.TYPE_UVARINT, 0),  # 1, required
+        ('inputs_count', p.TYPE_UVARINT, 0),  # 2, required
+        ('coin_name', p.TYPE_UNICODE, 0),  # 3, default=Bitcoin
+        ('version', p.TYPE_UVARINT, 0),  # 4, default=1
+        ('lock_time', p.TYPE_UVARINT, 0),  # 5, default=0
+        ('expiry', p.TYPE_UVARINT, 0),  # 6
+        ('overwintered', p.TYPE_BOOL, 0),  # 7
+        None,  # 8
+        None,  # 9
+        None,  # 10
+        None,  # 11
+        None,  # 12
+        None,  # 13
+        None,  # 14
+        None,  # 15
+        None,  # 16
+        None,  # 17
+        None,  # 18
+        None,  # 19
+        ('max_prefetch', p.TYPE_UVARINT, 0),  # 20
+    )
 
     def __init__(
         self,
@@ -15,6 +38,7 @@ class SignTx(p.MessageType):
         lock_time: int = None,
         expiry: int = None,
         overwintered: bool = None,
+        max_prefetch: int = None,
     ) -> None:
         self.outputs_count = outputs_count
         self.inputs_count = inputs_count
@@ -23,15 +47,4 @@ class SignTx(p.MessageType):
         self.lock_time = lock_time
         self.expiry = expiry
         self.overwintered = overwintered
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('outputs_count', p.UVarintType, 0),  # required
-            2: ('inputs_count', p.UVarintType, 0),  # required
-            3: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
-            4: ('version', p.UVarintType, 0),  # default=1
-            5: ('lock_time', p.UVarintType, 0),  # default=0
-            6: ('expiry', p.UVarintType, 0),
-            7: ('overwintered', p.BoolType, 0),
-        }
+        self.max_prefetch = max_prefetch
@@ -5,6 +5,12 @@ import protobuf as p
 
 class SignedIdentity(p.MessageType):
     MESSAGE_WIRE_TYPE = 54
+    FIELDS = (
+        None,
+        ('address', p.TYPE_UNICODE, 0),  # 1
+        ('public_key', p.TYPE_BYTES, 0),  # 2
+        ('signature', p.TYPE_BYTES, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -15,11 +21,3 @@ class SignedIdentity(p.MessageType):
         self.address = address
         self.public_key = public_key
         self.signature = signature
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('public_key', p.BytesType, 0),
-            3: ('signature', p.BytesType, 0),
-        }
@@ -5,6 +5,11 @@ import protobuf as p
 
 class StellarAccountMergeOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 218
+    FIELDS = (
+        None,
+        ('source_account', p.TYPE_UNICODE, 0),  # 1
+        ('destination_account', p.TYPE_UNICODE, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class StellarAccountMergeOp(p.MessageType):
     ) -> None:
         self.source_account = source_account
         self.destination_account = destination_account
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('destination_account', p.UnicodeType, 0),
-        }
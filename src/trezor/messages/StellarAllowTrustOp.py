@@ -5,6 +5,14 @@ import protobuf as p
 
 class StellarAllowTrustOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 217
+    FIELDS = (
+        None,
+        ('source_account', p.TYPE_UNICODE, 0),  # 1
+        ('trusted_account', p.TYPE_UNICODE, 0),  # 2
+        ('asset_type', p.TYPE_UVARINT, 0),  # 3
+        ('asset_code', p.TYPE_UNICODE, 0),  # 4
+        ('is_authorized', p.TYPE_UVARINT, 0),  # 5
+    )
 
     def __init__(
         self,
@@ -19,13 +27,3 @@ class StellarAllowTrustOp(p.MessageType):
         self.asset_type = asset_type
         self.asset_code = asset_code
         self.is_authorized = is_authorized
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('trusted_account', p.UnicodeType, 0),
-            3: ('asset_type', p.UVarintType, 0),
-            4: ('asset_code', p.UnicodeType, 0),
-            5: ('is_authorized', p.UVarintType, 0),
-        }
@@ -4,6 +4,12 @@ import protobuf as p
 
 
 class StellarAssetType(p.MessageType):
+    FIELDS = (
+        None,
+        ('type', p.TYPE_UVARINT, 0),  # 1
+        ('code', p.TYPE_UNICODE, 0),  # 2
+        ('issuer', p.TYPE_UNICODE, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -14,11 +20,3 @@ class StellarAssetType(p.MessageType):
         self.type = type
         self.code = code
         self.issuer = issuer
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('type', p.UVarintType, 0),
-            2: ('code', p.UnicodeType, 0),
-            3: ('issuer', p.UnicodeType, 0),
-        }
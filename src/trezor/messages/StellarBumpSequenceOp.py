@@ -5,6 +5,11 @@ import protobuf as p
 
 class StellarBumpSequenceOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 221
+    FIELDS = (
+        None,
+        ('source_account', p.TYPE_UNICODE, 0),  # 1
+        ('bump_to', p.TYPE_UVARINT, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -13,10 +18,3 @@ class StellarBumpSequenceOp(p.MessageType):
     ) -> None:
         self.source_account = source_account
         self.bump_to = bump_to
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('bump_to', p.UVarintType, 0),
-        }
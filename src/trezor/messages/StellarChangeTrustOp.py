@@ -2,11 +2,22 @@
 # fmt: off
 import protobuf as p
 
-from .StellarAssetType import StellarAssetType
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .StellarAssetType import StellarAssetType
+    except ImportError:
+        pass
 
 
 class StellarChangeTrustOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 216
+    FIELDS = (
+        None,
+        ('source_account', p.TYPE_UNICODE, 0),  # 1
+        ('asset', 'StellarAssetType', 0),  # 2
+        ('limit', p.TYPE_UVARINT, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -17,11 +28,3 @@ class StellarChangeTrustOp(p.MessageType):
         self.source_account = source_account
         self.asset = asset
         self.limit = limit
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('asset', StellarAssetType, 0),
-            3: ('limit', p.UVarintType, 0),
-        }
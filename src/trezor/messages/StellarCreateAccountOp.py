@@ -5,6 +5,12 @@ import protobuf as p
 
 class StellarCreateAccountOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 210
+    FIELDS = (
+        None,
+        ('source_account', p.TYPE_UNICODE, 0),  # 1
+        ('new_account', p.TYPE_UNICODE, 0),  # 2
+        ('starting_balance', p.TYPE_SVARINT, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -15,11 +21,3 @@ class StellarCreateAccountOp(p.MessageType):
         self.source_account = source_account
         self.new_account = new_account
         self.starting_balance = starting_balance
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('new_account', p.UnicodeType, 0),
-            3: ('starting_balance', p.SVarintType, 0),
-        }
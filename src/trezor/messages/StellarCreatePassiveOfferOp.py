@@ -2,11 +2,25 @@
 # fmt: off
 import protobuf as p
 
-from .StellarAssetType import StellarAssetType
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .StellarAssetType import StellarAssetType
+    except ImportError:
+        pass
 
 
 class StellarCreatePassiveOfferOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 214
+    FIELDS = (
+        None,
+        ('source_account', p.TYPE_UNICODE, 0),  # 1
+        ('selling_asset', 'StellarAssetType', 0),  # 2
+        ('buying_asset', 'StellarAssetType', 0),  # 3
+        ('amount', p.TYPE_SVARINT, 0),  # 4
+        ('price_n', p.TYPE_UVARINT, 0),  # 5
+        ('price_d', p.TYPE_UVARINT, 0),  # 6
+    )
 
     def __init__(
         self,
@@ -23,14 +37,3 @@ class StellarCreatePassiveOfferOp(p.MessageType):
         self.amount = amount
         self.price_n = price_n
         self.price_d = price_d
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('selling_asset', StellarAssetType, 0),
-            3: ('buying_asset', StellarAssetType, 0),
-            4: ('amount', p.SVarintType, 0),
-            5: ('price_n', p.UVarintType, 0),
-            6: ('price_d', p.UVarintType, 0),
-        }
@@ -5,6 +5,12 @@ import protobuf as p
 
 class StellarManageDataOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 220
+    FIELDS = (
+        None,
+        ('source_account', p.TYPE_UNICODE, 0),  # 1
+        ('key', p.TYPE_UNICODE, 0),  # 2
+        ('value', p.TYPE_BYTES, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -15,11 +21,3 @@ class StellarManageDataOp(p.MessageType):
         self.source_account = source_account
         self.key = key
         self.value = value
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('key', p.UnicodeType, 0),
-            3: ('value', p.BytesType, 0),
-        }
@@ -2,11 +2,26 @@
 # fmt: off
 import protobuf as p
 
-from .StellarAssetType import StellarAssetType
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .StellarAssetType import StellarAssetType
+    except ImportError:
+        pass
 
 
 class StellarManageOfferOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 213
+    FIELDS = (
+        None,
+        ('source_account', p.TYPE_UNICODE, 0),  # 1
+        ('selling_asset', 'StellarAssetType', 0),  # 2
+        ('buying_asset', 'StellarAssetType', 0),  # 3
+        ('amount', p.TYPE_SVARINT, 0),  # 4
+        ('price_n', p.TYPE_UVARINT, 0),  # 5
+        ('price_d', p.TYPE_UVARINT, 0),  # 6
+        ('offer_id', p.TYPE_UVARINT, 0),  # 7
+    )
 
     def __init__(
         self,
@@ -25,15 +40,3 @@ class StellarManageOfferOp(p.MessageType):
         self.price_n = price_n
         self.price_d = price_d
         self.offer_id = offer_id
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('selling_asset', StellarAssetType, 0),
-            3: ('buying_asset', StellarAssetType, 0),
-            4: ('amount', p.SVarintType, 0),
-            5: ('price_n', p.UVarintType, 0),
-            6: ('price_d', p.UVarintType, 0),
-            7: ('offer_id', p.UVarintType, 0),
-        }
@@ -2,17 +2,26 @@
 # fmt: off
 import protobuf as p
 
-from .StellarAssetType import StellarAssetType
-
 if __debug__:
     try:
         from typing import List
+        from .StellarAssetType import StellarAssetType
     except ImportError:
         List = None  # type: ignore
 
 
 class StellarPathPaymentOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 212
+    FIELDS = (
+        None,
+        ('source_account', p.TYPE_UNICODE, 0),  # 1
+        ('send_asset', 'StellarAssetType', 0),  # 2
+        ('send_max', p.TYPE_SVARINT, 0),  # 3
+        ('destination_account', p.TYPE_UNICODE, 0),  # 4
+        ('destination_asset', 'StellarAssetType', 0),  # 5
+        ('destination_amount', p.TYPE_SVARINT, 0),  # 6
+        ('paths', 'StellarAssetType', p.FLAG_REPEATED),  # 7
+    )
 
     def __init__(
         self,
@@ -31,15 +40,3 @@ class StellarPathPaymentOp(p.MessageType):
         self.destination_asset = destination_asset
         self.destination_amount = destination_amount
         self.paths = paths if paths is not None else []
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('send_asset', StellarAssetType, 0),
-            3: ('send_max', p.SVarintType, 0),
-            4: ('destination_account', p.UnicodeType, 0),
-            5: ('destination_asset', StellarAssetType, 0),
-            6: ('destination_amount', p.SVarintType, 0),
-            7: ('paths', StellarAssetType, p.FLAG_REPEATED),
-        }
@@ -2,11 +2,23 @@
 # fmt: off
 import protobuf as p
 
-from .StellarAssetType import StellarAssetType
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .StellarAssetType import StellarAssetType
+    except ImportError:
+        pass
 
 
 class StellarPaymentOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 211
+    FIELDS = (
+        None,
+        ('source_account', p.TYPE_UNICODE, 0),  # 1
+        ('destination_account', p.TYPE_UNICODE, 0),  # 2
+        ('asset', 'StellarAssetType', 0),  # 3
+        ('amount', p.TYPE_SVARINT, 0),  # 4
+    )
 
     def __init__(
         self,
@@ -19,12 +31,3 @@ class StellarPaymentOp(p.MessageType):
         self.destination_account = destination_account
         self.asset = asset
         self.amount = amount
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('destination_account', p.UnicodeType, 0),
-            3: ('asset', StellarAssetType, 0),
-            4: ('amount', p.SVarintType, 0),
-        }
@@ -5,6 +5,21 @@ import protobuf as p
 
 class StellarSetOptionsOp(p.MessageType):
     MESSAGE_WIRE_TYPE = 215
+    FIELDS = (
+        None,
+        ('source_account', p.TYPE_UNICODE, 0),  # 1
+        ('inflation_destination_account', p.TYPE_UNICODE, 0),  # 2
+        ('clear_flags', p.TYPE_UVARINT, 0),  # 3
+        ('set_flags', p.TYPE_UVARINT, 0),  # 4
+        ('master_weight', p.TYPE_UVARINT, 0),  # 5
+        ('low_threshold', p.TYPE_UVARINT, 0),  # 6
+        ('medium_threshold', p.TYPE_UVARINT, 0),  # 7
+        ('high_threshold', p.TYPE_UVARINT, 0),  # 8
+        ('home_domain', p.TYPE_UNICODE, 0),  # 9
+        ('signer_type', p.TYPE_UVARINT, 0),  # 10
+        ('signer_key', p.TYPE_BYTES, 0),  # 11
+        ('signer_weight', p.TYPE_UVARINT, 0),  # 12
+    )
 
     def __init__(
         self,
@@ -33,20 +48,3 @@ class StellarSetOptionsOp(p.MessageType):
         self.signer_type = signer_type
         self.signer_key = signer_key
         self.signer_weight = signer_weight
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('source_account', p.UnicodeType, 0),
-            2: ('inflation_destination_account', p.UnicodeType, 0),
-            3: ('clear_flags', p.UVarintType, 0),
-            4: ('set_flags', p.UVarintType, 0),
-            5: ('master_weight', p.UVarintType, 0),
-            6: ('low_threshold', p.UVarintType, 0),
-            7: ('medium_threshold', p.UVarintType, 0),
-            8: ('high_threshold', p.UVarintType, 0),
-            9: ('home_domain', p.UnicodeType, 0),
-            10: ('signer_type', p.UVarintType, 0),
-            11: ('signer_key', p.BytesType, 0),
-            12: ('signer_weight', p.UVarintType, 0),
-        }
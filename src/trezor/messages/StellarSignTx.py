@@ -11,6 +11,23 @@ if __debug__:
 
 class StellarSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 202
+    FIELDS = (
+        None,
+        None,  # 1
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 2
+        ('network_passphrase', p.TYPE_UNICODE, 0),  # 3
+        ('source_account', p.TYPE_UNICODE, 0),  # 4
+        ('fee', p.TYPE_UVARINT, 0),  # 5
+        ('sequence_number', p.TYPE_UVARINT, 0),  # 6
+        None,  # 7
+        ('timebounds_start', p.TYPE_UVARINT, 0),  # 8
+        ('timebounds_end', p.TYPE_UVARINT, 0),  # 9
+        ('memo_type', p.TYPE_UVARINT, 0),  # 10
+        ('memo_text', p.TYPE_UNICODE, 0),  # 11
+        ('memo_id', p.TYPE_UVARINT, 0),  # 12
+        ('memo_hash', p.TYPE_BYTES, 0),  # 13
+        ('num_operations', p.TYPE_UVARINT, 0),  # 14
+    )
 
     def __init__(
         self,
@@ -39,20 +56,3 @@ class StellarSignTx(p.MessageType):
         self.memo_id = memo_id
         self.memo_hash = memo_hash
         self.num_operations = num_operations
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            3: ('network_passphrase', p.UnicodeType, 0),
-            4: ('source_account', p.UnicodeType, 0),
-            5: ('fee', p.UVarintType, 0),
-            6: ('sequence_number', p.UVarintType, 0),
-            8: ('timebounds_start', p.UVarintType, 0),
-            9: ('timebounds_end', p.UVarintType, 0),
-            10: ('memo_type', p.UVarintType, 0),
-            11: ('memo_text', p.UnicodeType, 0),
-            12: ('memo_id', p.UVarintType, 0),
-            13: ('memo_hash', p.BytesType, 0),
-            14: ('num_operations', p.UVarintType, 0),
-        }
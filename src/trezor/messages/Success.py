@@ -5,15 +5,13 @@ import protobuf as p
 
 class Success(p.MessageType):
     MESSAGE_WIRE_TYPE = 2
+    FIELDS = (
+        None,
+        ('message', p.TYPE_UNICODE, 0),  # 1
+    )
 
     def __init__(
         self,
         message: str = None,
     ) -> None:
         self.message = message
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('message', p.UnicodeType, 0),
-        }
@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class TezosContractID(p.MessageType):
+    FIELDS = (
+        None,
+        ('tag', p.TYPE_UVARINT, 0),  # 1
+        ('hash', p.TYPE_BYTES, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -12,10 +17,3 @@ class TezosContractID(p.MessageType):
     ) -> None:
         self.tag = tag
         self.hash = hash
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('tag', p.UVarintType, 0),
-            2: ('hash', p.BytesType, 0),
-        }
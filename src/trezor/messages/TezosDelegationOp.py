@@ -2,10 +2,24 @@
 # fmt: off
 import protobuf as p
 
-from .TezosContractID import TezosContractID
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .TezosContractID import TezosContractID
+    except ImportError:
+        pass
 
 
 class TezosDelegationOp(p.MessageType):
+    FIELDS = (
+        None,
+        ('source', 'TezosContractID', 0),  # 1
+        ('fee', p.TYPE_UVARINT, 0),  # 2
+        ('counter', p.TYPE_UVARINT, 0),  # 3
+        ('gas_limit', p.TYPE_UVARINT, 0),  # 4
+        ('storage_limit', p.TYPE_UVARINT, 0),  # 5
+        ('delegate', p.TYPE_BYTES, 0),  # 6
+    )
 
     def __init__(
         self,
@@ -22,14 +36,3 @@ class TezosDelegationOp(p.MessageType):
         self.gas_limit = gas_limit
         self.storage_limit = storage_limit
         self.delegate = delegate
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('source', TezosContractID, 0),
-            2: ('fee', p.UVarintType, 0),
-            3: ('counter', p.UVarintType, 0),
-            4: ('gas_limit', p.UVarintType, 0),
-            5: ('storage_limit', p.UVarintType, 0),
-            6: ('delegate', p.BytesType, 0),
-        }
@@ -2,10 +2,29 @@
 # fmt: off
 import protobuf as p
 
-from .TezosContractID import TezosContractID
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .TezosContractID import TezosContractID
+    except ImportError:
+        pass
 
 
 class TezosOriginationOp(p.MessageType):
+    FIELDS = (
+        None,
+        ('source', 'TezosContractID', 0),  # 1
+        ('fee', p.TYPE_UVARINT, 0),  # 2
+        ('counter', p.TYPE_UVARINT, 0),  # 3
+        ('gas_limit', p.TYPE_UVARINT, 0),  # 4
+        ('storage_limit', p.TYPE_UVARINT, 0),  # 5
+        ('manager_pubkey', p.TYPE_BYTES, 0),  # 6
+        ('balance', p.TYPE_UVARINT, 0),  # 7
+        ('spendable', p.TYPE_BOOL, 0),  # 8
+        ('delegatable', p.TYPE_BOOL, 0),  # 9
+        ('delegate', p.TYPE_BYTES, 0),  # 10
+        ('script', p.TYPE_BYTES, 0),  # 11
+    )
 
     def __init__(
         self,
@@ -32,19 +51,3 @@ class TezosOriginationOp(p.MessageType):
         self.delegatable = delegatable
         self.delegate = delegate
         self.script = script
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('source', TezosContractID, 0),
-            2: ('fee', p.UVarintType, 0),
-            3: ('counter', p.UVarintType, 0),
-            4: ('gas_limit', p.UVarintType, 0),
-            5: ('storage_limit', p.UVarintType, 0),
-            6: ('manager_pubkey', p.BytesType, 0),
-            7: ('balance', p.UVarintType, 0),
-            8: ('spendable', p.BoolType, 0),
-            9: ('delegatable', p.BoolType, 0),
-            10: ('delegate', p.BytesType, 0),
-            11: ('script', p.BytesType, 0),
-        }
@@ -2,20 +2,28 @@
 # fmt: off
 import protobuf as p
 
-from .TezosDelegationOp import TezosDelegationOp
-from .TezosOriginationOp import TezosOriginationOp
-from .TezosRevealOp import TezosRevealOp
-from .TezosTransactionOp import TezosTransactionOp
-
 if __debug__:
     try:
         from typing import List
+        from .TezosDelegationOp import TezosDelegationOp
+        from .TezosOriginationOp import TezosOriginationOp
+        from .TezosRevealOp import TezosRevealOp
+        from .TezosTransactionOp import TezosTransactionOp
     except ImportError:
         List = None  # type: ignore
 
 
 class TezosSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 152
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('branch', p.TYPE_BYTES, 0),  # 2
+        ('reveal', 'TezosRevealOp', 0),  # 3
+        ('transaction', 'TezosTransactionOp', 0),  # 4
+        ('origination', 'TezosOriginationOp', 0),  # 5
+        ('delegation', 'TezosDelegationOp', 0),  # 6
+    )
 
     def __init__(
         self,
@@ -32,14 +40,3 @@ class TezosSignTx(p.MessageType):
         self.transaction = transaction
         self.origination = origination
         self.delegation = delegation
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('branch', p.BytesType, 0),
-            3: ('reveal', TezosRevealOp, 0),
-            4: ('transaction', TezosTransactionOp, 0),
-            5: ('origination', TezosOriginationOp, 0),
-            6: ('delegation', TezosDelegationOp, 0),
-        }
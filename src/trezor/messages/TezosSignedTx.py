@@ -5,6 +5,12 @@ import protobuf as p
 
 class TezosSignedTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 153
+    FIELDS = (
+        None,
+        ('signature', p.TYPE_UNICODE, 0),  # 1
+        ('sig_op_contents', p.TYPE_BYTES, 0),  # 2
+        ('operation_hash', p.TYPE_UNICODE, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -15,11 +21,3 @@ class TezosSignedTx(p.MessageType):
         self.signature = signature
         self.sig_op_contents = sig_op_contents
         self.operation_hash = operation_hash
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('signature', p.UnicodeType, 0),
-            2: ('sig_op_contents', p.BytesType, 0),
-            3: ('operation_hash', p.UnicodeType, 0),
-        }
@@ -2,10 +2,26 @@
 # fmt: off
 import protobuf as p
 
-from .TezosContractID import TezosContractID
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .TezosContractID import TezosContractID
+    except ImportError:
+        pass
 
 
 class TezosTransactionOp(p.MessageType):
+    FIELDS = (
+        None,
+        ('source', 'TezosContractID', 0),  # 1
+        ('fee', p.TYPE_UVARINT, 0),  # 2
+        ('counter', p.TYPE_UVARINT, 0),  # 3
+        ('gas_limit', p.TYPE_UVARINT, 0),  # 4
+        ('storage_limit', p.TYPE_UVARINT, 0),  # 5
+        ('amount', p.TYPE_UVARINT, 0),  # 6
+        ('destination', 'TezosContractID', 0),  # 7
+        ('parameters', p.TYPE_BYTES, 0),  # 8
+    )
 
     def __init__(
         self,
@@ -26,16 +42,3 @@ class TezosTransactionOp(p.MessageType):
         self.amount = amount
         self.destination = destination
         self.parameters = parameters
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('source', TezosContractID, 0),
-            2: ('fee', p.UVarintType, 0),
-            3: ('counter', p.UVarintType, 0),
-            4: ('gas_limit', p.UVarintType, 0),
-            5: ('storage_limit', p.UVarintType, 0),
-            6: ('amount', p.UVarintType, 0),
-            7: ('destination', TezosContractID, 0),
-            8: ('parameters', p.BytesType, 0),
-        }
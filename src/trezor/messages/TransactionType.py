@@ -2,18 +2,31 @@
 # fmt: off
 import protobuf as p
 
-from .TxInputType import TxInputType
-from .TxOutputBinType import TxOutputBinType
-from .TxOutputType import TxOutputType
-
 if __debug__:
     try:
         from typing import List
+        from .TxInputType import TxInputType
+        from .TxOutputBinType import TxOutputBinType
+        from .TxOutputType import TxOutputType
     except ImportError:
         List = None  # type: ignore
 
 
 class TransactionType(p.MessageType):
+    FIELDS = (
+        None,
+        ('version', p.TYPE_UVARINT, 0),  # 1
+        ('inputs', 'TxInputType', p.FLAG_REPEATED),  # 2
+        ('bin_outputs', 'TxOutputBinType', p.FLAG_REPEATED),  # 3
+        ('lock_time', p.TYPE_UVARINT, 0),  # 4
+        ('outputs', 'TxOutputType', p.FLAG_REPEATED),  # 5
+        ('inputs_cnt', p.TYPE_UVARINT, 0),  # 6
+        ('outputs_cnt', p.TYPE_UVARINT, 0),  # 7
+        ('extra_data', p.TYPE_BYTES, 0),  # 8
+        ('extra_data_len', p.TYPE_UVARINT, 0),  # 9
+        ('expiry', p.TYPE_UVARINT, 0),  # 10
+        ('overwintered', p.TYPE_BOOL, 0),  # 11
+    )
 
     def __init__(
         self,
@@ -40,19 +53,3 @@ class TransactionType(p.MessageType):
         self.extra_data_len = extra_data_len
         self.expiry = expiry
         self.overwintered = overwintered
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('version', p.UVarintType, 0),
-            2: ('inputs', TxInputType, p.FLAG_REPEATED),
-            3: ('bin_outputs', TxOutputBinType, p.FLAG_REPEATED),
-            4: ('lock_time', p.UVarintType, 0),
-            5: ('outputs', TxOutputType, p.FLAG_REPEATED),
-            6: ('inputs_cnt', p.UVarintType, 0),
-            7: ('outputs_cnt', p.UVarintType, 0),
-            8: ('extra_data', p.BytesType, 0),
-            9: ('extra_data_len', p.UVarintType, 0),
-            10: ('expiry', p.UVarintType, 0),
-            11: ('overwintered', p.BoolType, 0),
-        }
@@ -4,15 +4,13 @@ import protobuf as p
 
 
 class TronAccountUpdateContract(p.MessageType):
+    FIELDS = (
+        None,
+        ('account_name', p.TYPE_UNICODE, 0),  # 1
+    )
 
     def __init__(
         self,
         account_name: str = None,
     ) -> None:
         self.account_name = account_name
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('account_name', p.UnicodeType, 0),
-        }
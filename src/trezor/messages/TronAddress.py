@@ -5,15 +5,13 @@ import protobuf as p
 
 class TronAddress(p.MessageType):
     MESSAGE_WIRE_TYPE = 251
+    FIELDS = (
+        None,
+        ('address', p.TYPE_UNICODE, 0),  # 1
+    )
 
     def __init__(
         self,
         address: str = None,
     ) -> None:
         self.address = address
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address', p.UnicodeType, 0),
-        }
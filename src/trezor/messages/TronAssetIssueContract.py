@@ -2,16 +2,29 @@
 # fmt: off
 import protobuf as p
 
-from .TronFrozenSupply import TronFrozenSupply
-
 if __debug__:
     try:
         from typing import List
+        from .TronFrozenSupply import TronFrozenSupply
     except ImportError:
         List = None  # type: ignore
 
 
 class TronAssetIssueContract(p.MessageType):
+    FIELDS = (
+        None,
+        None,  # 1
+        ('name', p.TYPE_UNICODE, 0),  # 2
+        ('abbr', p.TYPE_UNICODE, 0),  # 3
+        ('total_supply', p.TYPE_UVARINT, 0),  # 4
+        ('frozen_supply', 'TronFrozenSupply', p.FLAG_REPEATED),  # 5
+        ('trx_num', p.TYPE_UVARINT, 0),  # 6
+        ('num', p.TYPE_UVARINT, 0),  # 7
+        ('start_time', p.TYPE_UVARINT, 0),  # 8
+        ('end_time', p.TYPE_UVARINT, 0),  # 9
+        ('description', p.TYPE_UNICODE, 0),  # 10
+        ('url', p.TYPE_UNICODE, 0),  # 11
+    )
 
     def __init__(
         self,
@@ -36,18 +49,3 @@ class TronAssetIssueContract(p.MessageType):
         self.end_time = end_time
         self.description = description
         self.url = url
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            2: ('name', p.UnicodeType, 0),
-            3: ('abbr', p.UnicodeType, 0),
-            4: ('total_supply', p.UVarintType, 0),
-            5: ('frozen_supply', TronFrozenSupply, p.FLAG_REPEATED),
-            6: ('trx_num', p.UVarintType, 0),
-            7: ('num', p.UVarintType, 0),
-            8: ('start_time', p.UVarintType, 0),
-            9: ('end_time', p.UVarintType, 0),
-            10: ('description', p.UnicodeType, 0),
-            11: ('url', p.UnicodeType, 0),
-        }
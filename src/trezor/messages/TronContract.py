@@ -2,25 +2,51 @@
 # fmt: off
 import protobuf as p
 
-from .TronAccountUpdateContract import TronAccountUpdateContract
-from .TronAssetIssueContract import TronAssetIssueContract
-from .TronFreezeBalanceContract import TronFreezeBalanceContract
-from .TronParticipateAssetIssueContract import TronParticipateAssetIssueContract
-from .TronProposalApproveContract import TronProposalApproveContract
-from .TronProposalCreateContract import TronProposalCreateContract
-from .TronProposalDeleteContract import TronProposalDeleteContract
-from .TronTransferAssetContract import TronTransferAssetContract
-from .TronTransferContract import TronTransferContract
-from .TronUnfreezeAssetContract import TronUnfreezeAssetContract
-from .TronUnfreezeBalanceContract import TronUnfreezeBalanceContract
-from .TronUpdateAssetContract import TronUpdateAssetContract
-from .TronVoteWitnessContract import TronVoteWitnessContract
-from .TronWithdrawBalanceContract import TronWithdrawBalanceContract
-from .TronWitnessCreateContract import TronWitnessCreateContract
-from .TronWitnessUpdateContract import TronWitnessUpdateContract
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .TronAccountUpdateContract import TronAccountUpdateContract
+        from .TronAssetIssueContract import TronAssetIssueContract
+        from .TronFreezeBalanceContract import TronFreezeBalanceContract
+        from .TronParticipateAssetIssueContract import TronParticipateAssetIssueContract
+        from .TronProposalApproveContract import TronProposalApproveContract
+        from .TronProposalCreateContract import TronProposalCreateContract
+        from .TronProposalDeleteContract import TronProposalDeleteContract
+        from .TronTransferAssetContract import TronTransferAssetContract
+        from .TronTransferContract import TronTransferContract
+        from .TronUnfreezeAssetContract import TronUnfreezeAssetContract
+        from .TronUnfreezeBalanceContract import TronUnfreezeBalanceContract
+        from .TronUpdateAssetContract import TronUpdateAssetContract
+        from .TronVoteWitnessContract import TronVoteWitnessContract
+        from .TronWithdrawBalanceContract import TronWithdrawBalanceContract
+        from .TronWitnessCreateContract import TronWitnessCreateContract
+        from .TronWitnessUpdateContract import TronWitnessUpdateContract
+    except ImportError:
+        pass
 
 
 class TronContract(p.MessageType):
+    FIELDS = (
+        None,
+        ('transfer_contract', 'TronTransferContract', 0),  # 1
+        ('transfer_asset_contract', 'TronTransferAssetContract', 0),  # 2
+        None,  # 3
+        ('vote_witness_contract', 'TronVoteWitnessContract', 0),  # 4
+        ('witness_create_contract', 'TronWitnessCreateContract', 0),  # 5
+        ('asset_issue_contract', 'TronAssetIssueContract', 0),  # 6
+        None,  # 7
+        ('witness_update_contract', 'TronWitnessUpdateContract', 0),  # 8
+        ('participate_asset_issue_contract', 'TronParticipateAssetIssueContract', 0),  # 9
+        ('account_update_contract', 'TronAccountUpdateContract', 0),  # 10
+        ('freeze_balance_contract', 'TronFreezeBalanceContract', 0),  # 11
+        ('unfreeze_balance_contract', 'TronUnfreezeBalanceContract', 0),  # 12
+        ('withdraw_balance_contract', 'TronWithdrawBalanceContract', 0),  # 13
+        ('unfreeze_asset_contract', 'TronUnfreezeAssetContract', 0),  # 14
+        ('update_asset_contract', 'TronUpdateAssetContract', 0),  # 15
+        ('proposal_create_contract', 'TronProposalCreateContract', 0),  # 16
+        ('proposal_approve_contract', 'TronProposalApproveContract', 0),  # 17
+        ('proposal_delete_contract', 'TronProposalDeleteContract', 0),  # 18
+    )
 
     def __init__(
         self,
@@ -57,24 +83,3 @@ class TronContract(p.MessageType):
         self.proposal_create_contract = proposal_create_contract
         self.proposal_approve_contract = proposal_approve_contract
         self.proposal_delete_contract = proposal_delete_contract
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('transfer_contract', TronTransferContract, 0),
-            2: ('transfer_asset_contract', TronTransferAssetContract, 0),
-            4: ('vote_witness_contract', TronVoteWitnessContract, 0),
-            5: ('witness_create_contract', TronWitnessCreateContract, 0),
-            6: ('asset_issue_contract', TronAssetIssueContract, 0),
-            8: ('witness_update_contract', TronWitnessUpdateContract, 0),
-            9: ('participate_asset_issue_contract', TronParticipateAssetIssueContract, 0),
-            10: ('account_update_contract', TronAccountUpdateContract, 0),
-            11: ('freeze_balance_contract', TronFreezeBalanceContract, 0),
-            12: ('unfreeze_balance_contract', TronUnfreezeBalanceContract, 0),
-            13: ('withdraw_balance_contract', TronWithdrawBalanceContract, 0),
-            14: ('unfreeze_asset_contract', TronUnfreezeAssetContract, 0),
-            15: ('update_asset_contract', TronUpdateAssetContract, 0),
-            16: ('proposal_create_contract', TronProposalCreateContract, 0),
-            17: ('proposal_approve_contract', TronProposalApproveContract, 0),
-            18: ('proposal_delete_contract', TronProposalDeleteContract, 0),
-        }
@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class TronFreezeBalanceContract(p.MessageType):
+    FIELDS = (
+        None,
+        ('frozen_balance', p.TYPE_UVARINT, 0),  # 1
+        ('frozen_duration', p.TYPE_UVARINT, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -12,10 +17,3 @@ class TronFreezeBalanceContract(p.MessageType):
     ) -> None:
         self.frozen_balance = frozen_balance
         self.frozen_duration = frozen_duration
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('frozen_balance', p.UVarintType, 0),
-            2: ('frozen_duration', p.UVarintType, 0),
-        }
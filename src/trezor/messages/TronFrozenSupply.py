@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class TronFrozenSupply(p.MessageType):
+    FIELDS = (
+        None,
+        ('frozen_amount', p.TYPE_UVARINT, 0),  # 1
+        ('frozen_days', p.TYPE_UVARINT, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -12,10 +17,3 @@ class TronFrozenSupply(p.MessageType):
     ) -> None:
         self.frozen_amount = frozen_amount
         self.frozen_days = frozen_days
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('frozen_amount', p.UVarintType, 0),
-            2: ('frozen_days', p.UVarintType, 0),
-        }
@@ -4,6 +4,12 @@ import protobuf as p
 
 
 class TronParticipateAssetIssueContract(p.MessageType):
+    FIELDS = (
+        None,
+        ('to_address', p.TYPE_BYTES, 0),  # 1
+        ('asset_name', p.TYPE_UNICODE, 0),  # 2
+        ('amount', p.TYPE_UVARINT, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -14,11 +20,3 @@ class TronParticipateAssetIssueContract(p.MessageType):
         self.to_address = to_address
         self.asset_name = asset_name
         self.amount = amount
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('to_address', p.BytesType, 0),
-            2: ('asset_name', p.UnicodeType, 0),
-            3: ('amount', p.UVarintType, 0),
-        }
@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class TronProposalApproveContract(p.MessageType):
+    FIELDS = (
+        None,
+        ('proposal_id', p.TYPE_UVARINT, 0),  # 1
+        ('is_add_approval', p.TYPE_BOOL, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -12,10 +17,3 @@ class TronProposalApproveContract(p.MessageType):
     ) -> None:
         self.proposal_id = proposal_id
         self.is_add_approval = is_add_approval
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('proposal_id', p.UVarintType, 0),
-            2: ('is_add_approval', p.BoolType, 0),
-        }
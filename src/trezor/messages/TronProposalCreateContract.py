@@ -2,25 +2,22 @@
 # fmt: off
 import protobuf as p
 
-from .TronProposalParameters import TronProposalParameters
-
 if __debug__:
     try:
         from typing import List
+        from .TronProposalParameters import TronProposalParameters
     except ImportError:
         List = None  # type: ignore
 
 
 class TronProposalCreateContract(p.MessageType):
+    FIELDS = (
+        None,
+        ('parameters', 'TronProposalParameters', p.FLAG_REPEATED),  # 1
+    )
 
     def __init__(
         self,
         parameters: List[TronProposalParameters] = None,
     ) -> None:
         self.parameters = parameters if parameters is not None else []
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('parameters', TronProposalParameters, p.FLAG_REPEATED),
-        }
@@ -4,15 +4,13 @@ import protobuf as p
 
 
 class TronProposalDeleteContract(p.MessageType):
+    FIELDS = (
+        None,
+        ('proposal_id', p.TYPE_UVARINT, 0),  # 1
+    )
 
     def __init__(
         self,
         proposal_id: int = None,
     ) -> None:
         self.proposal_id = proposal_id
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('proposal_id', p.UVarintType, 0),
-        }
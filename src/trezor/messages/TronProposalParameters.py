@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class TronProposalParameters(p.MessageType):
+    FIELDS = (
+        None,
+        ('key', p.TYPE_UVARINT, 0),  # 1
+        ('value', p.TYPE_UVARINT, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -12,10 +17,3 @@ class TronProposalParameters(p.MessageType):
     ) -> None:
         self.key = key
         self.value = value
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('key', p.UVarintType, 0),
-            2: ('value', p.UVarintType, 0),
-        }
@@ -2,17 +2,26 @@
 # fmt: off
 import protobuf as p
 
-from .TronContract import TronContract
-
 if __debug__:
     try:
         from typing import List
+        from .TronContract import TronContract
     except ImportError:
         List = None  # type: ignore
 
 
 class TronSignTx(p.MessageType):
     MESSAGE_WIRE_TYPE = 252
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('ref_block_bytes', p.TYPE_BYTES, 0),  # 2
+        ('ref_block_hash', p.TYPE_BYTES, 0),  # 3
+        ('expiration', p.TYPE_UVARINT, 0),  # 4
+        ('data', p.TYPE_UNICODE, 0),  # 5
+        ('contract', 'TronContract', 0),  # 6
+        ('timestamp', p.TYPE_UVARINT, 0),  # 7
+    )
 
     def __init__(
         self,
@@ -31,15 +40,3 @@ class TronSignTx(p.MessageType):
         self.data = data
         self.contract = contract
         self.timestamp = timestamp
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('ref_block_bytes', p.BytesType, 0),
-            3: ('ref_block_hash', p.BytesType, 0),
-            4: ('expiration', p.UVarintType, 0),
-            5: ('data', p.UnicodeType, 0),
-            6: ('contract', TronContract, 0),
-            7: ('timestamp', p.UVarintType, 0),
-        }
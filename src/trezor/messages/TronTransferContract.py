@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class TronTransferContract(p.MessageType):
+    FIELDS = (
+        None,
+        ('to_address', p.TYPE_BYTES, 0),  # 1
+        ('amount', p.TYPE_UVARINT, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -12,10 +17,3 @@ class TronTransferContract(p.MessageType):
     ) -> None:
         self.to_address = to_address
         self.amount = amount
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('to_address', p.BytesType, 0),
-            2: ('amount', p.UVarintType, 0),
-        }
@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class TronUpdateAssetContract(p.MessageType):
+    FIELDS = (
+        None,
+        ('description', p.TYPE_UNICODE, 0),  # 1
+        ('url', p.TYPE_UNICODE, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -12,10 +17,3 @@ class TronUpdateAssetContract(p.MessageType):
     ) -> None:
         self.description = description
         self.url = url
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('description', p.UnicodeType, 0),
-            2: ('url', p.UnicodeType, 0),
-        }
@@ -4,6 +4,11 @@ import protobuf as p
 
 
 class TronVote(p.MessageType):
+    FIELDS = (
+        None,
+        ('vote_address', p.TYPE_BYTES, 0),  # 1
+        ('vote_count', p.TYPE_UVARINT, 0),  # 2
+    )
 
     def __init__(
         self,
@@ -12,10 +17,3 @@ class TronVote(p.MessageType):
     ) -> None:
         self.vote_address = vote_address
         self.vote_count = vote_count
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('vote_address', p.BytesType, 0),
-            2: ('vote_count', p.UVarintType, 0),
-        }
@@ -2,25 +2,22 @@
 # fmt: off
 import protobuf as p
 
-from .TronVote import TronVote
-
 if __debug__:
     try:
         from typing import List
+        from .TronVote import TronVote
     except ImportError:
         List = None  # type: ignore
 
 
 class TronVoteWitnessContract(p.MessageType):
+    FIELDS = (
+        None,
+        ('votes', 'TronVote', p.FLAG_REPEATED),  # 1
+    )
 
     def __init__(
         self,
         votes: List[TronVote] = None,
     ) -> None:
         self.votes = votes if votes is not None else []
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('votes', TronVote, p.FLAG_REPEATED),
-        }
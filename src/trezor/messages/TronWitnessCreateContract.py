@@ -4,15 +4,13 @@ import protobuf as p
 
 
 class TronWitnessCreateContract(p.MessageType):
+    FIELDS = (
+        None,
+        ('url', p.TYPE_UNICODE, 0),  # 1
+    )
 
     def __init__(
         self,
         url: str = None,
     ) -> None:
         self.url = url
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('url', p.UnicodeType, 0),
-        }
@@ -4,15 +4,14 @@ import protobuf as p
 
 
 class TronWitnessUpdateContract(p.MessageType):
+    FIELDS = (
+        None,
+        None,  # 1
+        ('update_url', p.TYPE_UNICODE, 0),  # 2
+    )
 
     def __init__(
         self,
         update_url: str = None,
     ) -> None:
         self.update_url = update_url
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            2: ('update_url', p.UnicodeType, 0),
-        }
@@ -2,20 +2,23 @@
 # fmt: off
 import protobuf as p
 
-from .TransactionType import TransactionType
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .TransactionType import TransactionType
+    except ImportError:
+        pass
 
 
 class TxAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 22
+    FIELDS = (
+        None,
+        ('tx', 'TransactionType', 0),  # 1
+    )
 
     def __init__(
         self,
         tx: TransactionType = None,
     ) -> None:
         self.tx = tx
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('tx', TransactionType, 0),
-        }
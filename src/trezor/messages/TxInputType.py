@@ -2,16 +2,30 @@
 # fmt: off
 import protobuf as p
 
-from .MultisigRedeemScriptType import MultisigRedeemScriptType
-
 if __debug__:
     try:
         from typing import List
+        from .MultisigRedeemScriptType import MultisigRedeemScriptType
     except ImportError:
         List = None  # type: ignore
 
 
 class TxInputType(p.MessageType):
+    FIELDS = (
+        None,
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 1
+        ('prev_hash', p.TYPE_BYTES, 0),  # 2, required
+        ('prev_index', p.TYPE_UVARINT, 0),  # 3, required
+        ('script_sig', p.TYPE_BYTES, 0),  # 4
+        ('sequence', p.TYPE_UVARINT, 0),  # 5, default=4294967295
+        ('script_type', p.TYPE_UVARINT, 0),  # 6, default=SPENDADDRESS
+        ('multisig', 'MultisigRedeemScriptType', 0),  # 7
+        ('amount', p.TYPE_UVARINT, 0),  # 8
+        ('decred_tree', p.TYPE_UVARINT, 0),  # 9
+        ('decred_script_version', p.TYPE_UVARINT, 0),  # 10
+        ('prev_block_hash_bip115', p.TYPE_BYTES, 0),  # 11
+        ('prev_block_height_bip115', p.TYPE_UVARINT, 0),  # 12
+    )
 
     def __init__(
         self,
@@ -40,20 +54,3 @@ class TxInputType(p.MessageType):
         self.decred_script_version = decred_script_version
         self.prev_block_hash_bip115 = prev_block_hash_bip115
         self.prev_block_height_bip115 = prev_block_height_bip115
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            2: ('prev_hash', p.BytesType, 0),  # required
-            3: ('prev_index', p.UVarintType, 0),  # required
-            4: ('script_sig', p.BytesType, 0),
-            5: ('sequence', p.UVarintType, 0),  # default=4294967295
-            6: ('script_type', p.UVarintType, 0),  # default=SPENDADDRESS
-            7: ('multisig', MultisigRedeemScriptType, 0),
-            8: ('amount', p.UVarintType, 0),
-            9: ('decred_tree', p.UVarintType, 0),
-            10: ('decred_script_version', p.UVarintType, 0),
-            11: ('prev_block_hash_bip115', p.BytesType, 0),
-            12: ('prev_block_height_bip115', p.UVarintType, 0),
-        }
@@ -4,6 +4,12 @@ import protobuf as p
 
 
 class TxOutputBinType(p.MessageType):
+    FIELDS = (
+        None,
+        ('amount', p.TYPE_UVARINT, 0),  # 1, required
+        ('script_pubkey', p.TYPE_BYTES, 0),  # 2, required
+        ('decred_script_version', p.TYPE_UVARINT, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -14,11 +20,3 @@ class TxOutputBinType(p.MessageType):
         self.amount = amount
         self.script_pubkey = script_pubkey
         self.decred_script_version = decred_script_version
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('amount', p.UVarintType, 0),  # required
-            2: ('script_pubkey', p.BytesType, 0),  # required
-            3: ('decred_script_version', p.UVarintType, 0),
-        }
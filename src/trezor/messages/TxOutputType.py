@@ -2,16 +2,27 @@
 # fmt: off
 import protobuf as p
 
-from .MultisigRedeemScriptType import MultisigRedeemScriptType
-
 if __debug__:
     try:
         from typing import List
+        from .MultisigRedeemScriptType import MultisigRedeemScriptType
     except ImportError:
         List = None  # type: ignore
 
 
 class TxOutputType(p.MessageType):
+    FIELDS = (
+        None,
+        ('address', p.TYPE_UNICODE, 0),  # 1
+        ('address_n', p.TYPE_UVARINT, p.FLAG_REPEATED),  # 2
+        ('amount', p.TYPE_UVARINT, 0),  # 3, required
+        ('script_type', p.TYPE_UVARINT, 0),  # 4, required
+        ('multisig', 'MultisigRedeemScriptType', 0),  # 5
+        ('op_return_data', p.TYPE_BYTES, 0),  # 6
+        ('decred_script_version', p.TYPE_UVARINT, 0),  # 7
+        ('block_hash_bip115', p.TYPE_BYTES, 0),  # 8
+        ('block_height_bip115', p.TYPE_UVARINT, 0),  # 9
+    )
 
     def __init__(
         self,
@@ -34,17 +45,3 @@ class TxOutputType(p.MessageType):
         self.decred_script_version = decred_script_version
         self.block_hash_bip115 = block_hash_bip115
         self.block_height_bip115 = block_height_bip115
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('address_n', p.UVarintType, p.FLAG_REPEATED),
-            3: ('amount', p.UVarintType, 0),  # required
-            4: ('script_type', p.UVarintType, 0),  # required
-            5: ('multisig', MultisigRedeemScriptType, 0),
-            6: ('op_return_data', p.BytesType, 0),
-            7: ('decred_script_version', p.UVarintType, 0),
-            8: ('block_hash_bip115', p.BytesType, 0),
-            9: ('block_height_bip115', p.UVarintType, 0),
-        }
@@ -2,12 +2,23 @@
 # fmt: off
 import protobuf as p
 
-from .TxRequestDetailsType import TxRequestDetailsType
-from .TxRequestSerializedType import TxRequestSerializedType
+if __debug__:
+    try:
+        import typing  # noqa: F401
+        from .TxRequestDetailsType import TxRequestDetailsType
+        from .TxRequestSerializedType import TxRequestSerializedType
+    except ImportError:
+        pass
 
 
 class TxRequest(p.MessageType):
     MESSAGE_WIRE_TYPE = 21
+    FIELDS = (
+        None,
+        ('request_type', p.TYPE_UVARINT, 0),  # 1
+        ('details', 'TxRequestDetailsType', 0),  # 2
+        ('serialized', 'TxRequestSerializedType', 0),  # 3
+    )
 
     def __init__(
         self,
@@ -18,11 +29,3 @@ class TxRequest(p.MessageType):
         self.request_type = request_type
         self.details = details
         self.serialized = serialized
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('request_type', p.UVarintType, 0),
-            2: ('details', TxRequestDetailsType, 0),
-            3: ('serialized', TxRequestSerializedType, 0),
-        }
@@ -4,6 +4,29 @@ import protobuf as p
 
 
 class TxRequestDetailsType(p.MessageType):
+    FIELDS = (
+        None,
+        ('request_index', p.TYPE_UVARINT, 0),  # 1
+        ('tx_hash', p.TYPE_BYTES, 0),  # 2
+        ('extra_data_len', p.TYPE_UVARINT, 0),  # 3
+        ('extra_data_offset', p.TYPE_UVARINT, 0),  # 4
+        None,  # 5
+        None,  # 6
+        None,  # 7
+        None,  # 8
+        None,  # 9
+        None,  # 10
+        None,  # 11
+        None,  # 12
+        None,  # 13
+        None,  # 14
+        None,  # 15
+        None,  # 16
+        None,  # 17
+        None,  # 18
+        None,  # 19
+        ('prefetch_count', p.TYPE_UVARINT, 0),  # 20
+    )
 
     def __init__(
         self,
@@ -11,17 +34,10 @@ class TxRequestDetailsType(p.MessageType):
         tx_hash: bytes = None,
         extra_data_len: int = None,
         extra_data_offset: int = None,
+        prefetch_count: int = None,
     ) -> None:
         self.request_index = request_index
         self.tx_hash = tx_hash
         self.extra_data_len = extra_data_len
         self.extra_data_offset = extra_data_offset
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('request_index', p.UVarintType, 0),
-            2: ('tx_hash', p.BytesType, 0),
-            3: ('extra_data_len', p.UVarintType, 0),
-            4: ('extra_data_offset', p.UVarintType, 0),
-        }
+        self.prefetch_count = prefetch_count
@@ -4,6 +4,12 @@ import protobuf as p
 
 
 class TxRequestSerializedType(p.MessageType):
+    FIELDS = (
+        None,
+        ('signature_index', p.TYPE_UVARINT, 0),  # 1
+        ('signature', p.TYPE_BYTES, 0),  # 2
+        ('serialized_tx', p.TYPE_BYTES, 0),  # 3
+    )
 
     def __init__(
         self,
@@ -14,11 +20,3 @@ class TxRequestSerializedType(p.MessageType):
         self.signature_index = signature_index
         self.signature = signature
         self.serialized_tx = serialized_tx
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('signature_index', p.UVarintType, 0),
-            2: ('signature', p.BytesType, 0),
-            3: ('serialized_tx', p.BytesType, 0),
-        }
@@ -5,6 +5,13 @@ import protobuf as p
 
 class VerifyMessage(p.MessageType):
     MESSAGE_WIRE_TYPE = 39
+    FIELDS = (
+        None,
+        ('address', p.TYPE_UNICODE, 0),  # 1
+        ('signature', p.TYPE_BYTES, 0),  # 2
+        ('message', p.TYPE_BYTES, 0),  # 3
+        ('coin_name', p.TYPE_UNICODE, 0),  # 4, default=Bitcoin
+    )
 
     def __init__(
         self,
@@ -17,12 +24,3 @@ class VerifyMessage(p.MessageType):
         self.signature = signature
         self.message = message
         self.coin_name = coin_name
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('address', p.UnicodeType, 0),
-            2: ('signature', p.BytesType, 0),
-            3: ('message', p.BytesType, 0),
-            4: ('coin_name', p.UnicodeType, 0),  # default=Bitcoin
-        }
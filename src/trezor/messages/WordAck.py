@@ -5,15 +5,13 @@ import protobuf as p
 
 class WordAck(p.MessageType):
     MESSAGE_WIRE_TYPE = 47
+    FIELDS = (
+        None,
+        ('word', p.TYPE_UNICODE, 0),  # 1, required
+    )
 
     def __init__(
         self,
         word: str = None,
     ) -> None:
         self.word = word
-
-    @classmethod
-    def get_fields(cls):
-        return {
-            1: ('word', p.UnicodeType, 0),  # required
-        }
@@ -1,10 +1,22 @@
+from trezor import utils
 from trezor.messages import MessageType
+from trezor.messages.wire_types import type_to_name  # noqa: F401
 
 if __debug__:
     from trezor import log
 
-type_to_name = {}  # int -> string, reverse table of wire_type mapping
 registered = {}  # int -> class, dynamically registered message types
+retained = {}  # int -> class, message types kept across workflows
+
+# message types received many times in a row, i.e. during transaction signing,
+# their classes are kept after the first import instead of being imported
+# again after every unimport, and their modules are never unimported
+_RETAINED_TYPES = (
+    MessageType.TxAck,
+    MessageType.TxRequest,
+    MessageType.EthereumTxAck,
+    MessageType.ButtonAck,
+)
 
 
 def register(msg_type):
@@ -19,14 +31,25 @@ def get_type(wire_type):
     if wire_type in registered:
         # message class is explicitly registered
         msg_type = registered[wire_type]
+    elif wire_type in retained:
+        # message class was already imported and is kept around
+        msg_type = retained[wire_type]
     else:
         # import message class from trezor.messages dynamically
         name = type_to_name[wire_type]
-        module = __import__("trezor.messages.%s" % name, None, None, (name,), 0)
-        msg_type = getattr(module, name)
+        msg_type = get_type_by_name(name)
+        if wire_type in _RETAINED_TYPES:
+            # the workflows import the same class, see `utils.keep_imported`
+            utils.keep_imported("trezor.messages." + name)
+            retained[wire_type] = msg_type
     return msg_type
 
 
-# build reverse table of wire types
-for msg_name in dir(MessageType):
-    type_to_name[getattr(MessageType, msg_name)] = msg_name
+def get_type_by_name(name):
+    """Get message class by name, i.e. for embedded message fields."""
+    # imported message modules are attributes of this package, so looking them
+    # up does not allocate, unimported ones are imported again
+    module = globals().get(name)
+    if module is None:
+        module = __import__("trezor.messages.%s" % name, None, None, (name,), 0)
+    return getattr(module, name)
@@ -7,18 +7,53 @@ from trezor import io, loop, res, utils, workflow
 
 display = Display()
 
-# in debug mode, display an indicator in top right corner
-if __debug__:
+# minimal interval between two refreshes of the display, in microseconds
+_FRAME_US = const(16000)
+_last_refresh = 0  # time of the last refresh
+_refresh_pending = False  # a refresh is scheduled for the next frame
 
-    def debug_display_refresh():
+
+def _refresh():
+    global _last_refresh
+
+    # in debug mode, display an indicator in top right corner
+    if __debug__:
         display.bar(Display.WIDTH - 8, 0, 8, 8, 0xF800)
-        display.refresh()
+    display.refresh()
+    _last_refresh = utime.ticks_us()
+
+
+async def _refresh_next_frame(delay: int):
+    global _refresh_pending
+
+    await loop.sleep(delay)
+    _refresh_pending = False
+    if display.dirty():
+        _refresh()
+
+
+def refresh_after_step():
+    """
+    Refresh the display after a task step, but only if the step drew anything
+    and at most once per frame.  Changes drawn too early after the previous
+    refresh get refreshed at the start of the next frame.
+    """
+    global _refresh_pending
+
+    if _refresh_pending or not display.dirty():
+        return
+    elapsed = utime.ticks_diff(utime.ticks_us(), _last_refresh)
+    if elapsed >= _FRAME_US:
+        _refresh()
+    else:
+        _refresh_pending = True
+        loop.schedule(_refresh_next_frame(_FRAME_US - elapsed))
 
-    loop.after_step_hook = debug_display_refresh
 
-# in both debug and production, emulator needs to draw the screen explicitly
-elif utils.EMULATOR:
-    loop.after_step_hook = display.refresh
+# in debug mode, refresh to draw the indicator, in both debug and production,
+# emulator needs to draw the screen explicitly
+if __debug__ or utils.EMULATOR:
+    loop.after_step_hook = refresh_after_step
 
 # re-export constants from modtrezorui
 NORMAL = Display.FONT_NORMAL
@@ -1,5 +1,6 @@
 import gc
 import sys
+import utime
 from trezorutils import (  # noqa: F401
     EMULATOR,
     GITREV,
@@ -13,25 +14,164 @@ from trezorutils import (  # noqa: F401
 )
 
 
+# Modules imported by a workflow are retained after it ends, so the next run
+# of the same workflow does not import them again.  Least recently used groups
+# of modules are unimported once the retained modules take more than
+# `retain_budget` bytes of heap, or once less than `retain_reserve` bytes of
+# heap stay free.
+retain_budget = 32 * 1024
+retain_reserve = 24 * 1024
+
+_retained = []  # [key, module names, heap size], least recently used first
+_retained_size = 0
+_kept = set()  # names of modules that are never unimported
+_sharing = 0  # number of running workflows, see `unimport_begin_shared`
+_shared_mods = None  # modules imported before the first of them started
+_shared_key = None  # key of their modules, None if they are not all the same
+
+
+def keep_imported(name):
+    """
+    Never unimport module `name`, i.e. a module whose objects are kept across
+    workflows.  Importing it again would create new objects, such as a second
+    class the kept one is not equal to.
+    """
+    _kept.add(name)
+
+
 def unimport_begin():
     return set(sys.modules)
 
 
-def unimport_end(mods):
-    for mod in sys.modules:
-        if mod not in mods:
-            # remove reference from sys.modules
-            del sys.modules[mod]
-            # remove reference from the parent module
-            i = mod.rfind(".")
-            if i < 0:
-                continue
-            path = mod[:i]
-            name = mod[i + 1 :]
-            if path in sys.modules:
-                delattr(sys.modules[path], name)
-    # collect removed modules
-    gc.collect()
+def unimport_end(mods, key=None):
+    """
+    Unimport modules that are not in `mods`, i.e. the modules imported since
+    `unimport_begin`, and collect them.  If `key` is given, the modules are
+    retained as a group of `key` instead, and only the least recently used
+    groups are unimported, if they do not fit the budget.  The heap is
+    collected only if needed, see `trezor.gcpolicy`.
+    """
+    global _retained_size
+    from trezor import gcpolicy
+
+    names = [mod for mod in sys.modules if mod not in mods and mod not in _kept]
+    if key is None:
+        _unimport(names)
+        if names:
+            gcpolicy.collect()
+        else:
+            gcpolicy.maybe_collect()
+        return
+
+    group = None
+    for g in _retained:
+        if g[0] == key:
+            group = g
+            break
+    if group is None:
+        group = [key, [], 0]
+    else:
+        _retained.remove(group)
+    _retained.append(group)  # most recently used
+    if names:
+        # modules of this group that were unimported with another group, or
+        # imported for the first time, and the heap they take
+        heap_alloc = gcpolicy.heap_alloc
+        gcpolicy.collect()
+        size = max(gcpolicy.heap_alloc - heap_alloc, 0)
+        group[1].extend(names)
+        group[2] += size
+        _retained_size += size
+    else:
+        gcpolicy.maybe_collect()
+
+    while _retained and (_retained_size > retain_budget or _low_on_heap()):
+        _, names, size = _retained.pop(0)
+        _unimport(names)
+        _retained_size -= size
+        gcpolicy.collect()
+
+
+def unimport_begin_shared(key):
+    """
+    Like `unimport_begin`, for workflows that run concurrently in several
+    sessions.  Only the first workflow takes the snapshot of the modules, and
+    only the last one to end unimports them in `unimport_end_shared`, so that
+    no workflow loses the modules another one still uses.  The modules are
+    retained as a group of `key` only if all the workflows were of that key.
+    """
+    global _sharing, _shared_mods, _shared_key
+    if not _sharing:
+        _shared_mods = unimport_begin()
+        _shared_key = key
+    elif key != _shared_key:
+        _shared_key = None
+    _sharing += 1
+
+
+def unimport_end_shared():
+    """
+    End a workflow started with `unimport_begin_shared`, see `unimport_end`.
+    """
+    global _sharing, _shared_mods
+    _sharing -= 1
+    if not _sharing:
+        mods = _shared_mods
+        _shared_mods = None
+        unimport_end(mods, _shared_key)
+
+
+def _low_on_heap():
+    from trezor import gcpolicy
+
+    # garbage counts as allocated until it is collected, so check again after
+    # a collection before evicting anything
+    if gc.mem_free() >= retain_reserve:
+        return False
+    gcpolicy.collect()
+    return gc.mem_free() < retain_reserve
+
+
+def _unimport(names):
+    for mod in names:
+        if mod not in sys.modules:
+            continue
+        # remove reference from sys.modules, together with the submodules
+        # retained in other groups, they would not be reachable anymore, but
+        # not the kept ones
+        prefix = mod + "."
+        subs = [m for m in sys.modules if m.startswith(prefix) and m not in _kept]
+        for sub in subs:
+            del sys.modules[sub]
+        del sys.modules[mod]
+        # remove reference from the parent module
+        i = mod.rfind(".")
+        if i < 0:
+            continue
+        path = mod[:i]
+        name = mod[i + 1 :]
+        if path in sys.modules:
+            delattr(sys.modules[path], name)
+
+
+if __debug__:
+    boot_times = []  # (stage, microseconds since the first stage)
+    _boot_started = 0
+
+    def boot_stage(stage):
+        """
+        Record and log the time `stage` of the boot was reached at, relative to
+        the first recorded stage.  See main.py for the stages.
+        """
+        global _boot_started
+        from trezor import log
+
+        now = utime.ticks_us()
+        if not boot_times:
+            _boot_started = now
+        elapsed = utime.ticks_diff(now, _boot_started)
+        boot_times.append((stage, elapsed))
+        log.info(__name__, "boot: %s after %d us", stage, elapsed)
 
 
 def ensure(cond, msg=None):
@@ -1,16 +1,31 @@
 import protobuf
-from trezor import log, loop, messages, utils, workflow
-from trezor.wire import codec_v1
+import utime
+from trezor import gcpolicy, log, loop, messages, utils, workflow
+from trezor.wire import codec_v1, codec_v2
 from trezor.wire.errors import *
 
 workflow_handlers = {}
 
+if __debug__:
+    from trezor import importprof
+
+    import_times = {}  # module path -> microseconds of its first import
+
 
 def add(mtype, pkgname, modname, *args):
     """Shortcut for registering a dynamically-imported Protobuf workflow."""
     register(mtype, protobuf_workflow, import_workflow, pkgname, modname, *args)
 
 
+def add_manifest(workflows):
+    """
+    Register dynamically-imported Protobuf workflows of a manifest, a dict of
+    wire type -> (package name, module name).  See `apps.manifest`.
+    """
+    for mtype, (pkgname, modname) in workflows.items():
+        add(mtype, pkgname, modname)
+
+
 def register(mtype, handler, *args):
     """Register `handler` to get scheduled after `mtype` message is received."""
     if isinstance(mtype, type) and issubclass(mtype, protobuf.MessageType):
@@ -21,14 +36,21 @@ def register(mtype, handler, *args):
 
 
 def setup(iface):
-    """Initialize the wire stack on passed USB interface."""
-    loop.schedule(session_handler(iface, codec_v1.SESSION_ID))
+    """
+    Initialize the wire stack on passed USB interface.  The legacy codec is
+    served in session 0, sessions of the multiplexed codec are opened on
+    request of the host and served concurrently.
+    """
+    session_supervisor = codec_v2.SessionSupervisor(iface, session_handler)
+    session_supervisor.open(codec_v1.SESSION_ID)
+    loop.schedule(session_supervisor.listen(), priority=loop.PRIORITY_IO)
 
 
 class Context:
-    def __init__(self, iface, sid):
+    def __init__(self, iface, sid, mailbox=None):
         self.iface = iface
         self.sid = sid
+        self.mailbox = mailbox  # see `codec_v2.Mailbox`
 
     async def call(self, msg, *types):
         """
@@ -38,11 +60,12 @@ class Context:
         await self.write(msg)
         return await self.read(types)
 
-    async def read(self, types):
+    async def read(self, types, sinks=None):
         """
         Wait for incoming message on this wire context and return it.  Raises
         `UnexpectedMessageError` if the message type does not match one of
-        `types`; and caller should always make sure to re-raise it.
+        `types`; and caller should always make sure to re-raise it.  Streamed
+        fields are loaded into `sinks`, see `protobuf.load_message()`.
         """
         reader = self.getreader()
 
@@ -60,7 +83,7 @@ class Context:
 
         # look up the protobuf class and parse the message
         pbtype = messages.get_type(reader.type)
-        return await protobuf.load_message(reader, pbtype)
+        return await protobuf.load_message(reader, pbtype, sinks)
 
     async def write(self, msg):
         """
@@ -73,13 +96,16 @@ class Context:
                 __name__, "%s:%x write: %s", self.iface.iface_num(), self.sid, msg
             )
 
-        # get the message size
-        counter = protobuf.CountingWriter()
-        await protobuf.dump_message(counter, msg)
+        # get the message size, and the sizes of the embedded messages
+        sizes = []
+        size = protobuf.count_message(msg, sizes)
 
-        # write the message
-        writer.setheader(msg.MESSAGE_WIRE_TYPE, counter.size)
-        await protobuf.dump_message(writer, msg)
+        # encode the message in one go, then write it, so that we only have
+        # to wait when a report gets flushed
+        buffer = bytearray(size)
+        protobuf.encode_message(buffer, msg, sizes)
+        writer.setheader(msg.MESSAGE_WIRE_TYPE, size)
+        await writer.awrite(buffer)
         await writer.aclose()
 
     def wait(self, *tasks):
@@ -91,10 +117,20 @@ class Context:
         return loop.spawn(self.read(()), *tasks)
 
     def getreader(self):
-        return codec_v1.Reader(self.iface)
+        if self.sid == codec_v1.SESSION_ID:
+            reader = codec_v1.Reader(self.iface)
+        else:
+            reader = codec_v2.Reader(self.iface, self.sid)
+        if self.mailbox is not None:
+            # reports are read by the session supervisor
+            reader.read = self.mailbox
+        return reader
 
     def getwriter(self):
-        return codec_v1.Writer(self.iface)
+        if self.sid == codec_v1.SESSION_ID:
+            return codec_v1.Writer(self.iface)
+        else:
+            return codec_v2.Writer(self.iface, self.sid)
 
 
 class UnexpectedMessageError(Exception):
@@ -103,9 +139,9 @@ class UnexpectedMessageError(Exception):
         self.reader = reader
 
 
-async def session_handler(iface, sid):
+async def session_handler(iface, sid, mailbox=None):
     reader = None
-    ctx = Context(iface, sid)
+    ctx = Context(iface, sid, mailbox)
     while True:
         try:
             # wait for new message, if needed, and find handler
@@ -117,14 +153,27 @@ async def session_handler(iface, sid):
             except KeyError:
                 handler, args = unexpected_msg, ()
 
-            m = utils.unimport_begin()
+            if __debug__ and importprof.enabled:
+                importprof.begin(
+                    messages.type_to_name.get(reader.type, "unknown"), sid
+                )
+            # modules imported by workflows of other sessions are unimported
+            # once none of them runs
+            utils.unimport_begin_shared(reader.type)
+            # memory hungry workflows start with a collected heap
+            gcpolicy.prepare(reader.type)
             w = handler(ctx, reader, *args)
+            if __debug__ and loop.profiling:
+                loop.profile_names[w] = messages.type_to_name.get(reader.type)
             try:
                 workflow.onstart(w)
                 await w
             finally:
                 workflow.onclose(w)
-                utils.unimport_end(m)
+                # keep the modules of the workflow for its next run
+                utils.unimport_end_shared()
+                if __debug__ and importprof.enabled:
+                    importprof.end(sid)
 
         except UnexpectedMessageError as exc:
             # retry with opened reader from the exception
@@ -167,7 +216,20 @@ async def protobuf_workflow(ctx, reader, handler, *args):
 
 def import_workflow(ctx, req, pkgname, modname, *args):
     modpath = "%s.%s" % (pkgname, modname)
+    if __debug__:
+        started = utime.ticks_us()
     module = __import__(modpath, None, None, (modname,), 0)
+    if __debug__:
+        elapsed = utime.ticks_diff(utime.ticks_us(), started)
+        if modpath not in import_times:
+            import_times[modpath] = elapsed
+        log.debug(
+            __name__,
+            "import %s: %d us, saved %d us",
+            modpath,
+            elapsed,
+            max(import_times[modpath] - elapsed, 0),
+        )
     handler = getattr(module, modname)
     return handler(ctx, req, *args)
 
@@ -10,6 +10,7 @@ _REP_MAGIC = const(35)  # org('#')
 _REP_INIT = ">BBBHL"  # marker, magic, magic, wire type, data length
 _REP_INIT_DATA = const(9)  # offset of data in the initial report
 _REP_CONT_DATA = const(1)  # offset of data in the continuation report
+_UVARINT_MAX_LEN = const(10)  # bytes of the longest 64-bit varint
 
 SESSION_ID = const(0)
 
@@ -17,15 +18,20 @@ SESSION_ID = const(0)
 class Reader:
     """
     Decoder for legacy codec over the HID layer.  Provides readable
-    async-file-like interface.
+    async-file-like interface.  Received reports are not sliced, the data are
+    copied straight out of them into the buffers passed to `areadinto`.  The
+    reports themselves are still allocated by `io.poll_batch`, one bytes object
+    each, as the loop and the session mailboxes keep reports after handing
+    them out, which a shared report buffer would not allow.
     """
 
     def __init__(self, iface):
         self.iface = iface
         self.type = None
         self.size = None
-        self.data = None
-        self.ofs = 0
+        self.data = None  # current report
+        self.ofs = 0  # offset of the next unread byte in the current report
+        self.read = loop.wait(iface.iface_num() | io.POLL_READ)
 
     def __repr__(self):
         return "<ReaderV1: type=%d size=%dB>" % (self.type, self.size)
@@ -36,10 +42,9 @@ class Reader:
         on this session.  `self.type` and `self.size` are initialized and
         available after `aopen()` returns.
         """
-        read = loop.wait(self.iface.iface_num() | io.POLL_READ)
         while True:
             # wait for initial report
-            report = await read
+            report = await self.read
             marker = report[0]
             if marker == _REP_MARKER:
                 _, m1, m2, mtype, msize = ustruct.unpack(_REP_INIT, report)
@@ -50,8 +55,8 @@ class Reader:
         # load received message header
         self.type = mtype
         self.size = msize
-        self.data = report[_REP_INIT_DATA : _REP_INIT_DATA + msize]
-        self.ofs = 0
+        self.data = report
+        self.ofs = _REP_INIT_DATA
 
     async def areadinto(self, buf):
         """
@@ -62,21 +67,21 @@ class Reader:
         if self.size < len(buf):
             raise EOFError
 
-        read = loop.wait(self.iface.iface_num() | io.POLL_READ)
         nread = 0
         while nread < len(buf):
-            if self.ofs == len(self.data):
+            if self.ofs >= len(self.data):
                 # we are at the end of received data
                 # wait for continuation report
                 while True:
-                    report = await read
+                    report = await self.read
                     marker = report[0]
                     if marker == _REP_MARKER:
                         break
-                self.data = report[_REP_CONT_DATA : _REP_CONT_DATA + self.size]
-                self.ofs = 0
+                self.data = report
+                self.ofs = _REP_CONT_DATA
 
-            # copy as much as possible to target buffer
+            # copy as much as possible to target buffer, the size check above
+            # makes sure we never copy the padding of the last report
             nbytes = utils.memcpy(buf, nread, self.data, self.ofs, len(buf))
             nread += nbytes
             self.ofs += nbytes
@@ -84,6 +89,35 @@ class Reader:
 
         return nread
 
+    def read_uvarint(self, limit=_UVARINT_MAX_LEN):
+        """
+        Decode a protobuf varint of at most `limit` bytes from the current
+        report, without waiting.  Returns None and consumes nothing if the
+        varint continues in the next report, or is not encoded in the shortest
+        form.  Raises `EOFError` at the end of the message.
+        """
+        if self.size < 1:
+            raise EOFError
+
+        data = self.data
+        start = self.ofs
+        end = min(len(data), start + self.size, start + limit)
+        ofs = start
+        result = 0
+        shift = 0
+        while ofs < end:
+            byte = data[ofs]
+            ofs += 1
+            result += (byte & 0x7F) << shift
+            if not byte & 0x80:
+                if byte == 0 and shift:
+                    return None  # let protobuf decode it the slow way
+                self.ofs = ofs
+                self.size -= ofs - start
+                return result
+            shift += 7
+        return None
+
 
 class Writer:
     """
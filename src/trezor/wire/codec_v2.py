@@ -0,0 +1,303 @@
+import ustruct
+from micropython import const
+
+from trezor import io, loop, utils
+from trezor.wire import codec_v1
+
+_REP_LEN = const(64)
+
+_REP_MARKER_INIT = const(0x01)
+_REP_MARKER_CONT = const(0x02)
+_REP_MARKER_OPEN = const(0x03)
+_REP_MARKER_CLOSE = const(0x04)
+
+_REP = ">BL"  # marker, session id
+_REP_INIT = ">BLLL"  # marker, session id, wire type, data length
+_REP_CONT = ">BLL"  # marker, session id, sequence
+_REP_INIT_DATA = const(13)  # offset of data in the initial report
+_REP_CONT_DATA = const(9)  # offset of data in the continuation report
+
+_MAX_SESSIONS = const(4)  # sessions open at the same time, legacy one included
+
+_MAILBOX_IFACE = const(0xFE)  # interface number that io.poll never reports ready
+_MAILBOX_SIZE = const(16)  # reports kept for a session that is not reading
+
+
+class Reader(codec_v1.Reader):
+    """
+    Decoder for session-multiplexed codec over the HID layer.  Provides
+    readable async-file-like interface.  Reports of other sessions and of the
+    legacy codec are ignored.
+    """
+
+    def __init__(self, iface, sid):
+        super().__init__(iface)
+        self.sid = sid
+        self.seq = 0
+
+    def __repr__(self):
+        return "<ReaderV2: sid=%x type=%d size=%dB>" % (self.sid, self.type, self.size)
+
+    async def aopen(self):
+        """
+        Begin the message transmission by waiting for initial V2 message report
+        on this session.  `self.type` and `self.size` are initialized and
+        available after `aopen()` returns.
+        """
+        while True:
+            # wait for initial report
+            report = await self.read
+            marker, sid, mtype, msize = ustruct.unpack(_REP_INIT, report)
+            if sid == self.sid and marker == _REP_MARKER_INIT:
+                break
+
+        # load received message header
+        self.type = mtype
+        self.size = msize
+        self.data = report
+        self.ofs = _REP_INIT_DATA
+        self.seq = 0
+
+    async def areadinto(self, buf):
+        """
+        Read exactly `len(buf)` bytes into `buf`, waiting for additional
+        reports, if needed.  Raises `EOFError` if end-of-message is encountered
+        before the full read can be completed.  Raises `ValueError` if a
+        continuation report of this session arrives out of sequence.
+        """
+        if self.size < len(buf):
+            raise EOFError
+
+        nread = 0
+        while nread < len(buf):
+            if self.ofs >= len(self.data):
+                # we are at the end of received data
+                # wait for continuation report
+                while True:
+                    report = await self.read
+                    marker, sid, seq = ustruct.unpack(_REP_CONT, report)
+                    if sid == self.sid and marker == _REP_MARKER_CONT:
+                        break
+                if seq != self.seq:
+                    raise ValueError("Message interrupted")
+                self.seq += 1
+                self.data = report
+                self.ofs = _REP_CONT_DATA
+
+            # copy as much as possible to target buffer, the size check above
+            # makes sure we never copy the padding of the last report
+            nbytes = utils.memcpy(buf, nread, self.data, self.ofs, len(buf))
+            nread += nbytes
+            self.ofs += nbytes
+            self.size -= nbytes
+
+        return nread
+
+
+class Writer:
+    """
+    Encoder for session-multiplexed codec over the HID layer.  Provides
+    writable async-file-like interface.
+    """
+
+    def __init__(self, iface, sid):
+        self.iface = iface
+        self.sid = sid
+        self.type = None
+        self.size = None
+        self.data = bytearray(_REP_LEN)
+        self.ofs = 0
+        self.seq = 0
+
+    def __repr__(self):
+        return "<WriterV2: sid=%x type=%d size=%dB>" % (self.sid, self.type, self.size)
+
+    def setheader(self, mtype, msize):
+        """
+        Reset the writer state and load the message header with passed type and
+        total message size.
+        """
+        self.type = mtype
+        self.size = msize
+        ustruct.pack_into(
+            _REP_INIT, self.data, 0, _REP_MARKER_INIT, self.sid, mtype, msize
+        )
+        self.ofs = _REP_INIT_DATA
+        self.seq = 0
+
+    async def awrite(self, buf):
+        """
+        Encode and write every byte from `buf`.  Does not need to be called in
+        case message has zero length.  Raises `EOFError` if the length of `buf`
+        exceeds the remaining message length.
+        """
+        if self.size < len(buf):
+            raise EOFError
+
+        write = loop.wait(self.iface.iface_num() | io.POLL_WRITE)
+        nwritten = 0
+        while nwritten < len(buf):
+            # copy as much as possible to report buffer
+            nbytes = utils.memcpy(self.data, self.ofs, buf, nwritten, len(buf))
+            nwritten += nbytes
+            self.ofs += nbytes
+            self.size -= nbytes
+
+            if self.ofs == _REP_LEN:
+                # we are at the end of the report, flush it, and prepare header
+                # of the next continuation report
+                while True:
+                    await write
+                    n = self.iface.write(self.data)
+                    if n == len(self.data):
+                        break
+                ustruct.pack_into(
+                    _REP_CONT, self.data, 0, _REP_MARKER_CONT, self.sid, self.seq
+                )
+                self.seq += 1
+                self.ofs = _REP_CONT_DATA
+
+        return nwritten
+
+    async def aclose(self):
+        """Flush and close the message transmission."""
+        if self.ofs != _REP_CONT_DATA:
+            # we didn't write anything or last write() wasn't report-aligned,
+            # pad the final report and flush it
+            while self.ofs < _REP_LEN:
+                self.data[self.ofs] = 0x00
+                self.ofs += 1
+
+            write = loop.wait(self.iface.iface_num() | io.POLL_WRITE)
+            while True:
+                await write
+                n = self.iface.write(self.data)
+                if n == len(self.data):
+                    break
+
+
+class Mailbox(loop.Syscall):
+    """
+    Reports received for one session.  The supervisor puts them in, readers of
+    the session take them out by awaiting the mailbox instead of the USB
+    interface.  Reports that arrive while no reader is waiting are kept, up to
+    `_MAILBOX_SIZE` of them.  Readers are only woken up by new reports, each
+    report stays in the mailbox until a reader runs and takes it, so a reader
+    closed before it runs does not lose any.  Once a report is taken out of a
+    full mailbox, tasks waiting on `self.iface | io.POLL_WRITE` are resumed.
+
+    Waiting readers are paused on a virtual interface made of the interface
+    number of the USB interface and of `slot`, which is unique among the
+    mailboxes of the interface open at the same time.
+    """
+
+    def __init__(self, iface_num, slot):
+        self.iface = _MAILBOX_IFACE | (iface_num << 16) | (slot << 24)
+        self.slot = slot
+        self.reports = []
+
+    def __iter__(self):
+        # another reader woken up by the same report can take it first
+        while not self.reports:
+            yield self
+        report = self.reports.pop(0)
+        if len(self.reports) == _MAILBOX_SIZE - 1:
+            loop.post(self.iface | io.POLL_WRITE, None)
+        return report
+
+    def handle(self, task):
+        loop.pause(task, self.iface)
+
+    def put(self, report):
+        """Pass `report` to the session, returns False if the mailbox is full."""
+        if len(self.reports) >= _MAILBOX_SIZE:
+            return False
+        self.reports.append(report)
+        loop.post(self.iface, None)
+        return True
+
+
+class SessionSupervisor:
+    """
+    Opens and closes sessions of the multiplexed codec on request of the
+    host.  Every open session is served by its own task, so a session that is
+    waiting for the user does not block the others.  The supervisor is the
+    only reader of the interface, it passes the reports to the mailboxes of
+    the sessions, so a session that is busy does not miss any.  If the mailbox
+    of a session fills up, the supervisor stops reading until the session
+    takes a report, so the host can not send more; hosts should not send a
+    session more reports than its mailbox keeps while it waits for the user.
+    """
+
+    def __init__(self, iface, handler):
+        self.iface = iface
+        self.handler = handler  # called with iface, session id and mailbox
+        self.handling_tasks = {}  # session id -> task
+        self.mailboxes = {}  # session id -> mailbox
+        self.slots = list(range(_MAX_SESSIONS))  # mailbox slots not in use
+        self.last_sid = codec_v1.SESSION_ID
+        self.report = bytearray(_REP_LEN)
+
+    async def listen(self):
+        """
+        Listen for open and close requests.  After an open request, a new
+        session is started and its task is scheduled.  After a close request,
+        the task is closed and the session ends.  Both requests get a response
+        with the session id, a session that can not be opened is responded to
+        with a close report of session 0.  All other reports are put into the
+        mailbox of their session, reports of the legacy codec into the mailbox
+        of session 0.
+        """
+        read = loop.wait(self.iface.iface_num() | io.POLL_READ)
+        while True:
+            report = await read
+            marker, sid = ustruct.unpack(_REP, report)
+            if marker == _REP_MARKER_OPEN:
+                if len(self.handling_tasks) < _MAX_SESSIONS:
+                    sid = self.newsid()
+                    self.open(sid)
+                else:
+                    marker, sid = _REP_MARKER_CLOSE, codec_v1.SESSION_ID
+            elif marker == _REP_MARKER_CLOSE and sid != codec_v1.SESSION_ID:
+                self.close(sid)
+            else:
+                if marker != _REP_MARKER_INIT and marker != _REP_MARKER_CONT:
+                    sid = codec_v1.SESSION_ID
+                mailbox = self.mailboxes.get(sid, None)
+                if mailbox is not None:
+                    while not mailbox.put(report):
+                        # the session does not keep up, i.e. with the acks
+                        # the host sends ahead, stop reading until it does
+                        await loop.wait(mailbox.iface | io.POLL_WRITE)
+                continue
+            await self.writereport(marker, sid)
+
+    def newsid(self):
+        sid = self.last_sid
+        while True:
+            sid = (sid + 1) & 0xFFFFFFFF
+            if sid != codec_v1.SESSION_ID and sid not in self.handling_tasks:
+                self.last_sid = sid
+                return sid
+
+    def open(self, sid):
+        if sid not in self.handling_tasks:
+            mailbox = Mailbox(self.iface.iface_num(), self.slots.pop())
+            self.mailboxes[sid] = mailbox
+            task = self.handling_tasks[sid] = self.handler(self.iface, sid, mailbox)
+            loop.schedule(task, priority=loop.PRIORITY_IO)
+
+    def close(self, sid):
+        task = self.handling_tasks.pop(sid, None)
+        if task is not None:
+            self.slots.append(self.mailboxes.pop(sid).slot)
+            loop.close(task)
+
+    async def writereport(self, marker, sid):
+        ustruct.pack_into(_REP, self.report, 0, marker, sid)
+        write = loop.wait(self.iface.iface_num() | io.POLL_WRITE)
+        while True:
+            await write
+            n = self.iface.write(self.report)
+            if n == len(self.report):
+                break
@@ -8,10 +8,14 @@ default_layout = None
 
 def onstart(w):
     workflows.append(w)
+    if __debug__ and loop.profiling:
+        loop.profile_open(w)
 
 
 def onclose(w):
     workflows.remove(w)
+    if __debug__ and loop.profiling:
+        loop.profile_close(w)
     if not layouts and default_layout:
         startdefault(default_layout)
 
@@ -0,0 +1,43 @@
+import gc
+import utime
+
+__all__ = [
+    'run_benchmarks',
+    'measure',
+    'report',
+    'report_latency',
+]
+
+
+# Running
+
+
+def run_benchmarks(mod_name='__main__'):
+    module = __import__(mod_name)
+    for name in dir(module):
+        if name.startswith('bench_'):
+            gc.collect()
+            getattr(module, name)()
+
+
+def measure(func, *args):
+    """Call `func` with `args`, return the elapsed time in microseconds."""
+    start = utime.ticks_us()
+    func(*args)
+    return utime.ticks_diff(utime.ticks_us(), start)
+
+
+# Reporting
+
+
+def report(name, count, elapsed_us, unit='ops'):
+    rate = count * 1000000 // max(elapsed_us, 1)
+    print('%-36s %8d %s %10d us %10d %s/s' % (name, count, unit, elapsed_us, rate, unit))
+
+
+def report_latency(name, samples_us):
+    """Report the median, 99th percentile and worst of latency samples."""
+    samples = sorted(samples_us)
+    p50 = samples[len(samples) * 50 // 100]
+    p99 = samples[len(samples) * 99 // 100]
+    print('%-36s %8d rtts p50 %8d us p99 %8d us max %8d us' % (name, len(samples), p50, p99, samples[-1]))
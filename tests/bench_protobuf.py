@@ -0,0 +1,96 @@
+from common import *
+from bench import *
+
+from micropython import const
+
+import protobuf
+from trezor import messages
+from trezor.messages import MessageType
+
+_ROUNDS = const(50)
+_LARGEST = const(8)  # number of the largest messages to benchmark
+_REPEATED = const(3)  # items put in repeated fields
+_DEPTH = const(4)  # nesting depth of embedded messages
+
+
+class NullWriter:
+
+    async def awrite(self, buf):
+        return len(buf)
+
+
+def run_sync(task):
+    try:
+        task.send(None)
+    except StopIteration as e:
+        return e.value
+    raise RuntimeError('task is not synchronous')
+
+
+def sample(ftype, depth):
+    if ftype == protobuf.TYPE_UVARINT:
+        return 0xFFFFFFFF
+    elif ftype == protobuf.TYPE_SVARINT:
+        return -0x7FFFFFFF
+    elif ftype == protobuf.TYPE_BOOL:
+        return True
+    elif ftype == protobuf.TYPE_BYTES:
+        return bytes(64)
+    elif ftype == protobuf.TYPE_UNICODE:
+        return 'x' * 32
+    elif depth < _DEPTH:
+        return fill(protobuf.embedded_type(ftype)(), depth + 1)
+    else:
+        return None
+
+
+def fill(msg, depth=0):
+    """Set every field of `msg` to a sample value."""
+    for field in msg.FIELDS:
+        if field is None:
+            continue
+        fname, ftype, fflags = field
+        value = sample(ftype, depth)
+        if value is not None and fflags & protobuf.FLAG_REPEATED:
+            value = [value] + [sample(ftype, depth) for _ in range(_REPEATED - 1)]
+        setattr(msg, fname, value)
+    return msg
+
+
+def largest_messages():
+    sized = []
+    for name in dir(MessageType):
+        wire_type = getattr(MessageType, name)
+        if not isinstance(wire_type, int):
+            continue
+        msg = fill(messages.get_type(wire_type)())
+        sized.append((protobuf.count_message(msg), name, wire_type))
+    sized.sort(key=lambda item: item[0], reverse=True)
+    return [
+        (size, name, fill(messages.get_type(wire_type)()))
+        for size, name, wire_type in sized[:_LARGEST]
+    ]
+
+
+def run_dump(msg, rounds):
+    writer = NullWriter()
+    for _ in range(rounds):
+        run_sync(protobuf.dump_message(writer, msg))
+
+
+def run_encode(msg, rounds):
+    for _ in range(rounds):
+        sizes = []
+        buffer = bytearray(protobuf.count_message(msg, sizes))
+        protobuf.encode_message(buffer, msg, sizes)
+
+
+def bench_encode():
+    for size, name, msg in largest_messages():
+        count = _ROUNDS * size
+        report('dump %s' % name, count, measure(run_dump, msg, _ROUNDS), 'bytes')
+        report('encode %s' % name, count, measure(run_encode, msg, _ROUNDS), 'bytes')
+
+
+if __name__ == '__main__':
+    run_benchmarks()
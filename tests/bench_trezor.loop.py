@@ -0,0 +1,119 @@
+from common import *
+from bench import *
+
+from micropython import const
+
+from trezor import io, loop, ui
+from trezor.ui.loader import Loader
+
+# interface number that never becomes ready
+_IDLE_IFACE = const(0x7E)
+
+_ROUNDS = const(2000)
+_WIDTH = const(8)
+
+_ANIMATION_US = const(2000000)
+_HOST_DELAY_US = const(5000)
+
+
+async def sleeper():
+    await loop.sleep(1000 * 1000)
+
+
+async def waiter():
+    await loop.wait(_IDLE_IFACE | io.POLL_READ)
+
+
+async def finisher():
+    pass
+
+
+async def churn(rounds, width, child):
+    for _ in range(rounds):
+        children = [child() for _ in range(width)]
+        await loop.spawn(finisher(), *children)
+
+
+def run_churn(child):
+    loop.schedule(churn(_ROUNDS, _WIDTH, child))
+    loop.run()
+
+
+def close_scheduled(count):
+    for _ in range(count):
+        task = sleeper()
+        loop.schedule(task)
+        loop.close(task)
+
+
+def close_paused(count):
+    for _ in range(count):
+        task = waiter()
+        loop.pause(task, _IDLE_IFACE | io.POLL_READ)
+        loop.close(task)
+
+
+async def backlight_fade():
+    while True:
+        await ui.backlight_slide(ui.BACKLIGHT_DIM)
+        await ui.backlight_slide(ui.BACKLIGHT_NORMAL)
+
+
+async def host(signal):
+    # emulates a host sending a message every few milliseconds
+    while True:
+        await loop.sleep(_HOST_DELAY_US)
+        signal.send(None)
+
+
+async def session(signal):
+    while True:
+        await signal
+
+
+async def animate():
+    loader = Loader()
+    loader.start()
+    signal = loop.signal()
+    await loop.spawn(
+        loop.sleep(_ANIMATION_US), loader, backlight_fade(), host(signal), session(signal)
+    )
+
+
+def run_animate(grid_us):
+    loop.timer_grid_us = grid_us
+    loop.schedule(animate())
+    loop.run()
+
+
+def bench_close_scheduled():
+    count = _ROUNDS * _WIDTH
+    report('close scheduled tasks', count, measure(close_scheduled, count))
+
+
+def bench_close_paused():
+    count = _ROUNDS * _WIDTH
+    report('close paused tasks', count, measure(close_paused, count))
+
+
+def bench_spawn_sleepers():
+    count = _ROUNDS * (_WIDTH + 1)
+    report('spawn and cancel sleeping tasks', count, measure(run_churn, sleeper))
+
+
+def bench_spawn_waiters():
+    count = _ROUNDS * (_WIDTH + 1)
+    report('spawn and cancel waiting tasks', count, measure(run_churn, waiter))
+
+
+def bench_timer_wakeups():
+    grid_us = loop.timer_grid_us
+    for name, g in (('wakeups, timers not coalesced', 0), ('wakeups, timers coalesced', grid_us)):
+        wakeups = loop.timer_wakeups
+        elapsed = measure(run_animate, g)
+        report(name, loop.timer_wakeups - wakeups, elapsed, 'wakeups')
+    loop.timer_grid_us = grid_us
+
+
+if __name__ == '__main__':
+    run_benchmarks()
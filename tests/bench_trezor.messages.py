@@ -0,0 +1,39 @@
+from common import *
+from bench import *
+
+from micropython import const
+
+from trezor import messages, utils
+from trezor.messages import MessageType
+
+_ROUNDS = const(200)
+
+_HOT_TYPES = (
+    ('TxAck', MessageType.TxAck),
+    ('EthereumTxAck', MessageType.EthereumTxAck),
+    ('ButtonAck', MessageType.ButtonAck),
+)
+
+
+def run_get_type(wire_type, rounds):
+    for _ in range(rounds):
+        messages.get_type(wire_type)
+
+
+def run_get_type_per_workflow(wire_type, rounds):
+    for _ in range(rounds):
+        m = utils.unimport_begin()
+        messages.get_type(wire_type)
+        utils.unimport_end(m)
+
+
+def bench_get_type():
+    for name, wire_type in _HOT_TYPES:
+        elapsed = measure(run_get_type, wire_type, _ROUNDS)
+        report('get_type %s' % name, _ROUNDS, elapsed, 'msgs')
+        elapsed = measure(run_get_type_per_workflow, wire_type, _ROUNDS)
+        report('get_type %s per workflow' % name, _ROUNDS, elapsed, 'msgs')
+
+
+if __name__ == '__main__':
+    run_benchmarks()
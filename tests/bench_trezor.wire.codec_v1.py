@@ -0,0 +1,129 @@
+from common import *
+from bench import *
+
+import ustruct
+from micropython import const
+
+import protobuf
+from trezor.messages.EthereumTxAck import EthereumTxAck
+from trezor.messages.TransactionType import TransactionType
+from trezor.messages.TxAck import TxAck
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputBinType import TxOutputBinType
+from trezor.utils import chunks
+from trezor.wire import codec_v1
+
+_ROUNDS = const(200)
+
+_IFACE_NUM = const(0x7E)
+
+
+class MockHID:
+
+    def __init__(self, num):
+        self.num = num
+
+    def iface_num(self):
+        return self.num
+
+
+class BufferWriter:
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    async def awrite(self, buf):
+        self.buffer.extend(buf)
+        return len(buf)
+
+
+def run_sync(task):
+    try:
+        task.send(None)
+    except StopIteration as e:
+        return e.value
+    raise RuntimeError('task is not synchronous')
+
+
+def large_tx_ack():
+    inputs = [
+        TxInputType(
+            prev_hash=bytes(32),
+            prev_index=i,
+            script_sig=bytes(range(107)),
+            sequence=0xFFFFFFFF,
+        )
+        for i in range(8)
+    ]
+    bin_outputs = [
+        TxOutputBinType(amount=1000000 * i, script_pubkey=bytes(range(25)))
+        for i in range(8)
+    ]
+    tx = TransactionType(
+        version=1, inputs=inputs, bin_outputs=bin_outputs, extra_data=bytes(1024)
+    )
+    return TxAck(tx=tx)
+
+
+def large_ethereum_tx_ack():
+    return EthereumTxAck(data_chunk=bytes(range(256)) * 4)
+
+
+def make_reports(msg):
+    writer = BufferWriter()
+    run_sync(protobuf.dump_message(writer, msg))
+    data = writer.buffer
+    header = bytearray(b'?##') + ustruct.pack('>HL', msg.MESSAGE_WIRE_TYPE, len(data))
+    first = 64 - len(header)
+    reports = [bytes(header + data[:first])]
+    for chunk in chunks(data[first:], 63):
+        reports.append(bytes(b'?' + chunk))
+    reports[-1] += bytes(64 - len(reports[-1]))
+    return reports
+
+
+def feed(task, reports):
+    """Step `task` with `reports`, return the number of reports consumed."""
+    task.send(None)
+    for i, report in enumerate(reports):
+        try:
+            task.send(report)
+        except StopIteration:
+            return i + 1
+    raise RuntimeError('task needs more reports')
+
+
+async def read_raw(reader):
+    await reader.aopen()
+    await reader.areadinto(bytearray(reader.size))
+
+
+async def read_message(reader, msg_type):
+    await reader.aopen()
+    await protobuf.load_message(reader, msg_type)
+
+
+def run_read_raw(reports, rounds):
+    iface = MockHID(_IFACE_NUM)
+    for _ in range(rounds):
+        feed(read_raw(codec_v1.Reader(iface)), reports)
+
+
+def run_read_message(reports, msg_type, rounds):
+    iface = MockHID(_IFACE_NUM)
+    for _ in range(rounds):
+        feed(read_message(codec_v1.Reader(iface), msg_type), reports)
+
+
+def bench_reader():
+    for name, msg in (('TxAck', large_tx_ack()), ('EthereumTxAck', large_ethereum_tx_ack())):
+        reports = make_reports(msg)
+        count = _ROUNDS * len(reports)
+        elapsed = measure(run_read_raw, reports, _ROUNDS)
+        report('read %s reports' % name, count, elapsed, 'reports')
+        elapsed = measure(run_read_message, reports, msg.__class__, _ROUNDS)
+        report('decode %s reports' % name, count, elapsed, 'reports')
+
+
+if __name__ == '__main__':
+    run_benchmarks()
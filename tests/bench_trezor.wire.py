@@ -0,0 +1,278 @@
+from common import *
+from bench import *
+
+import ustruct
+import utime
+from micropython import const
+
+import protobuf
+from trezor import config, io, loop, messages, wire
+from trezor.crypto import bip39
+from trezor.messages import ButtonRequestType, MessageType, OutputScriptType
+from trezor.messages.Address import Address
+from trezor.messages.ButtonAck import ButtonAck
+from trezor.messages.ButtonRequest import ButtonRequest
+from trezor.messages.GetAddress import GetAddress
+from trezor.messages.Ping import Ping
+from trezor.messages.RequestType import TXFINISHED, TXINPUT, TXMETA, TXOUTPUT
+from trezor.messages.SignTx import SignTx
+from trezor.messages.Success import Success
+from trezor.messages.TransactionType import TransactionType
+from trezor.messages.TxAck import TxAck
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputBinType import TxOutputBinType
+from trezor.messages.TxOutputType import TxOutputType
+from trezor.pin import pin_to_int
+from trezor.utils import chunks
+
+import apps.homescreen
+import apps.wallet
+from apps.common import cache, confirm, storage
+
+_IFACE_NUM = const(0x7E)
+_REP_LEN = const(64)
+_REP_INIT = '>BBBHL'  # marker, magic, magic, wire type, data length
+_MSG_HEADER = '>BBHL'  # magic, magic, wire type, data length
+_MAX_DELAY = const(1000000)  # poll timeout of the loop with no task scheduled
+
+_PINGS = const(500)
+_ADDRESSES = const(50)
+_SIGNINGS = const(5)
+
+_MNEMONIC = ' '.join(['all'] * 12)
+
+# tx d5f65ee80147b4bcc70b75e4bbf2d7382021b871bd8867ef8fa525ef50864882, spent
+# by the signed transaction, see test_apps.wallet.signtx
+_PREV_HASH = unhexlify('d5f65ee80147b4bcc70b75e4bbf2d7382021b871bd8867ef8fa525ef50864882')
+_PREV_META = TransactionType(version=1, lock_time=0, inputs_cnt=2, outputs_cnt=1, extra_data_len=0)
+_PREV_INPUTS = [
+    TxInputType(script_sig=unhexlify('483045022072ba61305fe7cb542d142b8f3299a7b10f9ea61f6ffaab5dca8142601869d53c0221009a8027ed79eb3b9bc13577ac2853269323434558528c6b6a7e542be46e7e9a820141047a2d177c0f3626fc68c53610b0270fa6156181f46586c679ba6a88b34c6f4874686390b4d92e5769fbb89c8050b984f4ec0b257a0e5c4ff8bd3b035a51709503'),
+                prev_hash=unhexlify('c16a03f1cf8f99f6b5297ab614586cacec784c2d259af245909dedb0e39eddcf'),
+                prev_index=1),
+    TxInputType(script_sig=unhexlify('48304502200fd63adc8f6cb34359dc6cca9e5458d7ea50376cbd0a74514880735e6d1b8a4c0221008b6ead7fe5fbdab7319d6dfede3a0bc8e2a7c5b5a9301636d1de4aa31a3ee9b101410486ad608470d796236b003635718dfc07c0cac0cfc3bfc3079e4f491b0426f0676e6643a39198e8e7bdaffb94f4b49ea21baa107ec2e237368872836073668214'),
+                prev_hash=unhexlify('1ae39a2f8d59670c8fc61179148a8e61e039d0d9e8ab08610cb69b4a19453eaf'),
+                prev_index=1),
+]
+_PREV_OUTPUT = TxOutputBinType(script_pubkey=unhexlify('76a91424a56db43cf6f2b02e838ea493f95d8d6047423188ac'), amount=390000)
+
+_INPUT = TxInputType(address_n=[0], prev_hash=_PREV_HASH, prev_index=0)
+_OUTPUT = TxOutputType(address='1MJ2tj2ThBE62zXbBYA5ZaN3fdve5CPAz1',
+                       amount=390000 - 10000,
+                       script_type=OutputScriptType.PAYTOADDRESS)
+
+
+class Finished(Exception):
+    pass
+
+
+class Stalled(Exception):
+    pass
+
+
+class BufferReader:
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.ofs = 0
+
+    async def areadinto(self, buf):
+        if self.ofs + len(buf) > len(self.buffer):
+            raise EOFError
+        buf[:] = self.buffer[self.ofs:self.ofs + len(buf)]
+        self.ofs += len(buf)
+        return len(buf)
+
+
+def run_sync(task):
+    try:
+        task.send(None)
+    except StopIteration as e:
+        return e.value
+    raise RuntimeError('task is not synchronous')
+
+
+class LoopbackUSB:
+    """
+    In-process stand-in for `io.WebUSB`, and for the host on the other end of
+    it.  While a conversation runs, it also replaces `io` in `trezor.loop`, so
+    the real scheduler drives the wire stack, and `poll_batch` plays the host
+    part of the script.  Timers fire without waiting, so the measurements
+    include only the time the device spends computing.
+    """
+
+    def __init__(self, num):
+        self.num = num
+        self.script = None  # generator, yields requests and gets responses
+        self.inbox = []  # reports on the way to the device
+        self.response = None  # data of the response being received
+        self.response_type = None
+        self.response_size = 0
+        self.sent_us = 0
+        self.reset()
+
+    def reset(self):
+        self.latencies = []  # round trip times, in microseconds
+        self.nmessages = 0  # messages sent and received
+        self.nbytes = 0  # message data sent and received
+
+    def iface_num(self):
+        return self.num
+
+    def write(self, report):
+        if self.response is None:
+            _, _, _, self.response_type, self.response_size = ustruct.unpack(_REP_INIT, report)
+            self.response = bytearray(report[9:])
+        else:
+            self.response.extend(report[1:])
+        if len(self.response) >= self.response_size:
+            self.latencies.append(utime.ticks_diff(utime.ticks_us(), self.sent_us))
+        return len(report)
+
+    def poll_batch(self, paused, entries, timeout):
+        count = 0
+        write = self.num | io.POLL_WRITE
+        read = self.num | io.POLL_READ
+        if write in paused:
+            entries[0] = write
+            entries[1] = None
+            count += 1
+        if read in paused:
+            if not self.inbox and self.response is not None and len(self.response) >= self.response_size:
+                self.receive()
+            # all queued reports, as io.poll_batch drains the USB interfaces
+            while self.inbox and count < len(entries) // 2:
+                entries[count * 2] = read
+                entries[count * 2 + 1] = self.inbox.pop(0)
+                count += 1
+        if not count and timeout >= _MAX_DELAY:
+            raise Stalled  # no scheduled task, and the device is not reading
+        return count
+
+    def send(self, msg):
+        data = bytearray(protobuf.count_message(msg))
+        protobuf.encode_message(data, msg)
+        self.nmessages += 1
+        self.nbytes += len(data)
+        data = ustruct.pack(_MSG_HEADER, 35, 35, msg.MESSAGE_WIRE_TYPE, len(data)) + data
+        for chunk in chunks(data, _REP_LEN - 1):
+            report = bytearray(b'?' + chunk)
+            report.extend(bytes(_REP_LEN - len(report)))
+            self.inbox.append(report)
+        self.sent_us = utime.ticks_us()
+
+    def receive(self):
+        data = self.response[:self.response_size]
+        msg_type = messages.get_type(self.response_type)
+        msg = run_sync(protobuf.load_message(BufferReader(data), msg_type))
+        self.nmessages += 1
+        self.nbytes += len(data)
+        self.response = None
+        if msg_type is ButtonRequest:
+            # the user confirms right away, see `confirm_at_once`
+            self.send(ButtonAck())
+            return
+        try:
+            self.send(self.script.send(msg))
+        except StopIteration:
+            raise Finished
+
+    def converse(self, script):
+        """Run the conversation of `script` against the wire stack."""
+        self.script = script
+        self.send(next(script))
+        loop.io = self
+        try:
+            loop.run()
+        except Finished:
+            pass
+        finally:
+            loop.io = io
+
+
+async def confirm_at_once(ctx, content, code=None, *args, **kwargs):
+    """Ask the host for the button press as usual, but skip the dialog."""
+    if code is None:
+        code = ButtonRequestType.Other
+    await ctx.call(ButtonRequest(code=code), MessageType.ButtonAck)
+    return True
+
+
+_usb = None
+
+
+def loopback():
+    global _usb
+    if _usb is None:
+        config.init()
+        config.wipe()
+        config.unlock(pin_to_int(''), None)
+        storage.load_mnemonic(_MNEMONIC, False)
+        cache.set_passphrase('')
+        cache.set_seed(bip39.seed(_MNEMONIC, ''))
+        confirm.confirm = confirm_at_once
+        confirm.hold_to_confirm = confirm_at_once
+        apps.homescreen.boot()
+        apps.wallet.boot()
+        _usb = LoopbackUSB(_IFACE_NUM)
+        wire.setup(_usb)
+    _usb.reset()
+    return _usb
+
+
+def ping_script(count):
+    for _ in range(count):
+        resp = yield Ping(message='ping')
+        assert isinstance(resp, Success)
+
+
+def get_address_script(count):
+    for i in range(count):
+        resp = yield GetAddress(address_n=[44 | 0x80000000, 0x80000000, 0x80000000, 0, i], coin_name='Bitcoin')
+        assert isinstance(resp, Address)
+
+
+def prev_tx(req):
+    index = req.details.request_index
+    if req.request_type == TXMETA:
+        return _PREV_META
+    elif req.request_type == TXINPUT:
+        return TransactionType(inputs=[_PREV_INPUTS[index]])
+    elif req.request_type == TXOUTPUT:
+        return TransactionType(bin_outputs=[_PREV_OUTPUT])
+
+
+def sign_tx_script(count):
+    for _ in range(count):
+        resp = yield SignTx(coin_name='Bitcoin', inputs_count=1, outputs_count=1)
+        while resp.request_type != TXFINISHED:
+            if resp.details.tx_hash is not None:
+                tx = prev_tx(resp)
+            elif resp.request_type == TXINPUT:
+                tx = TransactionType(inputs=[_INPUT])
+            else:
+                tx = TransactionType(outputs=[_OUTPUT])
+            resp = yield TxAck(tx=tx)
+
+
+def run_script(name, script):
+    usb = loopback()
+    elapsed = measure(usb.converse, script)
+    report('%s messages' % name, usb.nmessages, elapsed, 'msgs')
+    report('%s data' % name, usb.nbytes, elapsed, 'bytes')
+    report_latency('%s latency' % name, usb.latencies)
+
+
+def bench_ping():
+    run_script('Ping', ping_script(_PINGS))
+
+
+def bench_get_address():
+    run_script('GetAddress', get_address_script(_ADDRESSES))
+
+
+def bench_sign_tx():
+    run_script('SignTx', sign_tx_script(_SIGNINGS))
+
+
+if __name__ == '__main__':
+    run_benchmarks()
@@ -0,0 +1,39 @@
+#!/bin/bash
+
+MICROPYTHON=../build/unix/micropython
+PYOPT=1
+
+if [ ! -x "$MICROPYTHON" ]; then
+    echo "$MICROPYTHON not found, build the unix port first: make build_unix"
+    exit 1
+fi
+
+results=()
+error=0
+
+if [ -z "$*" ]; then
+    list="bench_*.py"
+else
+    list="$*"
+fi
+
+for i in $list; do
+    echo
+    if $MICROPYTHON -O$PYOPT $i; then
+        results+=("OK   $i")
+    else
+        results+=("FAIL $i")
+        error=1
+    fi
+done
+
+echo
+echo 'Summary:'
+printf '%s\n' "${results[@]}"
+echo '-------------------'
+if [ $error == 0 ]; then
+    echo 'ALL OK'
+else
+    echo 'FAIL at least one error occurred'
+fi
+exit $error
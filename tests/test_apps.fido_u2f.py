@@ -0,0 +1,35 @@
+from common import *
+
+from trezor import config
+from trezor.pin import pin_to_int
+
+from apps.common import HARDENED, cache, seed, storage
+from apps.fido_u2f import _U2F_KEY_PATH, derive_node
+
+
+class TestFidoU2f(unittest.TestCase):
+
+    def setUp(self):
+        config.init()
+        config.wipe()
+        config.unlock(pin_to_int(''), None)
+        storage.load_mnemonic('all all all all all all all all all all all all', False)
+
+    def tearDown(self):
+        storage.wipe()
+
+    def test_derive_node(self):
+        keypath = [HARDENED | i for i in range(8)]
+        expected = seed.derive_node_without_passphrase([_U2F_KEY_PATH] + keypath, 'nist256p1')
+        self.assertEqual(derive_node(keypath).private_key(), expected.private_key())
+        # the second derivation starts from the cached root node
+        self.assertTrue(cache.get_u2f_root() is not None)
+        self.assertEqual(derive_node(keypath).private_key(), expected.private_key())
+
+        cache.clear()
+        self.assertEqual(cache.get_u2f_root(), None)
+        self.assertEqual(cache.get_seed_without_passphrase(), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+from common import *
+
+from trezor import wire
+
+import apps.cardano
+import apps.ethereum
+import apps.lisk
+import apps.management
+import apps.nem
+import apps.ripple
+import apps.stellar
+import apps.tezos
+import apps.wallet
+from apps.manifest import workflows
+
+
+class TestManifest(unittest.TestCase):
+
+    def test_manifest(self):
+        # the generated manifest registers the same workflows as booting the apps
+        handlers = wire.workflow_handlers
+        try:
+            wire.workflow_handlers = {}
+            for app in (apps.cardano, apps.ethereum, apps.lisk, apps.management, apps.nem,
+                        apps.ripple, apps.stellar, apps.tezos, apps.wallet):
+                app.boot()
+            booted = wire.workflow_handlers
+
+            wire.workflow_handlers = {}
+            wire.add_manifest(workflows)
+            self.assertEqual(wire.workflow_handlers, booted)
+        finally:
+            wire.workflow_handlers = handlers
+
+
+if __name__ == '__main__':
+    unittest.main()
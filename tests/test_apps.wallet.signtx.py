@@ -104,6 +104,52 @@ class TestSignTx(unittest.TestCase):
         with self.assertRaises(StopIteration):
             signer.send(None)
 
+    def test_one_one_prefetch(self):
+        # same transaction as in test_one_one_fee, the host sends acks ahead
+        prev_hash = unhexlify('d5f65ee80147b4bcc70b75e4bbf2d7382021b871bd8867ef8fa525ef50864882')
+        ptx1 = TransactionType(version=1, lock_time=0, inputs_cnt=2, outputs_cnt=1, extra_data_len=0)
+        pinp1 = TxInputType(script_sig=unhexlify('483045022072ba61305fe7cb542d142b8f3299a7b10f9ea61f6ffaab5dca8142601869d53c0221009a8027ed79eb3b9bc13577ac2853269323434558528c6b6a7e542be46e7e9a820141047a2d177c0f3626fc68c53610b0270fa6156181f46586c679ba6a88b34c6f4874686390b4d92e5769fbb89c8050b984f4ec0b257a0e5c4ff8bd3b035a51709503'),
+                            prev_hash=unhexlify('c16a03f1cf8f99f6b5297ab614586cacec784c2d259af245909dedb0e39eddcf'),
+                            prev_index=1)
+        pinp2 = TxInputType(script_sig=unhexlify('48304502200fd63adc8f6cb34359dc6cca9e5458d7ea50376cbd0a74514880735e6d1b8a4c0221008b6ead7fe5fbdab7319d6dfede3a0bc8e2a7c5b5a9301636d1de4aa31a3ee9b101410486ad608470d796236b003635718dfc07c0cac0cfc3bfc3079e4f491b0426f0676e6643a39198e8e7bdaffb94f4b49ea21baa107ec2e237368872836073668214'),
+                            prev_hash=unhexlify('1ae39a2f8d59670c8fc61179148a8e61e039d0d9e8ab08610cb69b4a19453eaf'),
+                            prev_index=1)
+        pout1 = TxOutputBinType(script_pubkey=unhexlify('76a91424a56db43cf6f2b02e838ea493f95d8d6047423188ac'),
+                                amount=390000)
+        inp1 = TxInputType(address_n=[0], prev_hash=prev_hash, prev_index=0)
+        out1 = TxOutputType(address='1MJ2tj2ThBE62zXbBYA5ZaN3fdve5CPAz1',
+                            amount=390000 - 10000,
+                            script_type=OutputScriptType.PAYTOADDRESS,
+                            address_n=[])
+
+        seed = bip39.seed('alcohol woman abuse must during monitor noble actual mixed trade anger aisle', '')
+        root = bip32.from_seed(seed, 'secp256k1')
+
+        for max_prefetch, expected in ((None, []), (8, [(TXINPUT, 0, prev_hash, 1)])):
+            tx = SignTx(inputs_count=1, outputs_count=1, max_prefetch=max_prefetch)
+            signer = signing.sign_tx(tx, root)
+            prefetched = []
+            res = None
+            while True:
+                req = signer.send(res)
+                if not isinstance(req, TxRequest):
+                    res = True  # confirmation dialogs
+                    continue
+                if req.request_type == TXFINISHED:
+                    break
+                details = req.details
+                if details.prefetch_count is not None:
+                    prefetched.append((req.request_type, details.request_index, details.tx_hash, details.prefetch_count))
+                if req.request_type == TXMETA:
+                    res = TxAck(tx=ptx1)
+                elif details.tx_hash is None:
+                    res = TxAck(tx=TransactionType(inputs=[inp1], outputs=[out1]))
+                elif req.request_type == TXINPUT:
+                    res = TxAck(tx=TransactionType(inputs=[(pinp1, pinp2)[details.request_index]]))
+                else:
+                    res = TxAck(tx=TransactionType(bin_outputs=[pout1]))
+            self.assertEqual(prefetched, expected)
+
     def assertEqualEx(self, a, b):
         # hack to avoid adding __eq__ to signing.Ui* classes
         if ((isinstance(a, signing.UiConfirmOutput) and isinstance(b, signing.UiConfirmOutput)) or
@@ -0,0 +1,152 @@
+from common import *
+
+import protobuf
+from trezor.messages.EthereumTxAck import EthereumTxAck
+from trezor.messages.SignTx import SignTx
+from trezor.messages.TransactionType import TransactionType
+from trezor.messages.TxAck import TxAck
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputBinType import TxOutputBinType
+from trezor.messages.TxRequest import TxRequest
+from trezor.messages.TxRequestDetailsType import TxRequestDetailsType
+
+
+class BufferWriter:
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    async def awrite(self, buf):
+        self.buffer.extend(buf)
+        return len(buf)
+
+
+class BufferReader:
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.ofs = 0
+
+    async def areadinto(self, buf):
+        if self.ofs + len(buf) > len(self.buffer):
+            raise EOFError
+        buf[:] = self.buffer[self.ofs:self.ofs + len(buf)]
+        self.ofs += len(buf)
+        return len(buf)
+
+
+def run_sync(task):
+    try:
+        task.send(None)
+    except StopIteration as e:
+        return e.value
+    raise RuntimeError('task is not synchronous')
+
+
+def tx_ack():
+    inputs = [
+        TxInputType(address_n=[44 | 0x80000000, 0, i], prev_hash=bytes(32), prev_index=i, script_sig=bytes(200))
+        for i in range(3)
+    ]
+    bin_outputs = [
+        TxOutputBinType(amount=1 << (8 * i), script_pubkey=bytes(25))
+        for i in range(3)
+    ]
+    tx = TransactionType(version=2, inputs=inputs, bin_outputs=bin_outputs, extra_data=bytes(1024))
+    return TxAck(tx=tx)
+
+
+class TestProtobuf(unittest.TestCase):
+
+    def test_count_uvarint(self):
+        for n in (0, 1, 0x7F, 0x80, 0x3FFF, 0x4000, 0xFFFFFFFF, 1 << 64):
+            writer = BufferWriter()
+            run_sync(protobuf.dump_uvarint(writer, n))
+            self.assertEqual(protobuf.count_uvarint(n), len(writer.buffer))
+
+    def test_count_message(self):
+        msg = tx_ack()
+        counter = protobuf.CountingWriter()
+        run_sync(protobuf.dump_message(counter, msg))
+        sizes = []
+        self.assertEqual(protobuf.count_message(msg, sizes), counter.size)
+        self.assertEqual(protobuf.count_message(msg), counter.size)
+        # transaction, 3 inputs and 3 outputs
+        self.assertEqual(len(sizes), 7)
+
+    def test_dump_message(self):
+        msg = tx_ack()
+        sizes = []
+        protobuf.count_message(msg, sizes)
+        writer = BufferWriter()
+        run_sync(protobuf.dump_message(writer, msg, sizes))
+        writer2 = BufferWriter()
+        run_sync(protobuf.dump_message(writer2, msg))
+        self.assertEqual(writer.buffer, writer2.buffer)
+        loaded = run_sync(protobuf.load_message(BufferReader(writer.buffer), TxAck))
+        self.assertEqual(loaded.tx.version, 2)
+        self.assertEqual(len(loaded.tx.inputs), 3)
+        self.assertEqual(loaded.tx.inputs[2].address_n, [44 | 0x80000000, 0, 2])
+        self.assertEqual(loaded.tx.bin_outputs[2].amount, 1 << 16)
+        self.assertEqual(loaded.tx.extra_data, bytes(1024))
+
+    def test_load_embedded_by_name(self):
+        # embedded messages are named in the schema and resolved when loaded
+        self.assertEqual(TxAck.FIELDS[1][1], 'TransactionType')
+        self.assertEqual(TransactionType.FIELDS[2][1], 'TxInputType')
+        buffer = bytearray(protobuf.count_message(tx_ack()))
+        protobuf.encode_message(buffer, tx_ack())
+        loaded = run_sync(protobuf.load_message(BufferReader(buffer), TxAck))
+        self.assertTrue(isinstance(loaded.tx, TransactionType))
+        self.assertTrue(isinstance(loaded.tx.inputs[0], TxInputType))
+
+    def test_extension_fields(self):
+        # prefetching, see apps.wallet.sign_tx
+        for msg in (SignTx(inputs_count=300, outputs_count=2, max_prefetch=8),
+                    TxRequest(details=TxRequestDetailsType(request_index=1, prefetch_count=7))):
+            buffer = bytearray(protobuf.count_message(msg))
+            protobuf.encode_message(buffer, msg)
+            loaded = run_sync(protobuf.load_message(BufferReader(buffer), msg.__class__))
+            if isinstance(msg, SignTx):
+                self.assertEqual(loaded.max_prefetch, 8)
+            else:
+                self.assertEqual(loaded.details.prefetch_count, 7)
+
+    def test_load_unknown_fields(self):
+        msg = tx_ack()
+        buffer = bytearray(protobuf.count_message(msg))
+        protobuf.encode_message(buffer, msg)
+        # varint field and bytes field with tags beyond the schema
+        buffer.extend(b'\xa0\x06\x01\xaa\x06\x03abc')
+        loaded = run_sync(protobuf.load_message(BufferReader(buffer), TxAck))
+        self.assertEqual(len(loaded.tx.inputs), 3)
+        self.assertEqual(loaded.tx.inputs[0].multisig, None)
+        self.assertEqual(loaded.tx.outputs, [])
+
+    def test_load_streamed(self):
+        data = bytes(range(256)) * 4 + b'tail'
+        buffer = bytearray(protobuf.count_message(EthereumTxAck(data_chunk=data)))
+        protobuf.encode_message(buffer, EthereumTxAck(data_chunk=data))
+
+        chunks = []
+        sink = lambda chunk: chunks.append(bytes(chunk))  # noqa: E731
+        loaded = run_sync(protobuf.load_message(BufferReader(buffer), EthereumTxAck, {'data_chunk': sink}))
+        self.assertEqual(loaded.data_chunk, len(data))
+        self.assertEqual(b''.join(chunks), data)
+        self.assertTrue(max(len(c) for c in chunks) < len(data))
+
+        # without a sink, the field is loaded as usual
+        loaded = run_sync(protobuf.load_message(BufferReader(buffer), EthereumTxAck))
+        self.assertEqual(loaded.data_chunk, data)
+
+    def test_encode_message(self):
+        msg = tx_ack()
+        writer = BufferWriter()
+        run_sync(protobuf.dump_message(writer, msg))
+        buffer = bytearray(protobuf.count_message(msg))
+        self.assertEqual(protobuf.encode_message(buffer, msg), len(buffer))
+        self.assertEqual(buffer, writer.buffer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+from common import *
+
+from trezor import gcpolicy
+from trezor.messages import MessageType
+
+
+class TestGCPolicy(unittest.TestCase):
+
+    def test_collect(self):
+        gcpolicy.reset()
+        gcpolicy.collect()
+        gcpolicy.collect()
+        self.assertEqual(gcpolicy.collections, 2)
+        self.assertTrue(gcpolicy.max_pause_us <= gcpolicy.pause_us)
+        self.assertTrue(0 <= gcpolicy.fragmentation <= 1000)
+
+    def test_reset(self):
+        gcpolicy.collect()
+        gcpolicy.fragmentation = 500  # a fragmented heap at the last collection
+        gcpolicy.reset()
+        self.assertEqual(gcpolicy.collections, 0)
+        self.assertEqual(gcpolicy.pause_us, 0)
+        self.assertEqual(gcpolicy.max_pause_us, 0)
+        self.assertEqual(gcpolicy.fragmentation, 0)
+
+    def test_maybe_collect(self):
+        threshold = gcpolicy.threshold
+        try:
+            gcpolicy.threshold = 1024
+            gcpolicy.collect()
+            gcpolicy.reset()
+            gcpolicy.maybe_collect()
+            self.assertEqual(gcpolicy.collections, 0)
+            garbage = [bytearray(256) for _ in range(8)]  # noqa: F841
+            gcpolicy.maybe_collect()
+            self.assertEqual(gcpolicy.collections, 1)
+        finally:
+            gcpolicy.threshold = threshold
+
+    def test_prepare(self):
+        gcpolicy.reset()
+        gcpolicy.prepare(MessageType.Ping)
+        self.assertEqual(gcpolicy.collections, 0)
+        gcpolicy.prepare(MessageType.SignTx)
+        self.assertEqual(gcpolicy.collections, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+from common import *
+
+from trezor import importprof, utils
+
+
+def imported():
+    # modules the records were made for, without their import chains
+    return [key.split(';')[-1] for key in importprof.records]
+
+
+class TestImportProf(unittest.TestCase):
+
+    def setUp(self):
+        # the unix port of the tests cannot override __import__, call the hook
+        # with the builtin one instead
+        self.saved = importprof._import
+        importprof._import = __import__
+        importprof.reset()
+
+    def tearDown(self):
+        importprof._import = self.saved
+        importprof.reset()
+
+    def test_hook(self):
+        mods = utils.unimport_begin()
+        module = importprof._hook('trezor.messages.Ping', None, None, ('Ping',), 0)
+        utils.unimport_end(mods)
+        self.assertEqual(module.__name__, 'trezor.messages.Ping')
+        self.assertEqual(imported(), ['trezor.messages.Ping'])
+        record = importprof.records.popitem()[1]
+        self.assertEqual(record[0], 1)
+
+        # imports of loaded modules are not recorded
+        importprof._hook('trezor.utils', None, None, ('ensure',), 0)
+        self.assertEqual(importprof.records, {})
+
+    def test_hook_relative(self):
+        # from .Ping import Ping, in a module of trezor.messages
+        mods = utils.unimport_begin()
+        globals = {'__name__': 'trezor.messages.Address'}
+        module = importprof._hook('Ping', globals, None, ('Ping',), 1)
+        utils.unimport_end(mods)
+        self.assertEqual(module.__name__, 'trezor.messages.Ping')
+        self.assertEqual(imported(), ['trezor.messages.Ping'])
+        importprof.reset()
+
+        # from ..messages.Ping import Ping, in the trezor.wire package
+        mods = utils.unimport_begin()
+        globals = {'__name__': 'trezor.wire', '__path__': 'trezor/wire'}
+        module = importprof._hook('messages.Ping', globals, None, ('Ping',), 2)
+        utils.unimport_end(mods)
+        self.assertEqual(module.__name__, 'trezor.messages.Ping')
+        self.assertEqual(imported(), ['trezor.messages.Ping'])
+
+
+if __name__ == '__main__':
+    unittest.main()
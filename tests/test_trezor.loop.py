@@ -0,0 +1,286 @@
+from common import *
+
+import utime
+from trezor import io, loop, workflow
+
+
+async def append(log, value):
+    log.append(value)
+
+
+async def producer(ch, values):
+    for value in values:
+        await ch.put(value)
+
+
+async def consumer(ch, log, count):
+    for _ in range(count):
+        log.append(await ch.take())
+
+
+async def sleeper(log, delay):
+    deadline = await loop.sleep(delay)
+    log.append((delay, deadline))
+
+
+def spinner(log, count):
+    for i in range(count):
+        log.append(i)
+        yield  # schedule again right away
+
+
+async def waiter():
+    await loop.wait(0x7E | io.POLL_READ)
+
+
+async def reader(log, count):
+    for _ in range(count):
+        log.append(await loop.wait(0x7E | io.POLL_READ))
+
+
+class TestLoop(unittest.TestCase):
+
+    def test_close_paused(self):
+        iface = 0x7E | io.POLL_READ
+        task = waiter()
+        loop.pause(task, iface)
+        self.assertIn(iface, loop._paused)
+        loop.close(task)
+        self.assertTrue(iface not in loop._paused)
+        self.assertTrue(task not in loop._parked)
+
+    def test_read_ahead(self):
+        iface = 0x7E | io.POLL_READ
+        loop._reports[iface] = [b'a', b'b', b'c']
+        log = []
+        loop.schedule(reader(log, 3))
+        loop.run()
+        self.assertEqual(log, [b'a', b'b', b'c'])
+        self.assertTrue(iface not in loop._reports)
+        self.assertTrue(iface not in loop._paused)
+
+    def test_close_scheduled(self):
+        log = []
+        tasks = [append(log, i) for i in range(3)]
+        for task in tasks:
+            loop.schedule(task)
+        loop.close(tasks[1])
+        loop.run()
+        self.assertEqual(log, [0, 2])
+
+    def test_queue_grows(self):
+        size = loop.queue_size
+        log = []
+        for i in range(size + 1):
+            loop.schedule(append(log, i))
+        self.assertEqual(loop.queue_size, size * 2)
+        self.assertTrue(loop.queue_high_water > size)
+        loop.run()
+        self.assertEqual(log, list(range(size + 1)))
+
+    def test_queue_backlog(self):
+        budget = loop.queue_budget
+        blocked = loop.queue_blocked
+        loop.queue_budget = loop.queue_size * 16
+        try:
+            size = loop.queue_size
+            log = []
+            for i in range(size + 4):
+                loop.schedule(append(log, i))
+            self.assertEqual(loop.queue_size, size)
+            self.assertEqual(loop.queue_blocked - blocked, 4)
+            loop.run()
+            self.assertEqual(log, list(range(size + 4)))
+            self.assertEqual(loop._backlog, [])
+        finally:
+            loop.queue_budget = budget
+
+    def test_queue_backlog_full(self):
+        budget, limit = loop.queue_budget, loop.backlog_limit
+        loop.queue_budget = loop.queue_size * 16
+        loop.backlog_limit = 4
+        try:
+            size = loop.queue_size
+            log = []
+            for i in range(size + 4):
+                loop.schedule(append(log, i))
+            task = append(log, 'full')
+            with self.assertRaises(IndexError):
+                loop.schedule(task)
+            task.close()
+            loop.run()
+            self.assertEqual(log, list(range(size + 4)))
+        finally:
+            loop.queue_budget, loop.backlog_limit = budget, limit
+
+    def test_queue_compaction(self):
+        budget = loop.queue_budget
+        loop.queue_budget = loop.queue_size * 16
+        try:
+            size = loop.queue_size
+            log = []
+            tasks = [append(log, i) for i in range(size)]
+            for task in tasks:
+                loop.schedule(task)
+            # a single closed task is not worth rebuilding the full queue for
+            loop.close(tasks[0])
+            blocked = loop.queue_blocked
+            loop.schedule(append(log, 'a'))
+            self.assertEqual(loop.queue_blocked - blocked, 1)
+            # a quarter of the entries is, they are dropped to make room
+            for task in tasks[1:size // 4]:
+                loop.close(task)
+            loop.schedule(append(log, 'b'))
+            self.assertEqual(loop.queue_blocked - blocked, 1)
+            self.assertEqual(loop._backlog, [])
+            loop.run()
+            self.assertEqual(len(log), size - size // 4 + 2)
+        finally:
+            loop.queue_budget = budget
+
+    def test_priority(self):
+        log = []
+        for i in range(3):
+            loop.schedule(append(log, i))
+        task = append(log, 'io')
+        loop.schedule(task, priority=loop.PRIORITY_IO)
+        loop.run()
+        self.assertEqual(log, ['io', 0, 1, 2])
+        # finished tasks are forgotten
+        self.assertTrue(task not in loop._io_tasks)
+
+    def test_priority_queue_grows(self):
+        log = []
+        for i in range(20):
+            loop.schedule(append(log, i), priority=loop.PRIORITY_IO)
+        loop.run()
+        self.assertEqual(sorted(log), list(range(20)))
+
+    def test_priority_overdue(self):
+        log = []
+        overdue = utime.ticks_add(utime.ticks_us(), -10 * 1000 * 1000)
+        loop.schedule(append(log, 'late'), deadline=overdue)
+        loop.schedule(append(log, 'io'), priority=loop.PRIORITY_IO)
+        loop.run()
+        self.assertEqual(log, ['io', 'late'])
+
+    def test_priority_backlog(self):
+        budget = loop.queue_budget
+        loop.queue_budget = loop.queue_size * 16
+        try:
+            log = []
+            for i in range(loop.queue_size):
+                loop.schedule(append(log, i))
+            blocked = loop.queue_blocked
+            loop.schedule(append(log, 'io'), priority=loop.PRIORITY_IO)
+            self.assertEqual(loop.queue_blocked, blocked)
+            loop.run()
+            self.assertEqual(log[0], 'io')
+        finally:
+            loop.queue_budget = budget
+
+    @unittest.skipUnless(__debug__, 'the profiler is only in debug builds')
+    def test_profile(self):
+        loop.profile_reset()
+        loop.profile_enable(True)
+        try:
+            log = []
+            for i in range(3):
+                loop.schedule(append(log, i))
+            loop.run()
+        finally:
+            loop.profile_enable(False)
+        # tasks of the same coroutine are summed up under its name
+        self.assertEqual(len(loop.profile_stats), 1)
+        name, stats = loop.profile_stats.popitem()
+        self.assertEqual(stats[loop.PROF_NAME], name)
+        self.assertEqual(stats[loop.PROF_STEPS], 3)
+        self.assertEqual(loop.profile_names, {})
+
+    @unittest.skipUnless(__debug__, 'the profiler is only in debug builds')
+    def test_profile_disabled(self):
+        # a workflow still running when the profiling is turned off is not
+        # accounted, and leaves nothing behind
+        loop.profile_reset()
+        w = append([], 0)
+        loop.profile_enable(True)
+        workflow.onstart(w)
+        loop.profile_enable(False)
+        workflow.onclose(w)
+        w.close()
+        self.assertEqual(loop.profile_workflows, {})
+        self.assertEqual(loop._profile_open, {})
+
+    def test_chan_rendezvous(self):
+        ch = loop.chan()
+        log = []
+        self.assertFalse(ch.try_put(0))
+        loop.schedule(producer(ch, range(10)))
+        loop.schedule(consumer(ch, log, 10))
+        loop.run()
+        self.assertEqual(log, list(range(10)))
+
+    def test_chan_buffered(self):
+        ch = loop.chan(capacity=3)
+        self.assertTrue(ch.try_put(0))
+        self.assertTrue(ch.try_put(1))
+        self.assertTrue(ch.try_put(2))
+        self.assertFalse(ch.try_put(3))
+        self.assertEqual(ch.try_take(), 0)
+        self.assertEqual(ch.try_take(), 1)
+        self.assertEqual(ch.try_take(), 2)
+        self.assertEqual(ch.try_take('empty'), 'empty')
+        log = []
+        loop.schedule(producer(ch, range(20)))
+        loop.schedule(consumer(ch, log, 20))
+        loop.run()
+        self.assertEqual(log, list(range(20)))
+
+    def test_chan_publish(self):
+        ch = loop.chan()
+        logs = [[], [], []]
+        for log in logs:
+            loop.schedule(consumer(ch, log, 1))
+        loop.run()
+        self.assertEqual(ch.takers.count, 3)
+        self.assertTrue(ch.publish('hello'))
+        loop.run()
+        self.assertEqual(logs, [['hello'], ['hello'], ['hello']])
+        self.assertFalse(ch.publish('again'))
+
+    def test_virtual_time(self):
+        loop.set_virtual_time(True)
+        try:
+            clock = loop.utime
+            start = clock.ticks_us()
+            log = []
+            loop.schedule(sleeper(log, 20 * 1000 * 1000))
+            loop.schedule(sleeper(log, 10 * 1000 * 1000))
+            loop.run()
+            # the shorter sleep woke up first, then the clock jumped to the
+            # deadline of the longer one
+            self.assertEqual([delay for delay, _ in log], [10 * 1000 * 1000, 20 * 1000 * 1000])
+            self.assertEqual(clock.ticks_us(), log[-1][1])
+            self.assertTrue(clock.ticks_diff(log[0][1], start) >= 10 * 1000 * 1000)
+            self.assertTrue(clock.ticks_diff(log[-1][1], start) >= 20 * 1000 * 1000)
+        finally:
+            loop.set_virtual_time(False)
+        self.assertIs(loop._virtual_clock, None)
+
+    def test_virtual_time_spinning(self):
+        loop.set_virtual_time(True)
+        try:
+            wakeups = loop.timer_wakeups
+            log = []
+            loop.schedule(spinner(log, 5))
+            loop.run()
+            # every step of the spinning task is a pass of its own, with a
+            # poll for I/O before it
+            self.assertEqual(log, [0, 1, 2, 3, 4])
+            self.assertEqual(loop.timer_wakeups - wakeups, 6)
+        finally:
+            loop.set_virtual_time(False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,6 +11,16 @@ class TestDisplay(unittest.TestCase):
     def test_refresh(self):
         display.refresh()
 
+    def test_dirty(self):
+        display.refresh()
+        self.assertFalse(display.dirty())
+        display.text_width('Test', 0)
+        self.assertFalse(display.dirty())
+        display.bar(0, 0, 10, 10, 0xFFFF)
+        self.assertTrue(display.dirty())
+        display.refresh()
+        self.assertFalse(display.dirty())
+
     def test_bar(self):
         display.bar(0, 0, 10, 10, 0xFFFF)
 
@@ -1,6 +1,9 @@
 from common import *
 
-from trezor import utils
+import sys
+
+from trezor import messages, utils
+from trezor.messages import MessageType
 
 
 class TestUtils(unittest.TestCase):
@@ -13,6 +16,48 @@ class TestUtils(unittest.TestCase):
             self.assertEqual(c[i].stop, 100 if (i == 14) else (i + 1) * 7)
             self.assertEqual(c[i].step, 1)
 
+    def test_unimport(self):
+        mods = utils.unimport_begin()
+        from trezor.messages import Ping  # noqa: F401
+        utils.unimport_end(mods)
+        self.assertFalse('trezor.messages.Ping' in sys.modules)
+
+    def test_unimport_retained(self):
+        reserve = utils.retain_reserve
+        try:
+            mods = utils.unimport_begin()
+            from trezor.messages import Ping  # noqa: F401
+            utils.unimport_end(mods, 'ping')
+            self.assertIn('trezor.messages.Ping', sys.modules)
+
+            # a run of another workflow under memory pressure evicts the group
+            utils.retain_reserve = 1 << 30
+            utils.unimport_end(utils.unimport_begin(), 'other')
+            self.assertFalse('trezor.messages.Ping' in sys.modules)
+        finally:
+            utils.retain_reserve = reserve
+
+    def test_unimport_shared(self):
+        # a workflow ending while another session runs one does not unimport
+        # the modules the other one imported
+        utils.unimport_begin_shared('ping')
+        utils.unimport_begin_shared('other')
+        from trezor.messages import Ping  # noqa: F401
+        utils.unimport_end_shared()
+        self.assertIn('trezor.messages.Ping', sys.modules)
+        utils.unimport_end_shared()
+        self.assertFalse('trezor.messages.Ping' in sys.modules)
+
+    def test_unimport_kept(self):
+        # the module of a retained message class survives the unimport, so the
+        # workflows import the same class
+        mods = utils.unimport_begin()
+        msg_type = messages.get_type(MessageType.ButtonAck)
+        utils.unimport_end(mods)
+        self.assertIn('trezor.messages.ButtonAck', sys.modules)
+        from trezor.messages.ButtonAck import ButtonAck
+        self.assertTrue(ButtonAck is msg_type)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -94,6 +94,41 @@ def test_reader():
     assert_async(reader.areadinto(onebyte_buffer), [(None, EOFError()), ])
 
 
+def test_read_uvarint():
+    interface_num = 0xdeadbeef
+    interface = MockHID(interface_num)
+    reader = codec_v1.Reader(interface)
+
+    # 0x96 0x01 = 150, 0x80 0x00 = non-canonical 0, 0xac 0x02 = 300 split over reports
+    message = bytearray(unhexlify('9601') + unhexlify('8000') + bytes(50) + unhexlify('ac02'))
+    report_header = bytearray(unhexlify('3f2323432100000038'))
+    first_report = report_header + message[:55]
+    next_report = bytearray(unhexlify('3f')) + message[55:] + bytes(62)
+    assert_async(reader.aopen(), [(None, wait(io.POLL_READ | interface_num)), (first_report, StopIteration()), ])
+
+    assert_eq(reader.read_uvarint(), 150)
+    assert_eq(reader.size, 54)
+    assert_eq(reader.read_uvarint(), None)
+    assert_eq(reader.size, 54)
+    buf = bytearray(52)
+    assert_async(reader.areadinto(buf), [(None, StopIteration()), ])
+    assert_eq(reader.read_uvarint(1), None)
+    assert_eq(reader.read_uvarint(), None)
+    assert_eq(reader.size, 2)
+
+    # varint crossing the report boundary is left to the slow path
+    buf = bytearray(1)
+    assert_async(reader.areadinto(buf), [(None, StopIteration()), ])
+    assert_async(reader.areadinto(buf), [(None, wait(io.POLL_READ | interface_num)), (next_report, StopIteration()), ])
+    assert_eq(reader.size, 0)
+    try:
+        reader.read_uvarint()
+    except EOFError:
+        pass
+    else:
+        assert False, 'EOFError not raised'
+
+
 def test_writer():
     rep_len = 64
     interface_num = 0xdeadbeef
@@ -0,0 +1,315 @@
+import sys
+
+sys.path.append('../src')
+
+from utest import *
+from ubinascii import unhexlify
+
+import ustruct
+from trezor import io, loop
+from trezor.loop import wait
+from trezor.wire import codec_v2
+
+_MARKER_INIT = 0x01
+_MARKER_CONT = 0x02
+_MARKER_OPEN = 0x03
+_MARKER_CLOSE = 0x04
+
+_TYPE_BLOCK = 0x10  # message the handler waits for the user on
+_TYPE_PING = 0x20  # message the handler echoes right away
+
+
+class MockHID:
+
+    def __init__(self, num):
+        self.num = num
+        self.data = []
+        self.busy = 0  # number of writes to refuse
+
+    def iface_num(self):
+        return self.num
+
+    def write(self, msg):
+        if self.busy:
+            self.busy -= 1
+            return 0
+        self.data.append(bytearray(msg))
+        return len(msg)
+
+
+class Loopback:
+    """
+    Stand-in for `trezor.loop`, driving the tasks of one mock interface.
+    Reports sent by the host get delivered to every task waiting to read,
+    waits for writing to the interface are resumed right away, waits for room
+    in a mailbox are paused until it is posted, and tasks waiting for
+    anything else stay blocked.
+    """
+
+    wait = loop.wait
+    PRIORITY_IO = loop.PRIORITY_IO
+
+    def __init__(self):
+        self.readers = []  # tasks waiting for a report
+        self.paused = {}  # mailbox interface -> tasks waiting on it
+        self.blocked = []  # tasks waiting for something else, i.e. the user
+
+    def schedule(self, task, value=None, deadline=None, priority=None):
+        self.step(task, value)
+
+    def pause(self, task, iface):
+        self.paused.setdefault(iface, []).append(task)
+
+    def post(self, iface, value):
+        tasks = self.paused.pop(iface, [])
+        for task in tasks:
+            self.step(task, value)
+        return bool(tasks)
+
+    def close(self, task):
+        for tasks in [self.readers, self.blocked] + list(self.paused.values()):
+            if task in tasks:
+                tasks.remove(task)
+        task.close()
+
+    def step(self, task, value):
+        while True:
+            try:
+                syscall = task.send(value)
+            except StopIteration:
+                return
+            value = None
+            if syscall is None:
+                continue
+            elif isinstance(syscall, wait) and syscall.msg_iface & 0xFF == 0xFE:
+                self.pause(task, syscall.msg_iface)  # mailbox is full
+            elif isinstance(syscall, wait) and syscall.msg_iface & io.POLL_WRITE:
+                continue
+            elif isinstance(syscall, wait):
+                self.readers.append(task)
+            elif isinstance(syscall, codec_v2.Mailbox):
+                syscall.handle(task)
+            else:
+                self.blocked.append(task)
+            return
+
+    def send(self, report):
+        readers = self.readers
+        self.readers = []
+        for task in readers:
+            self.step(task, report)
+
+
+class Deferred:
+    """
+    Stand-in for `trezor.loop` that only records the scheduled tasks, so the
+    test decides when, and if, they run.
+    """
+
+    def __init__(self):
+        self.scheduled = []  # tasks and the values they are scheduled with
+        self.paused = {}
+
+    def schedule(self, task, value=None, deadline=None, priority=None):
+        self.scheduled.append((task, value))
+
+    def pause(self, task, iface):
+        self.paused.setdefault(iface, []).append(task)
+
+    def post(self, iface, value):
+        tasks = self.paused.pop(iface, [])
+        for task in tasks:
+            self.schedule(task, value)
+        return bool(tasks)
+
+
+async def read_mailbox(mailbox, log):
+    log.append(await mailbox)
+
+
+async def echo_handler(iface, sid, mailbox):
+    while True:
+        reader = codec_v2.Reader(iface, sid)
+        reader.read = mailbox
+        await reader.aopen()
+        data = bytearray(reader.size)
+        await reader.areadinto(data)
+        if reader.type == _TYPE_BLOCK:
+            await loop.signal()  # never sent, like a user that never confirms
+        writer = codec_v2.Writer(iface, sid)
+        writer.setheader(reader.type, len(data))
+        await writer.awrite(data)
+        await writer.aclose()
+
+
+def session_report(marker, sid):
+    return ustruct.pack('>BL', marker, sid) + bytes(59)
+
+
+def message_reports(sid, mtype, data):
+    report = ustruct.pack('>BLLL', _MARKER_INIT, sid, mtype, len(data)) + data[:51]
+    reports = [report + bytes(64 - len(report))]
+    data = data[51:]
+    seq = 0
+    while data:
+        report = ustruct.pack('>BLL', _MARKER_CONT, sid, seq) + data[:55]
+        reports.append(report + bytes(64 - len(report)))
+        data = data[55:]
+        seq += 1
+    return reports
+
+
+def test_reader():
+    interface_num = 0xdeadbeef
+    interface = MockHID(interface_num)
+    reader = codec_v2.Reader(interface, 0x1234)
+    message = bytes(range(120))
+    reports = message_reports(0x1234, 0x4321, message)
+    other_reports = message_reports(0x1235, 0x4321, message)
+    legacy_report = unhexlify('3f2323432100000078') + bytes(55)
+
+    # open, reports of other sessions and of the legacy codec are skipped
+    assert_async(reader.aopen(), [
+        (None, wait(io.POLL_READ | interface_num)),
+        (legacy_report, wait(io.POLL_READ | interface_num)),
+        (other_reports[0], wait(io.POLL_READ | interface_num)),
+        (reports[0], StopIteration()),
+    ])
+    assert_eq(reader.type, 0x4321)
+    assert_eq(reader.size, len(message))
+
+    # long read over continuation reports
+    buffer = bytearray(len(message))
+    assert_async(reader.areadinto(buffer), [
+        (None, wait(io.POLL_READ | interface_num)),
+        (other_reports[1], wait(io.POLL_READ | interface_num)),
+        (reports[1], wait(io.POLL_READ | interface_num)),
+        (reports[2], StopIteration()),
+    ])
+    assert_eq(buffer, message)
+    assert_eq(reader.size, 0)
+
+    # out of sequence continuation report
+    assert_async(reader.aopen(), [(None, wait(io.POLL_READ | interface_num)), (reports[0], StopIteration()), ])
+    assert_async(reader.areadinto(buffer), [(None, wait(io.POLL_READ | interface_num)), (reports[2], ValueError()), ])
+
+
+def test_writer():
+    interface_num = 0xdeadbeef
+    interface = MockHID(interface_num)
+    writer = codec_v2.Writer(interface, 0x1234)
+    message = bytes(range(120))
+    writer.setheader(0x4321, len(message))
+    assert_async(writer.awrite(message), [
+        (None, wait(io.POLL_WRITE | interface_num)),
+        (None, wait(io.POLL_WRITE | interface_num)),
+        (None, StopIteration()),
+    ])
+    assert_async(writer.aclose(), [(None, wait(io.POLL_WRITE | interface_num)), (None, StopIteration()), ])
+    assert_eq(interface.data, message_reports(0x1234, 0x4321, message))
+
+
+def test_sessions():
+    interface = MockHID(0x7E)
+    lb = Loopback()
+    real_loop, codec_v2.loop = codec_v2.loop, lb
+    try:
+        supervisor = codec_v2.SessionSupervisor(interface, echo_handler)
+        lb.schedule(supervisor.listen())
+
+        # open two sessions, the response to the second is written again
+        lb.send(session_report(_MARKER_OPEN, 0))
+        interface.busy = 1
+        lb.send(session_report(_MARKER_OPEN, 0))
+        assert_eq(interface.data, [session_report(_MARKER_OPEN, 1), session_report(_MARKER_OPEN, 2)])
+        interface.data.clear()
+
+        # session 1 gets stuck waiting for the user
+        for report in message_reports(1, _TYPE_BLOCK, b'sign'):
+            lb.send(report)
+        assert_eq(len(lb.blocked), 1)
+        assert_eq(interface.data, [])
+
+        # session 2 is still served
+        ping = bytes(range(80))
+        for report in message_reports(2, _TYPE_PING, ping):
+            lb.send(report)
+        assert_eq(interface.data, message_reports(2, _TYPE_PING, ping))
+        interface.data.clear()
+
+        # reports that arrive while session 2 is busy are kept for it
+        mailbox = supervisor.mailboxes[2]
+        (busy,) = lb.paused.pop(mailbox.iface)
+        reports = message_reports(2, _TYPE_PING, ping)
+        for report in reports:
+            lb.send(report)
+        assert_eq(mailbox.reports, reports)
+        assert_eq(interface.data, [])
+
+        # once the mailbox is full, the supervisor stops reading
+        large = bytes(51 + 55 * 14)
+        for report in message_reports(2, _TYPE_PING, large):
+            lb.send(report)
+        assert_eq(len(mailbox.reports), 16)
+        assert_eq(lb.readers, [])
+        assert_eq(interface.data, [])
+
+        # and goes on once the session catches up, no report is lost
+        lb.step(busy, None)
+        assert_eq(interface.data, reports + message_reports(2, _TYPE_PING, large))
+        assert_eq(mailbox.reports, [])
+        assert_eq(len(lb.readers), 1)
+        interface.data.clear()
+
+        # closing session 1 kills its task
+        iface = supervisor.mailboxes[1].iface
+        lb.send(session_report(_MARKER_CLOSE, 1))
+        assert_eq(interface.data, [session_report(_MARKER_CLOSE, 1)])
+        assert_eq(lb.blocked, [])
+        assert_eq(list(supervisor.handling_tasks), [2])
+        interface.data.clear()
+
+        # the mailbox slot of session 1 is used again
+        lb.send(session_report(_MARKER_OPEN, 0))
+        assert_eq(interface.data, [session_report(_MARKER_OPEN, 3)])
+        assert_eq(supervisor.mailboxes[3].iface, iface)
+    finally:
+        codec_v2.loop = real_loop
+
+
+def test_mailbox():
+    dl = Deferred()
+    real_loop, codec_v2.loop = codec_v2.loop, dl
+    try:
+        mailbox = codec_v2.Mailbox(0x7E, 0)
+        log = []
+
+        # reports put after a reader was woken up, but before it runs, and the
+        # report it was woken up for, are kept if the reader gets closed
+        reader = read_mailbox(mailbox, log)
+        reader.send(None).handle(reader)
+        assert_eq(mailbox.put(b'first'), True)
+        assert_eq(dl.scheduled, [(reader, None)])
+        assert_eq(mailbox.put(b'second'), True)
+        reader.close()
+        assert_eq(mailbox.reports, [b'first', b'second'])
+
+        # the next reader takes them in order, without waiting
+        for report in (b'first', b'second'):
+            try:
+                read_mailbox(mailbox, log).send(None)
+            except StopIteration:
+                pass
+        assert_eq(log, [b'first', b'second'])
+        assert_eq(mailbox.reports, [])
+
+        # a full mailbox does not take more reports
+        for i in range(16):
+            assert_eq(mailbox.put(b'report'), True)
+        assert_eq(mailbox.put(b'report'), False)
+    finally:
+        codec_v2.loop = real_loop
+
+
+if __name__ == '__main__':
+    run_tests()
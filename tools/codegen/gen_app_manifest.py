@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# script used to generate /src/apps/manifest.py, the table of dynamically
+# imported workflows registered by `wire.add()` in the `boot()` functions of
+# the apps, so main.py can register them without importing the app packages
+
+import ast
+import os
+import sys
+
+
+def parse_message_types(path):
+    types = {}
+    with open(path) as f:
+        for line in f:
+            if line.startswith("#") or "=" not in line:
+                continue
+            name, value = line.split("=")
+            types[name.strip()] = int(value)
+    return types
+
+
+def is_wire_add(node):
+    return (
+        isinstance(node, ast.Expr)
+        and isinstance(node.value, ast.Call)
+        and isinstance(node.value.func, ast.Attribute)
+        and isinstance(node.value.func.value, ast.Name)
+        and node.value.func.value.id == "wire"
+        and node.value.func.attr == "add"
+    )
+
+
+def parse_boot(body, pkgname, debug=False):
+    """Yield (message type name, package, module, debug only) of `body`."""
+    for node in body:
+        if is_wire_add(node):
+            mtype, pkg, mod = node.value.args
+            if not (
+                isinstance(mtype, ast.Attribute)
+                and isinstance(pkg, ast.Name)
+                and pkg.id == "__name__"
+                and isinstance(mod, ast.Str)
+            ):
+                raise ValueError("%s: unsupported wire.add() call" % pkgname)
+            yield mtype.attr, pkgname, mod.s, debug
+        elif isinstance(node, ast.If):
+            if not (isinstance(node.test, ast.Name) and node.test.id == "__debug__"):
+                raise ValueError("%s: unsupported condition in boot()" % pkgname)
+            yield from parse_boot(node.body, pkgname, True)
+            yield from parse_boot(node.orelse, pkgname, debug)
+        elif not (isinstance(node, ast.Expr) and isinstance(node.value, ast.Str)):
+            # everything but docstrings needs the app to be booted as usual
+            raise ValueError("%s: boot() does more than wire.add()" % pkgname)
+
+
+def parse_apps(appsdir):
+    workflows = []
+    for app in sorted(os.listdir(appsdir)):
+        path = os.path.join(appsdir, app, "__init__.py")
+        if not os.path.exists(path):
+            continue
+        with open(path) as f:
+            tree = ast.parse(f.read(), path)
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef) and node.name == "boot":
+                try:
+                    workflows.extend(parse_boot(node.body, "apps." + app))
+                except ValueError as e:
+                    # apps with more complex boot() are booted by main.py
+                    print("skipping", e, file=sys.stderr)
+    return workflows
+
+
+def main():
+    appsdir, message_types, dst = sys.argv[1:4]
+    types = parse_message_types(message_types)
+    workflows = parse_apps(appsdir)
+    with open(dst, "wt") as f:
+        f.write("# Automatically generated by gen_app_manifest.py\n")
+        f.write("# fmt: off\n")
+        f.write("workflows = {  # wire type -> (package, module), see wire.add()\n")
+        for name, pkg, mod, debug in workflows:
+            if not debug:
+                f.write('    %d: ("%s", "%s"),  # %s\n' % (types[name], pkg, mod, name))
+        f.write("}\n")
+        debug_workflows = [w for w in workflows if w[3]]
+        if debug_workflows:
+            f.write("\n")
+            f.write("if __debug__:\n")
+            for name, pkg, mod, debug in debug_workflows:
+                f.write(
+                    '    workflows[%d] = ("%s", "%s")  # %s\n'
+                    % (types[name], pkg, mod, name)
+                )
+
+
+if __name__ == "__main__":
+    main()
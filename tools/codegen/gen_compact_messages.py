@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+# script used to rewrite message classes generated by pb2py into the compact
+# schema read by /src/protobuf.py: the `get_fields()` dict is replaced with a
+# static `FIELDS` tuple indexed by field tag, with scalar types given as type
+# codes and embedded messages by the name of their class, the classes of
+# embedded messages are only imported for type checking; the fields of local
+# protocol extensions are added too, see EXTENSION_FIELDS
+
+import os
+import re
+import sys
+
+TYPE_CODES = {
+    "p.UVarintType": "p.TYPE_UVARINT",
+    "p.SVarintType": "p.TYPE_SVARINT",
+    "p.BoolType": "p.TYPE_BOOL",
+    "p.BytesType": "p.TYPE_BYTES",
+    "p.UnicodeType": "p.TYPE_UNICODE",
+}
+
+# large bytes fields that load_message can stream into a sink instead of
+# allocating the whole value, see FLAG_STREAMED in /src/protobuf.py
+STREAMED_FIELDS = {
+    ("ApplySettings", "homescreen"),
+    ("CardanoTxAck", "transaction"),
+    ("EthereumSignTx", "data_initial_chunk"),
+    ("EthereumTxAck", "data_chunk"),
+    ("NEMTransfer", "payload"),
+}
+
+# fields of protocol extensions that trezor-common does not define (yet), added
+# to the generated classes as (name, type, flags, tag, annotation), with tags
+# kept clear of the ones trezor-common uses
+EXTENSION_FIELDS = {
+    # acks the host sends ahead of their requests, see apps.wallet.sign_tx
+    "SignTx": (("max_prefetch", "p.TYPE_UVARINT", "0", 20, "int"),),
+    "TxRequestDetailsType": (("prefetch_count", "p.TYPE_UVARINT", "0", 20, "int"),),
+}
+
+GET_FIELDS = re.compile(
+    r"\n    @classmethod\n    def get_fields\(cls\):\n        return \{\n(.*?)        \}\n",
+    re.DOTALL,
+)
+FIELD = re.compile(r"^ *(\d+): \('(\w+)', ([\w.]+), ([\w.]+)\),(?: *# *(.*))?$")
+EMBEDDED = re.compile(r"^(        \('\w+', )([A-Z]\w*)(, )", re.M)
+IMPORTS = re.compile(r"^((?:from \.\w+ import \w+\n)+)\n", re.M)
+TYPING = "        from typing import List\n"
+FIELDS_END = re.compile(r"^        .*# (\d+)[^\n]*\n    \)\n", re.M)
+INIT_END = "    ) -> None:\n"
+CLASS = re.compile(r"^(class \w+\(p\.MessageType\):\n(?:    MESSAGE_WIRE_TYPE = \d+\n)?)", re.M)
+
+
+def compact_fields(msg_name, entries):
+    fields = {}
+    for line in entries.splitlines():
+        tag, name, ftype, flags, comment = FIELD.match(line).groups()
+        if (msg_name, name) in STREAMED_FIELDS:
+            flags = "p.FLAG_STREAMED" if flags == "0" else flags + " | p.FLAG_STREAMED"
+        ftype = TYPE_CODES.get(ftype) or "'%s'" % ftype
+        fields[int(tag)] = (name, ftype, flags, comment)
+
+    lines = ["    FIELDS = (\n", "        None,\n"]
+    for tag in range(1, max(fields) + 1):
+        if tag not in fields:
+            lines.append("        None,  # %d\n" % tag)
+            continue
+        name, ftype, flags, comment = fields[tag]
+        comment = "%d, %s" % (tag, comment) if comment else "%d" % tag
+        lines.append("        ('%s', %s, %s),  # %s\n" % (name, ftype, flags, comment))
+    lines.append("    )\n")
+    return "".join(lines)
+
+
+def lazy_embedded(src):
+    # name embedded types in FIELDS, also in files compacted before
+    src = EMBEDDED.sub(lambda m: "%s'%s'%s" % m.groups(), src)
+    match = IMPORTS.search(src)
+    if match is None:
+        return src
+    imports = "".join("        " + line + "\n" for line in match.group(1).splitlines())
+    if TYPING in src:
+        src = src[: match.start()] + src[match.end() :]
+        return src.replace(TYPING, TYPING + imports, 1)
+    block = (
+        "if __debug__:\n"
+        "    try:\n"
+        "        import typing  # noqa: F401\n"
+        + imports
+        + "    except ImportError:\n"
+        "        pass\n\n"
+    )
+    return src[: match.start()] + block + src[match.end() :]
+
+
+def extend_fields(msg_name, src):
+    for name, ftype, flags, tag, annotation in EXTENSION_FIELDS.get(msg_name, ()):
+        if "('%s', " % name in src:
+            continue  # extended before
+        match = FIELDS_END.search(src)
+        lines = ["        None,  # %d\n" % t for t in range(int(match.group(1)) + 1, tag)]
+        lines.append("        ('%s', %s, %s),  # %d\n" % (name, ftype, flags, tag))
+        end = match.end() - len("    )\n")
+        src = src[:end] + "".join(lines) + src[end:]
+        param = "        %s: %s = None,\n" % (name, annotation)
+        src = src.replace(INIT_END, param + INIT_END, 1)
+        # __init__ is the last method of the generated classes
+        src = src.rstrip("\n") + "\n        self.%s = %s\n" % (name, name)
+    return src
+
+
+def compact_file(path):
+    with open(path) as f:
+        orig = src = f.read()
+    msg_name = os.path.basename(path)[:-3]
+    match = GET_FIELDS.search(src)
+    if match is not None:
+        fields = compact_fields(msg_name, match.group(1))
+        src = src[: match.start()] + src[match.end() :]
+        src = CLASS.sub(lambda m: m.group(1) + fields, src, count=1)
+    src = lazy_embedded(src)
+    src = extend_fields(msg_name, src)
+    if src == orig:
+        return  # no fields, or already compact
+    with open(path, "wt") as f:
+        f.write(src)
+
+
+def main():
+    for directory in sys.argv[1:]:
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".py"):
+                compact_file(os.path.join(directory, name))
+
+
+if __name__ == "__main__":
+    main()
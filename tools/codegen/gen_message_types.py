@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+# script used to generate /src/trezor/messages/wire_types.py from the
+# MessageType enum generated by pb2py
+
+import sys
+
+
+def parse_message_types(path):
+    types = []
+    with open(path) as f:
+        for line in f:
+            if line.startswith("#") or "=" not in line:
+                continue
+            name, value = line.split("=")
+            types.append((int(value), name.strip()))
+    return sorted(types)
+
+
+def main():
+    src, dst = sys.argv[1:3]
+    with open(dst, "wt") as f:
+        f.write("# Automatically generated by gen_message_types.py\n")
+        f.write("# fmt: off\n")
+        f.write("type_to_name = {  # int -> string, reverse table of wire_type mapping\n")
+        for value, name in parse_message_types(src):
+            f.write('    %d: "%s",\n' % (value, name))
+        f.write("}\n")
+
+
+if __name__ == "__main__":
+    main()